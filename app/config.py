@@ -8,6 +8,38 @@ class Settings(BaseSettings):
     # MongoDB
     mongodb_uri: str
     mongodb_db_name: str = "authentic"
+    # 연결 풀 (min_pool_size까지 lifespan에서 미리 연결)
+    mongodb_max_pool_size: int = 100
+    mongodb_min_pool_size: int = 5
+    mongodb_max_idle_time_ms: int = 300_000
+    # 풀이 가득 찼을 때 연결을 기다리는 최대 시간
+    mongodb_wait_queue_timeout_ms: int = 2_000
+    mongodb_connect_timeout_ms: int = 5_000
+    mongodb_server_selection_timeout_ms: int = 5_000
+    # 연산 전체 제한 시간 (timeoutMS, 0이면 제한 없음)
+    mongodb_timeout_ms: int = 5_000
+    # 선호 순서. 설치되지 않은 모듈의 방식은 제외 (zstd: zstandard, snappy: python-snappy)
+    mongodb_compressors: List[str] = ["zstd", "snappy"]
+    # /ready 의 MongoDB ping 제한 시간
+    readiness_timeout_seconds: float = 1.0
+    # 인덱스 적용 시점: background(기동과 병행) / blocking(적용 후 요청 수신) / skip
+    # INDEXES 지문이 마지막 적용 기록과 같으면 create_indexes 생략
+    index_reconcile: str = "background"
+    # 기동 시 lifespan 단계별 소요 시간 출력 (import 시간: python -m app.core.startup)
+    startup_profile: bool = False
+
+    # User / RefreshToken 저장소: mongodb / memory (프로세스 내, 재시작 시 유실) / sqlite (단일 파일)
+    repository_backend: str = "mongodb"
+    sqlite_path: str = "authentic.db"
+    # sqlite / mongodb bucketed 만료 refresh token 정리 주기 (mongodb single은 TTL 인덱스)
+    repository_purge_interval_seconds: float = 60.0
+    # mongodb refresh token 저장 방식: single(refresh_tokens + TTL 인덱스) / bucketed(만료 구간별 컬렉션, 지난 구간은 drop)
+    refresh_token_storage: str = "single"
+    # bucketed 구간 길이. 짧을수록 drop이 촘촘하고 조회 시 확인할 컬렉션 수가 늘어남
+    refresh_token_bucket_hours: int = 24
+    # 폐기된 refresh token 일괄 삭제 주기 (0이면 끔) / 연산당 삭제 수
+    refresh_token_compact_interval_seconds: float = 60.0
+    refresh_token_compact_batch_size: int = 1000
 
     # Google OAuth
     google_client_id: str
@@ -15,15 +47,85 @@ class Settings(BaseSettings):
     google_redirect_uri: str = "http://localhost:8000/auth/google/callback"
 
     # JWT
+    # RS256 / ES256 / EdDSA (키가 없으면 알고리즘에 맞게 자동 생성)
     jwt_algorithm: str = "RS256"
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
     jwt_private_key: Optional[str] = None
     jwt_public_key: Optional[str] = None
+    # 로테이션 전 공개키 PEM 목록 (이전 키로 발급된 토큰이 만료될 때까지 검증/JWKS에 유지)
+    jwt_retired_public_keys: List[str] = []
+    jwks_max_age_seconds: int = 300
+
+    # JWT 서명 스레드 풀 (이벤트 루프 블로킹 방지)
+    jwt_sign_workers: int = 2
+    jwt_sign_max_batch: int = 32
+    jwt_sign_max_pending: int = 1024
+
+    # 인증 이벤트 로그 (bounded queue + 백그라운드 스레드 출력)
+    log_queue_size: int = 10000
+    # 성공 이벤트 샘플링 비율 (1.0 = 전부 기록, 실패 이벤트는 항상 기록)
+    log_success_sample_rate: float = 1.0
+
+    # 감사 로그 (audit_events 컬렉션, write-behind 일괄 저장)
+    audit_enabled: bool = True
+    audit_batch_size: int = 500
+    audit_flush_interval_seconds: float = 1.0
+    audit_buffer_size: int = 10000
+    audit_retention_days: int = 90
+
+    # Prometheus /metrics (요청 지연 미들웨어 포함)
+    metrics_enabled: bool = True
+
+    # 이벤트 피드 (GET /events, SSE): ring buffer 크기, heartbeat 간격, 클라이언트 재연결 대기
+    event_feed_buffer_size: int = 1024
+    event_feed_heartbeat_seconds: float = 15.0
+    event_feed_retry_ms: int = 3000
+
+    # /auth/introspect 배치 모드 최대 토큰 수
+    introspect_max_batch: int = 100
+
+    # Access token 폐기 목록 (jti denylist, exp 구간별 Bloom filter + revoked_tokens 컬렉션)
+    revocation_enabled: bool = True
+    revocation_bucket_seconds: int = 300
+    # 구간당 예상 폐기 수 (초과하면 오탐률 증가)
+    revocation_filter_capacity: int = 10000
+    revocation_filter_error_rate: float = 0.001
+    revocation_sync_interval_seconds: float = 1.0
+
+    # client_credentials grant (POST /auth/token)
+    # client secret scrypt 비용 (2의 거듭제곱, 기존 해시는 저장 당시 값으로 검증)
+    client_secret_scrypt_n: int = 16384
+    # 검증된 (client_id, secret digest) 캐시 (slow hash 생략)
+    client_secret_cache_max_size: int = 1000
+    client_secret_cache_ttl_seconds: int = 60
+
+    # 검증된 Access token 캐시
+    token_cache_enabled: bool = True
+    token_cache_max_size: int = 10000
+    token_cache_ttl_seconds: int = 300
+
+    # 유저 read-through 캐시 (change stream은 replica set 필요)
+    user_cache_enabled: bool = True
+    user_cache_max_size: int = 10000
+    user_cache_ttl_seconds: int = 60
+    user_cache_change_stream: bool = False
+
+    # Rate limit 저장소: memory(단일 워커) / shm(단일 호스트 다중 워커) / redis(다중 호스트)
+    rate_limit_backend: str = "memory"
+    rate_limit_max_keys: int = 100_000
+    rate_limit_shm_path: str = "/dev/shm/authentic-rate-limit"
+    rate_limit_shm_slots: int = 65536
+    rate_limit_redis_url: str = "redis://localhost:6379/0"
 
     # Server
     allowed_email_domain: str = "jbnu.ac.kr"
     cors_origins: List[str] = ["http://localhost:3000"]
 
+    @property
+    def mongodb_enabled(self) -> bool:
+        """MongoDB 사용 여부 (memory / sqlite backend는 연결 / 인덱스 / 감사 로그 / 폐기 목록 저장 생략)"""
+        return self.repository_backend == "mongodb"
+
 
 settings = Settings()
@@ -0,0 +1,132 @@
+"""
+인증 이벤트 감사 로그 (audit_events 컬렉션)
+
+write-behind 버퍼: 요청 경로에서는 버퍼에 추가만 하고, batch_size개가 모이거나
+flush_interval이 지나면 insert_many(ordered=False) 1회로 저장.
+보존 기간은 created_at TTL 인덱스 (app/core/indexes.py)
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from app.config import settings
+from app.core.metrics import Counter, registry
+from app.repositories.audit import AuditEventRepository
+
+logger = logging.getLogger(__name__)
+
+AUDIT_EVENTS = registry.register(Counter(
+    "audit_events_total",
+    "Audit events by outcome (written / dropped / failed)",
+    ["result"],
+))
+
+
+class AuditSink:
+    """
+    감사 이벤트 write-behind 버퍼
+    - batch_size개가 모이면 즉시 flush, 아니면 flush_interval마다 flush (동시에 하나만 실행)
+    - DB 장애로 저장하지 못한 batch는 버퍼 앞에 되돌리고 다음 주기에 재시도
+    - 버퍼가 max_buffer를 넘으면 가장 오래된 이벤트부터 버림
+    - start() 전에는 버퍼에만 쌓임 (lifespan에서 시작 / 종료)
+    """
+
+    def __init__(self, batch_size: int = 500, flush_interval: float = 1.0, max_buffer: int = 10000):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._buffer: List[dict] = []
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self._lock = asyncio.Lock()
+        # record()가 띄운 flush (진행 중이면 새로 만들지 않음)
+        self._flush_task: Optional[asyncio.Task] = None
+        # 실패 후 다음 주기 전까지 record()에서 flush를 띄우지 않음
+        self._retry_at = 0.0
+        self._written = AUDIT_EVENTS.labels("written")
+        self._dropped = AUDIT_EVENTS.labels("dropped")
+        self._failed = AUDIT_EVENTS.labels("failed")
+
+    def _trim(self):
+        overflow = len(self._buffer) - self.max_buffer
+        if overflow > 0:
+            del self._buffer[:overflow]
+            self._dropped.inc(overflow)
+
+    def record(self, event: dict):
+        """이벤트 추가 (I/O 없음)"""
+        self._buffer.append({**event, "created_at": datetime.utcnow()})
+        self._trim()
+
+        if (
+            self._task is not None
+            and len(self._buffer) >= self.batch_size
+            and (self._flush_task is None or self._flush_task.done())
+            and time.monotonic() >= self._retry_at
+        ):
+            self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+
+    async def flush(self) -> int:
+        """버퍼의 이벤트를 batch_size개씩 저장. 저장된 수 반환"""
+        async with self._lock:
+            written = 0
+            while self._buffer:
+                batch = self._buffer[:self.batch_size]
+                del self._buffer[:self.batch_size]
+                try:
+                    written += await AuditEventRepository.insert_many(batch)
+                except BulkWriteError as e:
+                    # 문서 단위 오류: 나머지는 저장됨. 재시도로 생긴 중복(11000)은 이전 시도에서 저장된 것
+                    errors = e.details.get("writeErrors", [])
+                    duplicates = sum(1 for error in errors if error.get("code") == 11000)
+                    saved = e.details.get("nInserted", 0) + duplicates
+                    written += saved
+                    self._failed.inc(len(batch) - saved)
+                    logger.warning("Audit event flush partially failed", exc_info=True)
+                except PyMongoError:
+                    # 연결 / 타임아웃: batch를 앞에 되돌리고 이번 주기는 중단
+                    # (insert_many가 문서에 _id를 채워 두므로 재시도 시 이미 저장된 문서는 중복 키로 걸러짐)
+                    self._buffer[:0] = batch
+                    self._trim()
+                    self._retry_at = time.monotonic() + self.flush_interval
+                    logger.warning("Audit event flush failed, keeping events buffered", exc_info=True)
+                    break
+            self._written.inc(written)
+            return written
+
+    async def _run(self):
+        # flush 도중 취소되면 꺼낸 batch를 잃으므로 cancel 대신 이벤트로 종료
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """주기 flush 중단 후 남은 이벤트 저장"""
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+
+
+# 싱글톤 인스턴스
+audit_sink = AuditSink(
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_seconds,
+    max_buffer=settings.audit_buffer_size,
+)
@@ -0,0 +1,105 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.core.metrics import FunctionCounter, Gauge, registry
+
+CACHE_ENTRIES = registry.register(Gauge(
+    "cache_entries",
+    "Entries held by in-memory caches",
+    ["cache"],
+))
+CACHE_MAX_ENTRIES = registry.register(Gauge(
+    "cache_max_entries",
+    "Configured in-memory cache capacity",
+    ["cache"],
+))
+CACHE_LOOKUPS = registry.register(FunctionCounter(
+    "cache_lookups_total",
+    "In-memory cache lookups by result (hit / miss)",
+    ["cache", "result"],
+))
+CACHE_EVICTIONS = registry.register(FunctionCounter(
+    "cache_evictions_total",
+    "Entries evicted from in-memory caches by the size limit",
+    ["cache"],
+))
+
+
+class TTLCache:
+    """
+    TTL + 크기 제한 인메모리 LRU 캐시 (이벤트 루프 단일 스레드에서 사용)
+    - 엔트리 만료: 저장 시 지정한 expires_at (기본값 저장 시각 + ttl_seconds)
+    - 최대 max_size개 유지, 초과 시 가장 오래 사용하지 않은 엔트리 제거
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 300):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # {key: (expires_at, value)}
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값 반환. 없거나 만료되었으면 None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """get과 같지만 hit / miss 통계와 LRU 순서를 바꾸지 않음 (부수 경로 조회용)"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any, expires_at: Optional[float] = None):
+        """값 저장. expires_at은 ttl_seconds보다 늦어질 수 없음"""
+        max_expires_at = time.time() + self.ttl_seconds
+        if expires_at is None or expires_at > max_expires_at:
+            expires_at = max_expires_at
+
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def expose_metrics(self, name: str):
+        """stats()의 값을 /metrics에 cache="name" 라벨로 노출 (싱글톤 생성 시 1회)"""
+        CACHE_ENTRIES.labels(name).set_function(lambda: len(self._entries))
+        CACHE_MAX_ENTRIES.labels(name).set_function(lambda: self.max_size)
+        CACHE_LOOKUPS.labels(name, "hit").set_function(lambda: self.hits)
+        CACHE_LOOKUPS.labels(name, "miss").set_function(lambda: self.misses)
+        CACHE_EVICTIONS.labels(name).set_function(lambda: self.evictions)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
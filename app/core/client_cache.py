@@ -0,0 +1,37 @@
+import hashlib
+from typing import Optional
+
+from app.config import settings
+from app.core.cache import TTLCache
+
+
+class ClientSecretCache(TTLCache):
+    """
+    scrypt 검증 결과 캐시 (slow hash는 TTL마다 1회)
+    - 키: (client_id, secret의 SHA-256 digest). secret 원문은 보관하지 않음
+    - 값: 검증에 통과한 secret_hash. 클라이언트 문서(disabled / scopes / secret_hash)는 요청마다 DB에서 읽고
+      현재 secret_hash와 같을 때만 캐시를 씀 → 다른 프로세스(CLI)의 비활성화 / secret 교체도 즉시 반영
+    """
+
+    @staticmethod
+    def key(client_id: str, secret: str) -> tuple:
+        return client_id, hashlib.sha256(secret.encode()).digest()
+
+    def get(self, client_id: str, secret: str) -> Optional[str]:
+        return super().get(self.key(client_id, secret))
+
+    def put(self, client_id: str, secret: str, secret_hash: str):
+        super().put(self.key(client_id, secret), secret_hash)
+
+    def invalidate_client(self, client_id: str):
+        """client_id의 모든 엔트리 제거 (같은 프로세스의 secret 교체 / 비활성화 시 메모리 정리)"""
+        for key in [key for key in self._entries if key[0] == client_id]:
+            super().invalidate(key)
+
+
+# 싱글톤 인스턴스
+client_secret_cache = ClientSecretCache(
+    max_size=settings.client_secret_cache_max_size,
+    ttl_seconds=settings.client_secret_cache_ttl_seconds,
+)
+client_secret_cache.expose_metrics("client_secret")
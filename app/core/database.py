@@ -1,22 +1,155 @@
+"""
+MongoDB 연결 (Motor)
+
+연결 풀 / 타임아웃 / 압축은 settings.mongodb_* 로 설정.
+풀 상태는 ConnectionPoolListener로 집계해 /ready 에 노출.
+"""
+import asyncio
+import importlib.util
+import threading
+import time
+from typing import Dict, List, Optional
+
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import monitoring
+
 from app.config import settings
 
 client: AsyncIOMotorClient = None
 db: AsyncIOMotorDatabase = None
 
+# 압축 방식별 필요 모듈 (zlib은 표준 라이브러리)
+_COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy", "zlib": "zlib"}
+
+
+class PoolStats(monitoring.ConnectionPoolListener):
+    """
+    연결 풀 이벤트 집계 (드라이버 스레드에서 호출되므로 lock 사용)
+    - open: 열려 있는 연결 수, in_use: 체크아웃된 연결 수
+    - checkout_failures: 풀 대기 시간 초과 / 연결 실패
+    - clears: 네트워크 오류 등으로 풀 전체가 비워진 횟수
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open = 0
+        self.in_use = 0
+        self.created = 0
+        self.checkout_failures = 0
+        self.clears = 0
+
+    def connection_created(self, event):
+        with self._lock:
+            self.open += 1
+            self.created += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.open -= 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.in_use += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.in_use -= 1
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.checkout_failures += 1
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.clears += 1
+
+    # 나머지 이벤트는 집계하지 않음
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "open": self.open,
+                "in_use": self.in_use,
+                "idle": self.open - self.in_use,
+                "created": self.created,
+                "checkout_failures": self.checkout_failures,
+                "pool_cleared": self.clears,
+                "min_pool_size": settings.mongodb_min_pool_size,
+                "max_pool_size": settings.mongodb_max_pool_size,
+            }
+
+
+# 싱글톤 인스턴스
+pool_stats = PoolStats()
+
+
+def available_compressors(requested: List[str]) -> List[str]:
+    """설치된 모듈이 있는 압축 방식만 (없는 방식을 넘기면 드라이버가 경고 후 무시)"""
+    return [
+        name for name in requested
+        if name in _COMPRESSOR_MODULES and importlib.util.find_spec(_COMPRESSOR_MODULES[name])
+    ]
+
+
+def client_options() -> dict:
+    """AsyncIOMotorClient 옵션 (settings 기준)"""
+    options = {
+        "maxPoolSize": settings.mongodb_max_pool_size,
+        "minPoolSize": settings.mongodb_min_pool_size,
+        "maxIdleTimeMS": settings.mongodb_max_idle_time_ms,
+        "waitQueueTimeoutMS": settings.mongodb_wait_queue_timeout_ms,
+        "connectTimeoutMS": settings.mongodb_connect_timeout_ms,
+        "serverSelectionTimeoutMS": settings.mongodb_server_selection_timeout_ms,
+        "event_listeners": [pool_stats],
+    }
+    # 연산 전체 제한 시간 (CSOT: 서버 선택 + 풀 대기 + 네트워크 왕복 포함)
+    if settings.mongodb_timeout_ms:
+        options["timeoutMS"] = settings.mongodb_timeout_ms
+    compressors = available_compressors(settings.mongodb_compressors)
+    if compressors:
+        options["compressors"] = compressors
+    return options
+
 
 async def connect_db():
     global client, db
-    client = AsyncIOMotorClient(settings.mongodb_uri)
+    client = AsyncIOMotorClient(settings.mongodb_uri, **client_options())
     db = client[settings.mongodb_db_name]
+    # 인덱스 적용은 lifespan에서 settings.index_reconcile에 따라 처리 (app/core/indexes.py)
+
+
+async def warm_pool(size: Optional[int] = None) -> int:
+    """
+    연결 풀을 size(기본 min_pool_size)개까지 미리 연결 (TLS / 핸드셰이크 비용을 기동 시 지불)
+    동시에 ping을 보내 각각 연결을 체크아웃하게 함. 열린 연결 수 반환
+    """
+    size = settings.mongodb_min_pool_size if size is None else size
+    if size > 0:
+        await asyncio.gather(*(client.admin.command("ping") for _ in range(size)))
+    return pool_stats.open
+
 
-    # TTL 인덱스 생성 (refresh_tokens 자동 만료)
-    await db.refresh_tokens.create_index(
-        "expires_at",
-        expireAfterSeconds=0
-    )
-    # 유저 이메일 유니크 인덱스
-    await db.users.create_index("email", unique=True)
+async def ping() -> float:
+    """MongoDB 왕복 시간 (ms)"""
+    if client is None:
+        raise ConnectionError("MongoDB client is not connected")
+    start = time.perf_counter()
+    await client.admin.command("ping")
+    return (time.perf_counter() - start) * 1000
 
 
 async def close_db():
@@ -1,8 +1,10 @@
 from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from app.core.jwt import decode_access_token
+from app.config import settings
+from app.core.token_cache import verify_access_token
 from app.core.exceptions import (
+    InsufficientPermissionException,
     InvalidCredentialsException,
     UserNotFoundException,
 )
@@ -16,7 +18,7 @@ async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> dict:
     """토큰에서 현재 사용자 정보 추출 (필수)"""
-    return decode_access_token(credentials.credentials)
+    return await verify_access_token(credentials.credentials)
 
 
 async def get_current_user_db(
@@ -26,8 +28,21 @@ async def get_current_user_db(
     if payload.get("type") == "client_credentials":
         raise InvalidCredentialsException("Client token cannot access user endpoints")
 
-    user = await UserRepository.get_by_id(payload["sub"])
+    if settings.user_cache_enabled:
+        user = await UserRepository.get_by_id_cached(payload["sub"])
+    else:
+        user = await UserRepository.get_by_id(payload["sub"])
     if not user:
         raise UserNotFoundException()
 
     return user
+
+
+def require_client_scope(scope: str):
+    """client_credentials 토큰 + scope 필요 (사용자 토큰은 scope와 무관하게 403)"""
+    async def dependency(payload: dict = Depends(get_current_user)) -> dict:
+        if payload.get("type") != "client_credentials" or scope not in payload.get("scope", "").split():
+            raise InsufficientPermissionException(f"Client token with scope '{scope}' required")
+        return payload
+
+    return dependency
@@ -0,0 +1,117 @@
+"""
+python-jose용 EdDSA(Ed25519) 키
+
+python-jose는 EdDSA를 지원하지 않으므로 cryptography의 Ed25519 구현을
+jose Key 인터페이스로 감싸 jwk.register_key로 등록 (RFC 8037)
+"""
+import base64
+from typing import Union
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+
+ALGORITHM = "EdDSA"
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64url_decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+class Ed25519Key(Key):
+    """Ed25519 서명/검증 키 (cryptography 키 객체, PEM, OKP JWK dict 허용)"""
+
+    def __init__(self, key, algorithm):
+        if algorithm != ALGORITHM:
+            raise JWKError(f"hash_alg: {algorithm} is not a valid EdDSA algorithm")
+        self._algorithm = algorithm
+
+        if isinstance(key, (Ed25519PrivateKey, Ed25519PublicKey)):
+            self.prepared_key = key
+        elif isinstance(key, dict):
+            self.prepared_key = self._process_jwk(key)
+        elif isinstance(key, (str, bytes)):
+            self.prepared_key = self._process_pem(key.encode() if isinstance(key, str) else key)
+        else:
+            raise JWKError(f"Unable to parse an EdDSA key from {key!r}")
+
+    @staticmethod
+    def _process_jwk(jwk_dict: dict) -> Union[Ed25519PrivateKey, Ed25519PublicKey]:
+        if jwk_dict.get("kty") != "OKP" or jwk_dict.get("crv") != "Ed25519":
+            raise JWKError("Incorrect key type. Expected: 'OKP' / 'Ed25519'")
+        if "d" in jwk_dict:
+            return Ed25519PrivateKey.from_private_bytes(_b64url_decode(jwk_dict["d"]))
+        return Ed25519PublicKey.from_public_bytes(_b64url_decode(jwk_dict["x"]))
+
+    @staticmethod
+    def _process_pem(pem: bytes) -> Union[Ed25519PrivateKey, Ed25519PublicKey]:
+        try:
+            if b"PRIVATE" in pem:
+                key = serialization.load_pem_private_key(pem, password=None)
+            else:
+                key = serialization.load_pem_public_key(pem)
+        except ValueError as e:
+            raise JWKError(e)
+        if not isinstance(key, (Ed25519PrivateKey, Ed25519PublicKey)):
+            raise JWKError("Not an Ed25519 key")
+        return key
+
+    def is_public(self) -> bool:
+        return isinstance(self.prepared_key, Ed25519PublicKey)
+
+    def sign(self, msg: bytes) -> bytes:
+        return self.prepared_key.sign(msg)
+
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        public_key = self.prepared_key if self.is_public() else self.prepared_key.public_key()
+        try:
+            public_key.verify(sig, msg)
+            return True
+        except InvalidSignature:
+            return False
+
+    def public_key(self) -> "Ed25519Key":
+        if self.is_public():
+            return self
+        return self.__class__(self.prepared_key.public_key(), self._algorithm)
+
+    def to_pem(self) -> bytes:
+        if self.is_public():
+            return self.prepared_key.public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        return self.prepared_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+
+    def to_dict(self) -> dict:
+        public_key = self.prepared_key if self.is_public() else self.prepared_key.public_key()
+        data = {
+            "alg": self._algorithm,
+            "kty": "OKP",
+            "crv": "Ed25519",
+            "x": _b64url(public_key.public_bytes(
+                encoding=serialization.Encoding.Raw,
+                format=serialization.PublicFormat.Raw,
+            )),
+        }
+        if not self.is_public():
+            data["d"] = _b64url(self.prepared_key.private_bytes(
+                encoding=serialization.Encoding.Raw,
+                format=serialization.PrivateFormat.Raw,
+                encryption_algorithm=serialization.NoEncryption(),
+            ))
+        return data
+
+
+jwk.register_key(ALGORITHM, Ed25519Key)
@@ -0,0 +1,130 @@
+"""
+다운스트림 검증 서버용 이벤트 피드 (Server-Sent Events, GET /events)
+
+- key_rotation: 서명 키 로테이션 (JWKS 다시 조회). KeyRing.rotate에서만 발행되며, 운영 환경의 키 교체는
+  재시작으로 하므로 현재는 발행되지 않음 (재연결 후 reset으로 JWKS 재조회)
+- revocation: 로그아웃 등으로 Access token 폐기 (jti, sub, exp)
+
+최근 이벤트는 고정 크기 ring buffer에 보관. 재연결 시 Last-Event-ID 이후 이벤트를 이어서 전송하고,
+버퍼에서 밀려났거나 다른 프로세스에서 발급한 ID면 reset 이벤트로 전체 재동기화를 알림.
+구독자별 큐 없이 모든 구독자가 같은 버퍼를 커서로 읽고, 프레임은 발행 시 1회만 직렬화.
+"""
+import asyncio
+import itertools
+import json
+import secrets
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, List, Optional, Tuple
+
+from app.config import settings
+
+KEY_ROTATION = "key_rotation"
+REVOCATION = "revocation"
+RESET = "reset"
+
+
+@dataclass(frozen=True)
+class FeedEvent:
+    seq: int
+    id: str
+    type: str
+    data: dict
+    # SSE 프레임 (id / event / data)
+    frame: bytes
+
+
+class EventFeed:
+    """
+    ring buffer 기반 이벤트 피드 (이벤트 루프 단일 스레드에서 사용)
+    이벤트 ID는 "{프로세스 epoch}-{seq}". 재시작하면 epoch가 바뀌어 이전 커서는 reset 처리
+    """
+
+    def __init__(self, buffer_size: int = 1024):
+        self.epoch = secrets.token_hex(4)
+        self._seq = 0
+        self._buffer: Deque[FeedEvent] = deque(maxlen=buffer_size)
+        self._waiter = asyncio.Event()
+
+    @property
+    def last_id(self) -> str:
+        return f"{self.epoch}-{self._seq}"
+
+    def publish(self, event_type: str, data: dict) -> FeedEvent:
+        """이벤트 추가 후 대기 중인 구독자를 모두 깨움"""
+        self._seq += 1
+        event_id = f"{self.epoch}-{self._seq}"
+        body = json.dumps(data, separators=(",", ":"), default=str)
+        frame = f"id: {event_id}\nevent: {event_type}\ndata: {body}\n\n".encode()
+        event = FeedEvent(self._seq, event_id, event_type, data, frame)
+        self._buffer.append(event)
+
+        waiter, self._waiter = self._waiter, asyncio.Event()
+        waiter.set()
+        return event
+
+    def waiter(self) -> asyncio.Event:
+        """다음 publish 때 set되는 Event (since() 호출 전에 받아야 이벤트를 놓치지 않음)"""
+        return self._waiter
+
+    def _parse(self, event_id: str) -> Optional[int]:
+        epoch, _, seq = event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def since(self, last_event_id: Optional[str]) -> Tuple[List[FeedEvent], bool]:
+        """
+        last_event_id 이후 이벤트와 reset 필요 여부
+        None이면 지금부터 구독 (재전송 없음)
+        """
+        if last_event_id is None:
+            return [], False
+
+        seq = self._parse(last_event_id)
+        if seq is None or seq > self._seq:
+            return [], True
+
+        oldest = self._buffer[0].seq if self._buffer else self._seq + 1
+        if seq < oldest - 1:
+            # 버퍼에서 밀려난 이벤트가 있음
+            return [], True
+        return list(itertools.islice(self._buffer, seq - oldest + 1, None)), False
+
+    def reset_frame(self) -> bytes:
+        """재동기화 알림 (JWKS / 폐기 상태 전체 재조회). ID는 현재 마지막 이벤트"""
+        return f"id: {self.last_id}\nevent: {RESET}\ndata: {{}}\n\n".encode()
+
+    async def stream(
+        self,
+        last_event_id: Optional[str] = None,
+        heartbeat: float = 15.0,
+    ) -> AsyncIterator[bytes]:
+        """SSE 프레임 스트림. heartbeat초 동안 이벤트가 없으면 주석 프레임으로 연결 유지"""
+        yield f"retry: {settings.event_feed_retry_ms}\n\n".encode()
+
+        cursor = last_event_id
+        while True:
+            waiter = self.waiter()
+            events, reset = self.since(cursor)
+            if reset:
+                yield self.reset_frame()
+                cursor = self.last_id
+                continue
+            for event in events:
+                yield event.frame
+            if events:
+                cursor = events[-1].id
+            elif cursor is None:
+                cursor = self.last_id
+
+            # wait_for는 호출마다 태스크를 만들어 구독자가 많으면 깨우는 비용이 커짐
+            try:
+                async with asyncio.timeout(heartbeat):
+                    await waiter.wait()
+            except TimeoutError:
+                yield b": keepalive\n\n"
+
+
+# 싱글톤 인스턴스
+event_feed = EventFeed(buffer_size=settings.event_feed_buffer_size)
@@ -9,6 +9,7 @@ class ErrorCode(str, Enum):
     TOKEN_EXPIRED = "TOKEN_EXPIRED"
     INSUFFICIENT_PERMISSION = "INSUFFICIENT_PERMISSION"
     INVALID_EMAIL_DOMAIN = "INVALID_EMAIL_DOMAIN"
+    INVALID_SCOPE = "INVALID_SCOPE"
     RATE_LIMIT_EXCEEDED = "RATE_LIMIT_EXCEEDED"
     USER_NOT_FOUND = "USER_NOT_FOUND"
     OAUTH_FAILED = "OAUTH_FAILED"
@@ -61,6 +62,15 @@ class InsufficientPermissionException(AuthException):
         )
 
 
+class InvalidScopeException(AuthException):
+    def __init__(self, detail: str = "Requested scope is not allowed for this client"):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail,
+            error_code=ErrorCode.INVALID_SCOPE,
+        )
+
+
 class InvalidEmailDomainException(AuthException):
     def __init__(self, allowed_domain: str):
         super().__init__(
@@ -0,0 +1,216 @@
+"""
+MongoDB 인덱스 레지스트리
+
+- INDEXES: 컬렉션별 인덱스 선언. ensure_indexes()로 멱등 적용
+  기동 시에는 reconcile_indexes()가 INDEXES 지문을 마지막 적용 기록과 비교해 바뀐 경우만 적용
+- OBSOLETE_INDEXES: 더 이상 쓰지 않는 인덱스. 남아 있으면 쓰기가 실패하므로
+  drop_obsolete_indexes()로 요청 수신 전에 삭제 (INDEX_RECONCILE 설정과 무관하게 항상)
+- QUERY_SHAPES: 리포지토리가 실행하는 쿼리 형태. check_query_plans()로 explain 검사
+
+실행 (인덱스 강제 적용 + COLLSCAN 검사):
+    python -m app.core.indexes --check
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import sys
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure, PyMongoError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 마지막으로 적용한 INDEXES 지문 ({_id: "indexes", fingerprint, applied_at})
+META_COLLECTION = "schema_meta"
+
+# refresh token 보조 인덱스 (시간 구간 컬렉션 refresh_tokens_*에도 생성 시 적용)
+# get_by_token_hash / consume / revoke는 _id(token_hash digest) 인덱스 사용
+REFRESH_TOKEN_INDEXES: List[IndexModel] = [
+    # revoke_all_for_user
+    IndexModel([("user_id", ASCENDING), ("revoked", ASCENDING)]),
+    # compact (폐기된 문서만 포함하는 partial 인덱스)
+    IndexModel([("revoked", ASCENDING)], partialFilterExpression={"revoked": True}),
+    # 이전 형식 토큰 조회 (token_hash 필드가 있는 문서만 포함, 마이그레이션 후에는 비어 있음)
+    # 기본 이름 token_hash_1은 OBSOLETE_INDEXES의 unique 인덱스와 겹치므로 이름 지정
+    IndexModel(
+        [("token_hash", ASCENDING)],
+        name="legacy_token_hash",
+        partialFilterExpression={"token_hash": {"$exists": True}},
+    ),
+]
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "refresh_tokens": [
+        # TTL 인덱스 (refresh_tokens 자동 만료)
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+        *REFRESH_TOKEN_INDEXES,
+    ],
+    "users": [
+        # 유저 이메일 유니크 인덱스
+        IndexModel([("email", ASCENDING)], unique=True),
+        # get_by_google_id
+        IndexModel([("google_id", ASCENDING)]),
+    ],
+    "revoked_tokens": [
+        # TTL 인덱스 (토큰 exp에 폐기 항목 자동 삭제, list_since 초기 조회)
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+        # list_since 증분 조회
+        IndexModel([("revoked_at", ASCENDING)]),
+    ],
+    "audit_events": [
+        # TTL 인덱스 (보존 기간 변경 시 collMod 필요, create_indexes는 옵션이 다르면 실패)
+        IndexModel(
+            [("created_at", ASCENDING)],
+            expireAfterSeconds=settings.audit_retention_days * 24 * 3600,
+        ),
+        # list_for_user
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+}
+
+# {컬렉션 이름 prefix: [인덱스 이름]} (refresh_tokens_* 구간 컬렉션 포함)
+OBSOLETE_INDEXES: Dict[str, List[str]] = {
+    # _id가 token_hash digest로 바뀌어 token_hash 필드가 없음. unique 인덱스가 남으면 두 번째 insert부터 null 중복
+    "refresh_tokens": ["token_hash_1"],
+}
+
+# drop_index 시 무시할 오류 (NamespaceNotFound: 구간 컬렉션이 그 사이 drop됨, IndexNotFound)
+_DROP_INDEX_IGNORED = {26, 27}
+
+# (컬렉션, 필터, 쿼리 위치) - 값은 explain용 예시
+QUERY_SHAPES: List[Tuple[str, dict, str]] = [
+    ("refresh_tokens", {"_id": b"", "revoked": False}, "RefreshTokenRepository.get_by_token_hash / consume"),
+    ("refresh_tokens", {"_id": b""}, "RefreshTokenRepository.revoke"),
+    ("refresh_tokens", {"token_hash": "", "revoked": False}, "RefreshTokenRepository (이전 형식 토큰)"),
+    ("refresh_tokens", {"user_id": "", "revoked": False}, "RefreshTokenRepository.revoke_all_for_user"),
+    ("refresh_tokens", {"expires_at": {"$lte": datetime.utcnow()}}, "RefreshTokenRepository.purge_expired"),
+    ("refresh_tokens", {"revoked": True}, "RefreshTokenRepository.compact"),
+    ("clients", {"_id": ""}, "ClientRepository.get_by_client_id / update"),
+    ("users", {"_id": ObjectId()}, "UserRepository.get_by_id / update"),
+    ("users", {"email": ""}, "UserRepository.get_by_email"),
+    ("users", {"google_id": ""}, "UserRepository.get_by_google_id"),
+    ("revoked_tokens", {"_id": ""}, "RevokedTokenRepository.is_revoked"),
+    ("revoked_tokens", {"expires_at": {"$gt": datetime.utcnow()}}, "RevokedTokenRepository.list_since (초기)"),
+    ("revoked_tokens", {"revoked_at": {"$gte": datetime.utcnow()}}, "RevokedTokenRepository.list_since"),
+    ("audit_events", {"user_id": ""}, "AuditEventRepository.list_for_user"),
+]
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase):
+    """INDEXES 적용 (이미 같은 인덱스가 있으면 변경 없음) 후 지문 기록"""
+    for collection, indexes in INDEXES.items():
+        await db[collection].create_indexes(indexes)
+    await db[META_COLLECTION].update_one(
+        {"_id": "indexes"},
+        {"$set": {"fingerprint": index_fingerprint(), "applied_at": datetime.utcnow()}},
+        upsert=True,
+    )
+
+
+async def drop_obsolete_indexes(db: AsyncIOMotorDatabase) -> List[str]:
+    """OBSOLETE_INDEXES 삭제 (이미 없으면 무시, 멱등). 삭제한 "컬렉션.인덱스" 목록 반환"""
+    dropped = []
+    for prefix, names in OBSOLETE_INDEXES.items():
+        collections = await db.list_collection_names(filter={"name": {"$regex": f"^{prefix}"}})
+        for collection in sorted(collections):
+            for name in names:
+                try:
+                    await db[collection].drop_index(name)
+                except OperationFailure as e:
+                    if e.code not in _DROP_INDEX_IGNORED:
+                        raise
+                    continue
+                dropped.append(f"{collection}.{name}")
+    return dropped
+
+
+def index_fingerprint() -> str:
+    """INDEXES 선언의 sha256 (키 순서 유지, 옵션 포함)"""
+    spec = [
+        [collection, [model.document for model in indexes]]
+        for collection, indexes in sorted(INDEXES.items())
+    ]
+    return hashlib.sha256(json.dumps(spec, default=str).encode()).hexdigest()
+
+
+async def reconcile_indexes(db: AsyncIOMotorDatabase) -> bool:
+    """
+    INDEXES가 마지막 적용 이후 바뀐 경우만 ensure_indexes 실행 (조회 1회로 확인)
+    적용했으면 True. 인덱스를 수동으로 지운 경우는 감지하지 않으므로 python -m app.core.indexes로 강제 적용
+    """
+    meta = await db[META_COLLECTION].find_one({"_id": "indexes"})
+    if meta and meta.get("fingerprint") == index_fingerprint():
+        return False
+    await ensure_indexes(db)
+    return True
+
+
+async def reconcile_indexes_in_background(db: AsyncIOMotorDatabase):
+    """lifespan 백그라운드 태스크용. 실패는 기록만 하고 서비스는 계속 (다음 기동 시 재시도)"""
+    try:
+        if await reconcile_indexes(db):
+            logger.info("Indexes applied")
+    except PyMongoError:
+        logger.warning("Index reconciliation failed", exc_info=True)
+
+
+def find_stages(plan: dict, stage: str) -> bool:
+    """explain 결과의 plan 트리에 stage가 포함되어 있는지 확인"""
+    if plan.get("stage") == stage:
+        return True
+    children = []
+    if "inputStage" in plan:
+        children.append(plan["inputStage"])
+    children.extend(plan.get("inputStages", []))
+    # SBE 엔진은 queryPlan 아래에 트리를 둠
+    if "queryPlan" in plan:
+        children.append(plan["queryPlan"])
+    return any(find_stages(child, stage) for child in children)
+
+
+async def check_query_plans(db: AsyncIOMotorDatabase) -> List[str]:
+    """
+    QUERY_SHAPES 전체를 explain하고 COLLSCAN을 쓰는 쿼리 목록 반환
+    빈 목록이면 모든 쿼리가 인덱스를 사용
+    """
+    failures = []
+    for collection, query_filter, location in QUERY_SHAPES:
+        result = await db.command(
+            "explain",
+            {"find": collection, "filter": query_filter},
+            verbosity="queryPlanner",
+        )
+        winning_plan = result["queryPlanner"]["winningPlan"]
+        if find_stages(winning_plan, "COLLSCAN"):
+            failures.append(f"{location}: COLLSCAN on {collection} {query_filter}")
+    return failures
+
+
+async def _main(check: bool) -> int:
+    from app.core.database import close_db, connect_db, get_db
+
+    await connect_db()
+    try:
+        for name in await drop_obsolete_indexes(get_db()):
+            print(f"dropped {name}")
+        await ensure_indexes(get_db())
+        if not check:
+            return 0
+        failures = await check_query_plans(get_db())
+        for failure in failures:
+            print(failure)
+        print(f"{len(QUERY_SHAPES) - len(failures)}/{len(QUERY_SHAPES)} queries use an index")
+        return 1 if failures else 0
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(check="--check" in sys.argv)))
@@ -1,83 +1,162 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional, Tuple
 from jose import jwt, JWTError, ExpiredSignatureError
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
-import base64
+from jose.backends.base import Key
+import hashlib
+import json
+import secrets
+import time
 
 from app.config import settings
-from app.core.security import load_private_key, load_public_key
+from app.core.security import get_key_ring, public_jwk
 from app.core.exceptions import InvalidCredentialsException, TokenExpiredException
+from app.core.metrics import JWT_LATENCY
 
 
-def create_access_token(
+# 요청 인증에 쓸 수 있는 토큰 type 클레임
+ACCESS_TOKEN_TYPES = ("access", "client_credentials")
+
+
+def get_signer() -> Key:
+    """활성 서명 키 (파싱된 private key로 1회 생성 후 재사용)"""
+    return get_key_ring().signer
+
+
+def get_verifier(kid: Optional[str] = None) -> Optional[Key]:
+    """kid에 해당하는 검증 키. kid가 없으면 활성 키"""
+    return get_key_ring().get_verifier(kid)
+
+
+def build_access_payload(
     user_id: str,
     email: str,
     role: str,
     expires_delta: Optional[timedelta] = None
-) -> str:
+) -> dict:
+    """Access token 클레임 생성 (jti는 폐기 목록 키)"""
     if expires_delta is None:
         expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
 
     expire = datetime.utcnow() + expires_delta
-    payload = {
+    return {
         "sub": user_id,
         "email": email,
         "role": role,
         "exp": expire,
         "iat": datetime.utcnow(),
+        "jti": secrets.token_urlsafe(16),
         "type": "access"
     }
 
-    private_key = load_private_key()
-    return jwt.encode(payload, private_key, algorithm=settings.jwt_algorithm)
 
+def build_client_payload(
+    client_id: str,
+    scopes: List[str],
+    expires_delta: Optional[timedelta] = None
+) -> dict:
+    """
+    client_credentials 토큰 클레임 생성 (sub = client_id, scope는 공백 구분)
+    만료는 Access token과 같음 (키 로테이션 시 이전 키 유지 기간이 이 값 기준)
+    """
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
 
-def decode_access_token(token: str) -> dict:
-    """Access token 디코딩. 실패 시 예외 발생."""
+    now = datetime.utcnow()
+    return {
+        "sub": client_id,
+        "client_id": client_id,
+        "scope": " ".join(scopes),
+        "exp": now + expires_delta,
+        "iat": now,
+        "jti": secrets.token_urlsafe(16),
+        "type": "client_credentials"
+    }
+
+
+def sign_token(payload: dict) -> str:
+    """활성 키로 서명 (헤더에 kid 포함). CPU 작업이므로 요청 경로에서는 token_signer 사용"""
+    ring = get_key_ring()
+    start = time.perf_counter()
+    token = jwt.encode(
+        payload,
+        ring.signer,
+        algorithm=ring.algorithm,
+        headers={"kid": ring.active_kid},
+    )
+    JWT_LATENCY.labels("sign", ring.algorithm).observe(time.perf_counter() - start)
+    return token
+
+
+def create_access_token(
+    user_id: str,
+    email: str,
+    role: str,
+    expires_delta: Optional[timedelta] = None
+) -> str:
+    return sign_token(build_access_payload(user_id, email, role, expires_delta))
+
+
+def decode_token(token: str, verify_exp: bool = True) -> dict:
+    """
+    헤더의 kid로 검증 키를 골라 서명 검증 후 클레임 반환
+    허용 알고리즘은 해당 키의 알고리즘 하나뿐 (헤더 alg 바꿔치기 방지)
+    실패 시 JWTError (만료는 ExpiredSignatureError)
+    """
+    kid = jwt.get_unverified_header(token).get("kid")
+    entry = get_key_ring().get_key(kid)
+    if entry is None:
+        raise JWTError("Unknown signing key")
+
+    start = time.perf_counter()
     try:
-        public_key = load_public_key()
-        payload = jwt.decode(
+        return jwt.decode(
             token,
-            public_key,
-            algorithms=[settings.jwt_algorithm]
+            entry.verifier,
+            algorithms=[entry.algorithm],
+            options={"verify_exp": verify_exp},
         )
+    finally:
+        JWT_LATENCY.labels("verify", entry.algorithm).observe(time.perf_counter() - start)
+
+
+def decode_access_token(token: str) -> dict:
+    """Access token(유저 / client_credentials) 디코딩. 실패 시 예외 발생."""
+    try:
+        payload = decode_token(token)
     except ExpiredSignatureError:
         raise TokenExpiredException()
     except JWTError:
         raise InvalidCredentialsException("Invalid or malformed token")
 
-    if payload.get("type") != "access":
+    if payload.get("type") not in ACCESS_TOKEN_TYPES:
         raise InvalidCredentialsException("Invalid token type")
 
     return payload
 
 
 def get_jwks() -> dict:
-    """JWKS 엔드포인트용 공개키 정보"""
-    public_key_pem = load_public_key()
-    public_key: RSAPublicKey = serialization.load_pem_public_key(
-        public_key_pem.encode()
-    )
-
-    numbers = public_key.public_numbers()
-
-    # RSA 파라미터를 Base64url로 인코딩
-    def int_to_base64url(n: int) -> str:
-        byte_length = (n.bit_length() + 7) // 8
-        return base64.urlsafe_b64encode(
-            n.to_bytes(byte_length, byteorder='big')
-        ).rstrip(b'=').decode('ascii')
-
+    """JWKS 엔드포인트용 공개키 정보 (활성 키 + 아직 유효한 retired 키, kty RSA/EC/OKP)"""
     return {
         "keys": [
-            {
-                "kty": "RSA",
-                "use": "sig",
-                "alg": "RS256",
-                "kid": "key-1",
-                "n": int_to_base64url(numbers.n),
-                "e": int_to_base64url(numbers.e),
-            }
+            {**public_jwk(entry.public_key), "use": "sig", "alg": entry.algorithm, "kid": kid}
+            for kid, entry in get_key_ring().public_keys()
         ]
     }
+
+
+# (kid 목록, 직렬화된 JWKS, ETag)
+_jwks_cache: Optional[Tuple[tuple, bytes, str]] = None
+
+
+def get_jwks_response() -> Tuple[bytes, str]:
+    """
+    직렬화된 JWKS 문서와 strong ETag
+    키 셋(kid 목록)이 바뀔 때만 다시 직렬화하고, 그 외에는 같은 bytes를 재사용
+    """
+    global _jwks_cache
+    key_set = tuple(kid for kid, _ in get_key_ring().public_keys())
+    if _jwks_cache is None or _jwks_cache[0] != key_set:
+        body = json.dumps(get_jwks(), separators=(",", ":")).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        _jwks_cache = (key_set, body, etag)
+    return _jwks_cache[1], _jwks_cache[2]
@@ -1,24 +1,108 @@
+"""
+인증 이벤트 로깅
+
+요청 경로에서는 레코드를 bounded queue에 넣기만 하고, JSON 직렬화와 stdout 쓰기는
+QueueListener 스레드에서 처리 (stdout이 느려도 요청 지연으로 이어지지 않음)
+- 큐가 가득 차면 레코드를 버리고 log_records_dropped_total 증가
+- 성공 이벤트는 settings.log_success_sample_rate 비율로 샘플링 (실패 이벤트는 항상 기록)
+감사 로그(app/core/audit.py)에는 샘플링과 무관하게 모든 이벤트 저장
+"""
+import atexit
+import json
 import logging
+import queue
+import random
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+from app.config import settings
+from app.core.audit import audit_sink
+from app.core.metrics import Counter, registry
+
+LOG_RECORDS_DROPPED = registry.register(Counter(
+    "log_records_dropped_total",
+    "Log records dropped because the log queue was full",
+    ["logger"],
+))
+AUTH_EVENTS_SAMPLED_OUT = registry.register(Counter(
+    "auth_events_sampled_out_total",
+    "Successful auth events skipped by log sampling",
+    ["event"],
+))
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드를 JSON 한 줄로 직렬화. extra={"fields": {...}}는 최상위 키로 병합"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        data.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """가득 차면 기다리지 않고 버리는 QueueHandler"""
+
+    def __init__(self, maxsize: int):
+        super().__init__(queue.Queue(maxsize))
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 구현은 여기서 format()을 호출함. 직렬화는 listener 스레드에서 하도록 그대로 전달
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.labels(record.name).inc()
+
+
 # 로거 설정
 logger = logging.getLogger("authentic")
 logger.setLevel(logging.INFO)
+logger.propagate = False
 
-# 콘솔 핸들러
+# 콘솔 핸들러 (listener 스레드에서 실행)
 console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setLevel(logging.INFO)
+console_handler.setFormatter(JsonFormatter())
+
+queue_handler = BoundedQueueHandler(settings.log_queue_size)
+logger.addHandler(queue_handler)
+
+listener = QueueListener(queue_handler.queue, console_handler, respect_handler_level=True)
+_listener_running = False
+
+
+def start_logging():
+    """listener 스레드 시작 (이미 실행 중이면 무시)"""
+    global _listener_running
+    if not _listener_running:
+        listener.start()
+        _listener_running = True
 
-# 포맷터
-formatter = logging.Formatter(
-    "[%(asctime)s] %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
-console_handler.setFormatter(formatter)
 
-logger.addHandler(console_handler)
+def shutdown_logging():
+    """큐에 남은 레코드를 모두 쓰고 listener 스레드 종료"""
+    global _listener_running
+    if _listener_running:
+        listener.stop()
+        _listener_running = False
+
+
+start_logging()
+atexit.register(shutdown_logging)
 
 
 def log_auth_event(
@@ -30,12 +114,7 @@ def log_auth_event(
     success: bool = True,
     detail: Optional[str] = None
 ):
-    """인증 이벤트 로깅"""
-    log_data = {
-        "event": event,
-        "timestamp": datetime.utcnow().isoformat(),
-        "success": success,
-    }
+    """인증 이벤트 로깅 + 감사 로그 기록"""
     optional = {
         "user_id": user_id,
         "email": email,
@@ -43,12 +122,29 @@ def log_auth_event(
         "ip": ip_address,
         "detail": detail,
     }
-    log_data.update({k: v for k, v in optional.items() if v is not None})
+    fields = {k: v for k, v in optional.items() if v is not None}
+
+    if settings.audit_enabled and settings.mongodb_enabled:
+        audit_sink.record({"event": event, "success": success, **fields})
+
+    sample_rate = settings.log_success_sample_rate if success else 1.0
+    if sample_rate < 1.0 and random.random() >= sample_rate:
+        AUTH_EVENTS_SAMPLED_OUT.labels(event).inc()
+        return
+
+    log_data = {
+        "event": event,
+        "success": success,
+    }
+    if sample_rate < 1.0:
+        # 집계 시 1 / sample_rate 배로 환산
+        log_data["sample_rate"] = sample_rate
+    log_data.update(fields)
 
     if success:
-        logger.info(f"AUTH: {log_data}")
+        logger.info("AUTH", extra={"fields": log_data})
     else:
-        logger.warning(f"AUTH_FAILED: {log_data}")
+        logger.warning("AUTH_FAILED", extra={"fields": log_data})
 
 
 def log_login(email: str, ip: Optional[str] = None, success: bool = True):
@@ -59,7 +155,14 @@ def log_logout(user_id: str, ip: Optional[str] = None):
     log_auth_event("LOGOUT", user_id=user_id, ip_address=ip)
 
 
-def log_token_refresh(user_id: str, success: bool = True):
-    log_auth_event("TOKEN_REFRESH", user_id=user_id, success=success)
+def log_token_refresh(
+    user_id: Optional[str] = None,
+    ip: Optional[str] = None,
+    success: bool = True,
+    detail: Optional[str] = None,
+):
+    log_auth_event("TOKEN_REFRESH", user_id=user_id, ip_address=ip, success=success, detail=detail)
 
 
+def log_client_token(client_id: str, ip: Optional[str] = None, success: bool = True):
+    log_auth_event("CLIENT_TOKEN", client_id=client_id, ip_address=ip, success=success)
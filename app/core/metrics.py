@@ -0,0 +1,294 @@
+"""
+Prometheus text format 메트릭 레지스트리
+
+외부 의존성 없이 Counter / Histogram만 구현. 라벨 조합별 child는 처음 1회만 생성하고
+이후 관측은 bisect 1회 + 정수 증가로 끝나도록 유지 (요청당 수 µs 이내).
+캐시 크기처럼 다른 객체가 이미 세고 있는 값은 Gauge / FunctionCounter로 scrape 시점에 읽음 (요청 경로 비용 없음).
+측정 비용: python -m benchmarks.metrics_overhead
+"""
+import functools
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# 초 단위 (0.1ms ~ 5s)
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+
+class _FunctionChild:
+    __slots__ = ("function",)
+
+    def __init__(self):
+        self.function: Callable[[], float] = lambda: 0
+
+    def set_function(self, function: Callable[[], float]):
+        self.function = function
+
+    @property
+    def value(self) -> float:
+        return self.function()
+
+
+class _HistogramChild:
+    """이벤트 루프 스레드 전용 (lock 없음)"""
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # 마지막 칸은 +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        return list(self.counts), self.sum, self.count
+
+
+class _LockedHistogramChild(_HistogramChild):
+    """여러 스레드에서 관측하는 histogram용 (JWT 서명은 executor 스레드에서 실행)"""
+    __slots__ = ("_lock",)
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        super().__init__(buckets)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return super().snapshot()
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """라벨 값 조합의 child (호출부에서 보관해 재사용 권장)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _samples(self, values: Tuple[str, ...], child) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for values, child in sorted(self._children.items()):
+            lines.extend(self._samples(values, child))
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def _samples(self, values, child: _CounterChild) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {child.value}"]
+
+
+class Gauge(_Metric):
+    """값은 labels(...).set_function()으로 지정한 함수를 scrape 시 호출해 계산"""
+    kind = "gauge"
+
+    def _new_child(self) -> _FunctionChild:
+        return _FunctionChild()
+
+    def _samples(self, values, child: _FunctionChild) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"]
+
+
+class FunctionCounter(Gauge):
+    """다른 객체가 세고 있는 누적값 (캐시 hit 수 등)을 counter로 노출"""
+    kind = "counter"
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        thread_safe: bool = False,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._child_cls = _LockedHistogramChild if thread_safe else _HistogramChild
+
+    def _new_child(self) -> _HistogramChild:
+        return self._child_cls(self.buckets)
+
+    def _samples(self, values, child: _HistogramChild) -> List[str]:
+        counts, total, count = child.snapshot()
+
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += bucket_count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(
+                f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}"
+            )
+        labels = _format_labels(self.labelnames, values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """등록된 메트릭을 Prometheus text format(0.0.4)으로 출력"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 싱글톤 인스턴스
+registry = MetricsRegistry()
+
+REQUEST_LATENCY = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status",
+    ["method", "route", "status"],
+))
+REPOSITORY_LATENCY = registry.register(Histogram(
+    "repository_operation_duration_seconds",
+    "Repository operation latency",
+    ["repository", "operation"],
+))
+JWT_LATENCY = registry.register(Histogram(
+    "jwt_operation_duration_seconds",
+    "JWT sign / verify latency",
+    ["operation", "algorithm"],
+    thread_safe=True,
+))
+RATE_LIMIT_DECISIONS = registry.register(Counter(
+    "rate_limit_decisions_total",
+    "Rate limiter decisions by policy",
+    ["policy", "result"],
+))
+
+
+def observe_repository(func: Callable) -> Callable:
+    """
+    리포지토리 async 메서드 실행 시간을 REPOSITORY_LATENCY에 기록
+    라벨은 정의된 클래스/메서드 이름 (예: UserRepository / get_by_id)
+    """
+    repository, operation = func.__qualname__.split(".")[-2:]
+    child = REPOSITORY_LATENCY.labels(repository, operation)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            child.observe(time.perf_counter() - start)
+
+    return wrapper
+
+
+class MetricsMiddleware:
+    """
+    라우트 템플릿(/auth/me 등) + 상태 코드별 요청 지연을 기록하는 ASGI 미들웨어
+    라우팅 결과(scope["route"])를 쓰므로 path 파라미터가 있어도 라벨 수가 늘지 않음
+    """
+
+    def __init__(self, app):
+        self.app = app
+        # (method, route 템플릿, status) → histogram child (요청마다 라벨 튜플을 만들지 않도록)
+        self._children: Dict[tuple, _HistogramChild] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            key = (scope["method"], getattr(scope.get("route"), "path", "unmatched"), status)
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = REQUEST_LATENCY.labels(key[0], key[1], str(status))
+            child.observe(time.perf_counter() - start)
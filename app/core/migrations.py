@@ -0,0 +1,97 @@
+"""
+MongoDB 데이터 마이그레이션
+
+refresh-token-ids: refresh token 문서를 {_id: ObjectId, token_hash: hex} →
+{_id: SHA-256 digest(BinData 32바이트)}로 변환 (refresh_tokens, refresh_tokens_* 구간 컬렉션)
+- 기존 token_hash unique 인덱스는 기동 시 drop_obsolete_indexes()가 먼저 제거 (여기서도 한 번 더 확인)
+  남아 있으면 token_hash 없는 새 문서끼리 null 중복으로 충돌해 모든 로그인 / refresh가 실패함
+- ObjectId _id 범위를 batch_size개씩 읽어 insert_many(ordered=False) 후 원본 삭제
+- 중간에 중단되어도 다시 실행하면 남은 문서만 변환 (이미 변환된 _id는 중복 키로 건너뜀)
+배포 직후 실행. 완료 전에는 리포지토리가 _id 조회에 실패하면 token_hash로 한 번 더 조회하므로
+배포 이전에 발급된 refresh token도 동작함 (변환 후에는 그 추가 조회가 빈 partial 인덱스만 확인)
+
+실행:
+    python -m app.core.migrations refresh-token-ids [--batch-size 1000]
+"""
+import asyncio
+import sys
+from typing import Dict, List
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import ASCENDING
+from pymongo.errors import BulkWriteError
+
+from app.core.indexes import drop_obsolete_indexes
+from app.repositories.backends import BucketedMongoRefreshTokenStore
+
+# ObjectId 타입 범위 전체 (비교 연산은 같은 BSON 타입끼리만 매칭되므로 binary _id는 제외됨)
+_MIN_OBJECT_ID = ObjectId("000000000000000000000000")
+
+
+def _convert(doc: dict) -> dict:
+    converted = {k: v for k, v in doc.items() if k not in ("_id", "token_hash")}
+    converted["_id"] = bytes.fromhex(doc["token_hash"])
+    return converted
+
+
+async def _refresh_token_collections(db: AsyncIOMotorDatabase) -> List[str]:
+    prefix = BucketedMongoRefreshTokenStore.PREFIX
+    names = await db.list_collection_names(filter={"name": {"$regex": f"^{prefix}"}})
+    return ["refresh_tokens", *sorted(names)]
+
+
+async def migrate_collection(collection: AsyncIOMotorCollection, batch_size: int = 1000) -> int:
+    """변환한 문서 수 반환 (token_hash unique 인덱스는 미리 제거되어 있어야 함)"""
+    migrated = 0
+    while True:
+        cursor = (
+            collection.find({"_id": {"$gte": _MIN_OBJECT_ID}})
+            .sort("_id", ASCENDING)
+            .limit(batch_size)
+        )
+        docs = await cursor.to_list(batch_size)
+        if not docs:
+            return migrated
+
+        try:
+            await collection.insert_many([_convert(doc) for doc in docs], ordered=False)
+        except BulkWriteError as e:
+            # 이전 실행에서 이미 변환된 문서만 허용
+            if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+                raise
+        await collection.delete_many({"_id": {"$in": [doc["_id"] for doc in docs]}})
+        migrated += len(docs)
+
+
+async def migrate_refresh_token_ids(db: AsyncIOMotorDatabase, batch_size: int = 1000) -> Dict[str, int]:
+    """{컬렉션 이름: 변환한 문서 수}"""
+    await drop_obsolete_indexes(db)
+    return {
+        name: await migrate_collection(db[name], batch_size)
+        for name in await _refresh_token_collections(db)
+    }
+
+
+async def _main(argv: List[str]) -> int:
+    from app.core.database import close_db, connect_db, get_db
+
+    if not argv or argv[0] != "refresh-token-ids":
+        print(__doc__)
+        return 2
+    batch_size = int(argv[argv.index("--batch-size") + 1]) if "--batch-size" in argv else 1000
+
+    await connect_db()
+    try:
+        migrated = await migrate_refresh_token_ids(get_db(), batch_size)
+        for name, count in migrated.items():
+            if count:
+                print(f"{name}: {count} documents")
+        print(f"migrated {sum(migrated.values())} refresh tokens")
+        return 0
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
@@ -0,0 +1,44 @@
+"""
+Google OAuth 클라이언트 (authlib)
+
+authlib import와 클라이언트 등록은 첫 사용 시점으로 미룸 (기동 시 import 비용 제외).
+OpenID 메타데이터는 lifespan에서 백그라운드로 미리 받아 첫 로그인 요청이 기다리지 않게 함
+"""
+import logging
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_METADATA_URL = "https://accounts.google.com/.well-known/openid-configuration"
+
+_oauth = None
+
+
+def get_google_client():
+    """등록된 Google OAuth 클라이언트 (최초 호출 시 authlib import + 등록)"""
+    global _oauth
+    if _oauth is None:
+        from authlib.integrations.starlette_client import OAuth
+        from starlette.config import Config
+
+        config = Config(environ={
+            "GOOGLE_CLIENT_ID": settings.google_client_id,
+            "GOOGLE_CLIENT_SECRET": settings.google_client_secret,
+        })
+        oauth = OAuth(config)
+        oauth.register(
+            name="google",
+            server_metadata_url=GOOGLE_METADATA_URL,
+            client_kwargs={"scope": "openid email profile"},
+        )
+        _oauth = oauth
+    return _oauth.google
+
+
+async def prefetch_metadata():
+    """OpenID 메타데이터 미리 로드. 실패해도 첫 로그인 요청에서 다시 시도하므로 경고만 남김"""
+    try:
+        await get_google_client().load_server_metadata()
+    except Exception:
+        logger.warning("OAuth metadata prefetch failed", exc_info=True)
@@ -1,36 +1,109 @@
-from datetime import datetime, timedelta
-from typing import Dict, Tuple
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
 from fastapi import Request
+from jose import JWTError
 
+from app.config import settings
 from app.core.exceptions import RateLimitExceededException
+from app.core.jwt import ACCESS_TOKEN_TYPES, decode_token
+from app.core.metrics import RATE_LIMIT_DECISIONS
+from app.core.rate_limit_backends import (
+    RateLimitBackend,
+    RateLimitBackendError,
+    MemoryRateLimitBackend,
+    create_rate_limit_backend,
+)
+from app.core.token_cache import token_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """
+    라우트별 GCRA(token bucket) 정책
+
+    Attributes:
+        name: 정책 식별자 (저장소 키 prefix)
+        limit: period 동안 허용할 요청 수
+        period: 기간 (초)
+        key: 버킷 기준 - "ip" / "sub"(JWT sub) / "client"(JWT client_id).
+             토큰이 없거나 검증에 실패하면 IP로 대체
+        burst: 한 번에 허용할 최대 요청 수 (기본값 limit)
+    """
+    name: str
+    limit: int
+    period: int
+    key: str = "ip"
+    burst: Optional[int] = None
+
+    @property
+    def interval(self) -> float:
+        return self.period / self.limit
+
+    @property
+    def tolerance(self) -> float:
+        return self.interval * (self.burst or self.limit)
 
 
 class RateLimiter:
     """
-    인메모리 Rate Limiter
-    프로덕션에서는 Redis 사용 권장
+    Rate Limiter
+    - check_rate_limit: IP 기준 고정 윈도우
+    - check_policy: 정책 기준 GCRA (키당 TAT 하나만 저장)
+    카운터 저장소는 backend로 교체 가능 (memory / shm / redis)
     """
 
-    def __init__(self):
-        # {key: (count, window_start)}
-        self._requests: Dict[str, Tuple[int, datetime]] = {}
+    def __init__(self, backend: Optional[RateLimitBackend] = None):
+        self.backend = backend or MemoryRateLimitBackend()
 
     def _get_key(self, request: Request, endpoint: str) -> str:
         """IP + 엔드포인트로 키 생성"""
         client_ip = request.client.host if request.client else "unknown"
         return f"{client_ip}:{endpoint}"
 
-    def _cleanup_old_entries(self):
-        """오래된 엔트리 정리"""
-        now = datetime.utcnow()
-        expired_keys = [
-            key for key, (_, window_start) in self._requests.items()
-            if now - window_start > timedelta(minutes=5)
-        ]
-        for key in expired_keys:
-            del self._requests[key]
-
-    def check_rate_limit(
+    @staticmethod
+    def _bearer_claims(request: Request) -> Optional[dict]:
+        """
+        Authorization 헤더의 Access token 클레임 (서명 검증, 만료는 무시)
+        만료된 토큰으로 /auth/refresh 를 호출해도 같은 버킷을 쓰도록 exp는 보지 않음
+        token_cache는 peek으로 조회해 hit rate에 섞이지 않게 하고, 직접 검증한 유효한 Access token은
+        캐시에 넣어 뒤이은 인증(verify_access_token)이 서명을 다시 검증하지 않게 함
+        """
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+
+        payload = token_cache.peek(token)
+        if payload is not None:
+            return payload
+        try:
+            payload = decode_token(token, verify_exp=False)
+        except JWTError:
+            return None
+        if (
+            settings.token_cache_enabled
+            and payload.get("type") in ACCESS_TOKEN_TYPES
+            and payload.get("exp", 0) > time.time()
+        ):
+            token_cache.put(token, payload)
+        return payload
+
+    def _get_identity(self, request: Request, key: str) -> str:
+        """정책 key 기준 버킷 식별자"""
+        if key in ("sub", "client"):
+            claims = self._bearer_claims(request)
+            value = claims.get("client_id" if key == "client" else "sub") if claims else None
+            if value:
+                return f"{key}:{value}"
+
+        client_ip = request.client.host if request.client else "unknown"
+        return f"ip:{client_ip}"
+
+    async def check_rate_limit(
         self,
         request: Request,
         endpoint: str,
@@ -49,42 +122,111 @@ class RateLimiter:
         Returns:
             True if allowed, raises RateLimitExceededException if exceeded
         """
-        self._cleanup_old_entries()
-
         key = self._get_key(request, endpoint)
-        now = datetime.utcnow()
+        try:
+            count, ttl = await self.backend.incr(key, window_seconds)
+        except RateLimitBackendError:
+            # 저장소 장애로 인증 자체가 막히지 않도록 허용 (fail-open)
+            logger.warning("Rate limit backend unavailable", exc_info=True)
+            RATE_LIMIT_DECISIONS.labels(endpoint, "error").inc()
+            return True
+
+        if count > max_requests:
+            RATE_LIMIT_DECISIONS.labels(endpoint, "rejected").inc()
+            raise RateLimitExceededException(retry_after=max(1, math.ceil(ttl)))
+
+        RATE_LIMIT_DECISIONS.labels(endpoint, "accepted").inc()
+        return True
 
-        if key in self._requests:
-            count, window_start = self._requests[key]
+    async def check_policy(self, request: Request, policy: RateLimitPolicy) -> Dict[str, str]:
+        """
+        GCRA 정책 체크. 응답에 붙일 RateLimit-* 헤더를 request.state에 저장.
 
-            # 윈도우 만료 체크
-            if now - window_start > timedelta(seconds=window_seconds):
-                self._requests[key] = (1, now)
-                return True
+        Returns:
+            RateLimit-* 헤더, raises RateLimitExceededException if exceeded
+        """
+        key = f"{policy.name}:{self._get_identity(request, policy.key)}"
+        interval, tolerance = policy.interval, policy.tolerance
+        try:
+            allowed, tat_offset = await self.backend.gcra(key, interval, tolerance)
+        except RateLimitBackendError:
+            logger.warning("Rate limit backend unavailable", exc_info=True)
+            RATE_LIMIT_DECISIONS.labels(policy.name, "error").inc()
+            return {}
+
+        if allowed:
+            remaining = int((tolerance - tat_offset) / interval + 1e-9)
+        else:
+            remaining = 0
 
-            # 요청 수 체크
-            if count >= max_requests:
-                retry_after = window_seconds - int((now - window_start).total_seconds())
-                raise RateLimitExceededException(retry_after=max(1, retry_after))
+        headers = {
+            "RateLimit-Limit": str(policy.burst or policy.limit),
+            "RateLimit-Remaining": str(max(0, remaining)),
+            "RateLimit-Reset": str(max(0, math.ceil(tat_offset))),
+            "RateLimit-Policy": f"{policy.limit};w={policy.period}",
+        }
+        request.state.rate_limit_headers = headers
 
-            self._requests[key] = (count + 1, window_start)
-        else:
-            self._requests[key] = (1, now)
+        if not allowed:
+            RATE_LIMIT_DECISIONS.labels(policy.name, "rejected").inc()
+            retry_after = tat_offset + interval - tolerance
+            raise RateLimitExceededException(retry_after=max(1, math.ceil(retry_after)))
 
-        return True
+        RATE_LIMIT_DECISIONS.labels(policy.name, "accepted").inc()
+        return headers
+
+
+class RateLimitHeadersMiddleware:
+    """check_policy가 남긴 RateLimit-* 헤더를 응답(에러 응답 포함)에 추가하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 하위 앱이 scope를 복사해도 같은 state dict를 공유하도록 미리 생성
+        state = scope.setdefault("state", {})
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = state.get("rate_limit_headers")
+                if headers:
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (name.lower().encode(), value.encode())
+                        for name, value in headers.items()
+                    ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 # 싱글톤 인스턴스
-rate_limiter = RateLimiter()
+rate_limiter = RateLimiter(create_rate_limit_backend())
+
 
+def rate_limit(policy: RateLimitPolicy):
+    """라우트에 정책을 적용하는 FastAPI 의존성"""
+    async def dependency(request: Request):
+        await rate_limiter.check_policy(request, policy)
+    return dependency
 
-# 설정별 Rate Limit
+
+# 라우트별 Rate Limit 정책
 class RateLimitConfig:
-    # 토큰 발급: 분당 10회
-    TOKEN_ISSUE = {"max_requests": 10, "window_seconds": 60}
+    # 로그인 시도: 분당 5회 (로그인 전이므로 IP 기준)
+    LOGIN = RateLimitPolicy("login", limit=5, period=60, key="ip")
+
+    # 토큰 갱신: 분당 10회 (Access token이 있으면 유저 기준)
+    TOKEN_REFRESH = RateLimitPolicy("token_refresh", limit=10, period=60, key="sub")
+
+    # client_credentials 토큰 발급: 분당 60회 (IP 기준, secret 대입 시도 억제)
+    CLIENT_TOKEN = RateLimitPolicy("client_token", limit=60, period=60, key="ip")
 
-    # 로그인 시도: 분당 5회
-    LOGIN = {"max_requests": 5, "window_seconds": 60}
+    # 토큰 introspection: 분당 600회 (호출 서비스 기준, 배치 요청도 1회)
+    INTROSPECT = RateLimitPolicy("introspect", limit=600, period=60, key="sub")
 
-    # 일반 API: 분당 100회
-    API = {"max_requests": 100, "window_seconds": 60}
+    # 일반 API: 분당 100회 (유저 기준)
+    API = RateLimitPolicy("api", limit=100, period=60, key="sub")
@@ -0,0 +1,405 @@
+import asyncio
+import fcntl
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from urllib.parse import urlparse
+
+from app.config import settings
+
+
+class RateLimitBackendError(Exception):
+    """Rate limit 저장소 접근 실패 (네트워크 오류, 프로토콜 오류 등)"""
+
+
+def gcra_update(
+    tat: Optional[float],
+    now: float,
+    interval: float,
+    tolerance: float,
+) -> Tuple[bool, float]:
+    """
+    GCRA(Generic Cell Rate Algorithm) 1회 판정
+
+    Args:
+        tat: 저장된 TAT(theoretical arrival time). 없으면 None
+        now: 현재 시각
+        interval: 요청 1개당 배출 간격 (period / limit)
+        tolerance: 허용 버스트 (interval * burst)
+
+    Returns:
+        (허용 여부, 판정 후 TAT). 거부 시 TAT는 변하지 않음
+    """
+    if tat is None or tat < now:
+        tat = now
+    new_tat = tat + interval
+    # burst번째 요청은 new_tat - tolerance == now 경계. 부동소수 오차로 거부되지 않도록 여유를 둠
+    if new_tat - tolerance > now + 1e-9:
+        return False, tat
+    return True, new_tat
+
+
+class RateLimitBackend(ABC):
+    """Rate limit 카운터 저장소 공통 추상 클래스"""
+
+    @abstractmethod
+    async def incr(self, key: str, window_seconds: int) -> Tuple[int, float]:
+        """
+        고정 윈도우 카운터를 원자적으로 1 증가
+
+        Returns:
+            (현재 윈도우 내 요청 수, 윈도우 종료까지 남은 초)
+        """
+        ...
+
+    @abstractmethod
+    async def gcra(self, key: str, interval: float, tolerance: float) -> Tuple[bool, float]:
+        """
+        키의 TAT 하나로 GCRA 판정 후 원자적으로 갱신
+
+        Returns:
+            (허용 여부, 판정 후 TAT - 현재 시각)
+        """
+        ...
+
+    async def close(self):
+        """연결/파일 등 리소스 정리"""
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    프로세스 메모리 저장소 (단일 워커 전용)
+
+    - 만료: (만료 시각, key) min-heap으로 만료된 엔트리만 꺼내 정리 (전체 스캔 없음)
+    - 용량: 최대 max_keys개 키 유지, 초과 시 가장 오래 사용하지 않은 키 제거 (LRU)
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # {key: (value, expires_at)} - LRU 순서 유지. value는 윈도우 요청 수 또는 GCRA TAT
+        self._entries: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        # [(expires_at, key)] - 키 삽입 시 1개 push, 만료 시각이 늦춰진 키는 꺼낼 때 다시 예약
+        self._expiry: List[Tuple[float, str]] = []
+
+    def _cleanup_old_entries(self, now: float):
+        """만료 시각이 지난 엔트리 정리 (heap 앞부분만 확인)"""
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            _, key = heapq.heappop(expiry)
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            if entry[1] <= now:
+                del self._entries[key]
+            else:
+                heapq.heappush(expiry, (entry[1], key))
+
+        # LRU로 제거된 키의 heap 항목이 쌓이면 살아있는 엔트리 기준으로 재구성
+        if len(expiry) > 2 * self.max_keys:
+            self._expiry = [(expires_at, key) for key, (_, expires_at) in self._entries.items()]
+            heapq.heapify(self._expiry)
+
+    def _set(self, key: str, value: float, expires_at: float):
+        if key not in self._entries:
+            heapq.heappush(self._expiry, (expires_at, key))
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_keys:
+            self._entries.popitem(last=False)
+
+    async def incr(self, key: str, window_seconds: int) -> Tuple[int, float]:
+        now = time.monotonic()
+        self._cleanup_old_entries(now)
+
+        entry = self._entries.get(key)
+        if entry is None or now > entry[1]:
+            self._set(key, 1, now + window_seconds)
+            return 1, float(window_seconds)
+
+        count, expires_at = entry
+        self._set(key, count + 1, expires_at)
+        return count + 1, expires_at - now
+
+    async def gcra(self, key: str, interval: float, tolerance: float) -> Tuple[bool, float]:
+        now = time.monotonic()
+        self._cleanup_old_entries(now)
+
+        entry = self._entries.get(key)
+        allowed, tat = gcra_update(entry[0] if entry else None, now, interval, tolerance)
+        if allowed:
+            # TAT가 지나면 빈 버킷과 같으므로 그때 만료
+            self._set(key, tat, tat)
+        return allowed, tat - now
+
+
+class SharedMemoryRateLimitBackend(RateLimitBackend):
+    """
+    단일 호스트 다중 프로세스 공유 저장소 (mmap 파일 + flock)
+
+    고정 크기 open-addressing 해시 테이블. 슬롯 = (key 해시, 만료 시각, count).
+    키마다 최대 max_probe개 슬롯만 확인하고, 빈 슬롯이 없으면 가장 먼저 만료되는 슬롯을 재사용.
+    """
+
+    _SLOT = struct.Struct("<QdI4x")
+
+    def __init__(self, path: str, slots: int = 65536, max_probe: int = 16):
+        self.slots = slots
+        self.max_probe = max_probe
+        size = slots * self._SLOT.size
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._mm = mmap.mmap(self._fd, size)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        # 0은 빈 슬롯 표시용
+        return int.from_bytes(digest, "little") or 1
+
+    def _find_slot(self, key_hash: int, now: float) -> Tuple[int, bool, float, int]:
+        """
+        키의 슬롯 탐색 (lock 보유 상태에서 호출)
+
+        Returns:
+            (슬롯 offset, 기존 키 여부, 만료 시각, count)
+        """
+        slot = self._SLOT
+        target = 0
+        target_expires = float("inf")
+
+        for i in range(self.max_probe):
+            offset = ((key_hash + i) % self.slots) * slot.size
+            stored_hash, expires_at, count = slot.unpack_from(self._mm, offset)
+
+            if stored_hash == key_hash:
+                return offset, True, expires_at, count
+
+            # 빈 슬롯/만료 슬롯 우선, 없으면 가장 먼저 만료되는 슬롯
+            free = 0.0 if stored_hash == 0 or expires_at <= now else expires_at
+            if free < target_expires:
+                target, target_expires = offset, free
+
+        return target, False, 0.0, 0
+
+    def _incr(self, key: str, window_seconds: int) -> Tuple[int, float]:
+        key_hash = self._hash(key)
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            now = time.time()
+            offset, found, expires_at, count = self._find_slot(key_hash, now)
+            if not found or expires_at <= now:
+                expires_at, count = now + window_seconds, 0
+            self._SLOT.pack_into(self._mm, offset, key_hash, expires_at, count + 1)
+            return count + 1, expires_at - now
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _gcra(self, key: str, interval: float, tolerance: float) -> Tuple[bool, float]:
+        key_hash = self._hash(key)
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            now = time.time()
+            # GCRA 키는 만료 시각 필드에 TAT 저장
+            offset, found, tat, _ = self._find_slot(key_hash, now)
+            allowed, tat = gcra_update(tat if found else None, now, interval, tolerance)
+            if allowed:
+                self._SLOT.pack_into(self._mm, offset, key_hash, tat, 0)
+            return allowed, tat - now
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    async def incr(self, key: str, window_seconds: int) -> Tuple[int, float]:
+        return self._incr(key, window_seconds)
+
+    async def gcra(self, key: str, interval: float, tolerance: float) -> Tuple[bool, float]:
+        return self._gcra(key, interval, tolerance)
+
+    async def close(self):
+        self._mm.close()
+        os.close(self._fd)
+
+
+class RedisReplyError(RateLimitBackendError):
+    """Redis 에러 응답 (-ERR, -NOSCRIPT 등)"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Redis 프로토콜(RESP) 저장소 (다중 호스트 공유)
+
+    - 고정 윈도우: MULTI / SET NX PX / INCR / PTTL / EXEC 를 한 번에 전송 (1 round trip)
+    - GCRA: 서버 측 Lua 스크립트(EVALSHA)로 TAT 조회/갱신 (1 round trip, 최초 1회만 EVAL)
+    """
+
+    KEY_PREFIX = "ratelimit:"
+
+    GCRA_SCRIPT = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then tat = now end
+local new_tat = tat + interval
+if new_tat - tolerance > now + 1e-9 then
+  return {0, tostring(tat - now)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return {1, tostring(new_tat - now)}
+"""
+    GCRA_SHA = hashlib.sha1(GCRA_SCRIPT.encode()).hexdigest()
+
+    def __init__(self, url: str, pool_size: int = 4, timeout: float = 1.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @staticmethod
+    def _encode(*args) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    @classmethod
+    async def _read_reply(cls, reader: asyncio.StreamReader):
+        line = await reader.readline()
+        if not line:
+            raise RateLimitBackendError("Connection closed by server")
+        prefix, body = line[:1], line[1:-2]
+
+        if prefix == b"+":
+            return body.decode()
+        if prefix == b"-":
+            # 에러 응답도 값으로 반환해 스트림 동기화를 유지
+            return RedisReplyError(body.decode())
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = await reader.readexactly(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(body)
+            if length < 0:
+                return None
+            return [await cls._read_reply(reader) for _ in range(length)]
+        raise RateLimitBackendError(f"Unexpected reply: {line!r}")
+
+    @classmethod
+    async def _read_replies(cls, reader: asyncio.StreamReader, count: int) -> list:
+        return [await cls._read_reply(reader) for _ in range(count)]
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        setup = []
+        if self.password:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            writer.write(b"".join(self._encode(*cmd) for cmd in setup))
+            for _ in setup:
+                reply = await self._read_reply(reader)
+                if isinstance(reply, RedisReplyError):
+                    writer.close()
+                    raise reply
+        return reader, writer
+
+    async def _execute(self, *commands: tuple) -> list:
+        """명령들을 한 번에 전송(pipeline)하고 응답 목록 반환"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.pool_size)
+
+        async with self._semaphore:
+            conn = self._idle.pop() if self._idle else None
+            ok = False
+            try:
+                if conn is None:
+                    conn = await asyncio.wait_for(self._connect(), self.timeout)
+                reader, writer = conn
+                writer.write(b"".join(self._encode(*cmd) for cmd in commands))
+                replies = await asyncio.wait_for(
+                    self._read_replies(reader, len(commands)),
+                    self.timeout,
+                )
+                ok = True
+                return replies
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                raise RateLimitBackendError(str(e) or type(e).__name__) from e
+            finally:
+                # 응답을 모두 읽은 연결만 재사용
+                if ok:
+                    self._idle.append(conn)
+                elif conn is not None:
+                    conn[1].close()
+
+    async def incr(self, key: str, window_seconds: int) -> Tuple[int, float]:
+        redis_key = self.KEY_PREFIX + key
+        replies = await self._execute(
+            ("MULTI",),
+            ("SET", redis_key, 0, "PX", window_seconds * 1000, "NX"),
+            ("INCR", redis_key),
+            ("PTTL", redis_key),
+            ("EXEC",),
+        )
+        result = replies[-1]
+        if not isinstance(result, list):
+            raise RateLimitBackendError(f"Transaction failed: {result}")
+        for reply in result:
+            if isinstance(reply, RedisReplyError):
+                raise reply
+        _, count, ttl_ms = result
+        return count, max(ttl_ms, 0) / 1000
+
+    async def gcra(self, key: str, interval: float, tolerance: float) -> Tuple[bool, float]:
+        args = (1, self.KEY_PREFIX + key, repr(interval), repr(tolerance))
+        (reply,) = await self._execute(("EVALSHA", self.GCRA_SHA, *args))
+        if isinstance(reply, RedisReplyError) and str(reply).startswith("NOSCRIPT"):
+            (reply,) = await self._execute(("EVAL", self.GCRA_SCRIPT, *args))
+        if isinstance(reply, RedisReplyError):
+            raise reply
+
+        allowed, tat_offset = reply
+        return bool(allowed), float(tat_offset)
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    """settings.rate_limit_backend 값에 따라 저장소 생성"""
+    if settings.rate_limit_backend == "shm":
+        return SharedMemoryRateLimitBackend(
+            settings.rate_limit_shm_path,
+            slots=settings.rate_limit_shm_slots,
+        )
+    if settings.rate_limit_backend == "redis":
+        return RedisRateLimitBackend(settings.rate_limit_redis_url)
+    return MemoryRateLimitBackend(max_keys=settings.rate_limit_max_keys)
@@ -0,0 +1,268 @@
+"""
+Access token 폐기 목록 (jti denylist)
+
+저장소는 revoked_tokens 컬렉션 (_id = jti, 토큰 exp에 TTL 삭제).
+요청 경로의 "폐기되지 않음" 판정은 인메모리 Bloom filter로 끝내고, filter가 양성일 때만
+저장소에서 확인 (오탐률 settings.revocation_filter_error_rate)
+- filter는 토큰 exp 구간(revocation_bucket_seconds)별로 나뉨. Bloom filter는 항목 삭제가 안 되므로
+  구간의 토큰이 모두 만료되면 filter를 통째로 버림
+- 다른 노드의 폐기는 sync()가 revoked_at 커서로 증분 조회해 반영 (lifespan 백그라운드 태스크)
+- 새로 알게 된 폐기는 이벤트 피드(app/core/events.py)에 revocation으로 발행
+- persistent=False(memory / sqlite backend)면 저장소 대신 프로세스 내 {jti: exp}로 확인 (단일 노드, 재시작 시 유실)
+"""
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from pymongo.errors import PyMongoError
+
+from app.config import settings
+from app.core.events import REVOCATION, event_feed
+from app.core.metrics import Counter, Gauge, registry
+from app.repositories.revocation import RevokedTokenRepository
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_CHECKS = registry.register(Counter(
+    "revocation_checks_total",
+    "Access token revocation checks (filter_negative / false_positive / revoked)",
+    ["result"],
+))
+REVOCATION_FILTERS = registry.register(Gauge(
+    "revocation_filters",
+    "Revocation Bloom filters (one per exp bucket)",
+))
+REVOCATION_FILTER_ENTRIES = registry.register(Gauge(
+    "revocation_filter_entries",
+    "Revoked jti added to the live Bloom filters",
+))
+REVOCATION_FILTER_BYTES = registry.register(Gauge(
+    "revocation_filter_bytes",
+    "Memory held by the live Bloom filters",
+))
+
+
+class BloomFilter:
+    """고정 크기 Bloom filter (오탐은 있고 미탐은 없음)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # m = -n·ln(p) / ln(2)², k = m/n·ln(2)
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _hashes(self, key: str) -> Tuple[int, int]:
+        # double hashing: 128비트 digest 하나로 k개 위치 생성
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def add(self, key: str):
+        h1, h2 = self._hashes(key)
+        for i in range(self.num_hashes):
+            pos = (h1 + i * h2) % self.num_bits
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        # 음성은 대부분 첫 몇 비트에서 판정되므로 위치를 미리 다 만들지 않음
+        h1, h2 = self._hashes(key)
+        bits, m = self._bits, self.num_bits
+        for i in range(self.num_hashes):
+            pos = (h1 + i * h2) % m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+
+def _timestamp(value: datetime) -> float:
+    """MongoDB의 naive UTC datetime → epoch 초"""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class RevocationList:
+    """
+    jti 폐기 목록의 인메모리 뷰
+    - is_revoked(): filter 음성이면 I/O 없이 False, 양성이면 저장소 확인
+    - revoke(): 저장소 기록 + 로컬 filter에 즉시 추가
+    - start() 후 sync_interval마다 저장소의 새 항목 반영 (첫 sync는 만료 전 항목 전체)
+    - persistent=False면 저장소 / sync 없이 로컬 목록만 사용
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int = 300,
+        capacity: int = 10000,
+        error_rate: float = 0.001,
+        sync_interval: float = 1.0,
+        sync_overlap: float = 5.0,
+        persistent: bool = True,
+    ):
+        self.bucket_seconds = bucket_seconds
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        # 노드 간 시계 차이 / 늦게 커밋된 쓰기를 놓치지 않도록 커서를 겹쳐서 조회
+        self.sync_overlap = sync_overlap
+        self.persistent = persistent
+        # persistent=False일 때의 폐기 목록 {jti: exp}
+        self._local: Dict[str, float] = {}
+        # {exp 구간 번호: filter}
+        self._filters: Dict[int, BloomFilter] = {}
+        self._cursor: Optional[datetime] = None
+        # 겹치는 조회 구간에서 이벤트를 중복 발행하지 않도록 최근 jti 기록 {jti: revoked_at}
+        self._recent: Dict[str, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self._negative = REVOCATION_CHECKS.labels("filter_negative")
+        self._false_positive = REVOCATION_CHECKS.labels("false_positive")
+        self._revoked = REVOCATION_CHECKS.labels("revoked")
+
+    def _bucket(self, exp: float) -> int:
+        return int(exp // self.bucket_seconds)
+
+    def add(self, jti: str, exp: float):
+        """filter에 jti 추가 (저장소 기록 없음)"""
+        bucket = self._bucket(exp)
+        bloom = self._filters.get(bucket)
+        if bloom is None:
+            bloom = self._filters[bucket] = BloomFilter(self.capacity, self.error_rate)
+        if jti not in bloom:
+            bloom.add(jti)
+
+    def might_be_revoked(self, jti: str, exp: float) -> bool:
+        bloom = self._filters.get(self._bucket(exp))
+        return bloom is not None and jti in bloom
+
+    async def is_revoked(self, payload: dict) -> bool:
+        """검증된 Access token 클레임의 폐기 여부 (jti 없는 토큰은 폐기 불가)"""
+        jti = payload.get("jti")
+        if jti is None or not self.might_be_revoked(jti, payload["exp"]):
+            self._negative.inc()
+            return False
+
+        if self.persistent:
+            revoked = await RevokedTokenRepository.is_revoked(jti)
+        else:
+            revoked = jti in self._local
+        if revoked:
+            self._revoked.inc()
+            return True
+        self._false_positive.inc()
+        return False
+
+    def _publish(self, jti: str, user_id: str, exp: float, revoked_at: datetime, notify: bool = True):
+        if jti in self._recent:
+            return
+        self._recent[jti] = revoked_at
+        if notify:
+            event_feed.publish(REVOCATION, {"jti": jti, "sub": user_id, "exp": int(exp)})
+
+    async def revoke(self, payload: dict):
+        """Access token 폐기 (exp까지 유지)"""
+        jti = payload.get("jti")
+        if jti is None:
+            return
+        if not self.persistent:
+            # sync가 없으므로 _recent 대신 로컬 목록으로 중복 발행 방지
+            if jti not in self._local:
+                self._local[jti] = payload["exp"]
+                self.add(jti, payload["exp"])
+                event_feed.publish(REVOCATION, {"jti": jti, "sub": payload["sub"], "exp": int(payload["exp"])})
+            return
+        entry = await RevokedTokenRepository.revoke(
+            jti,
+            user_id=payload["sub"],
+            expires_at=datetime.utcfromtimestamp(payload["exp"]),
+        )
+        self.add(jti, payload["exp"])
+        self._publish(jti, entry.user_id, payload["exp"], entry.revoked_at)
+
+    def expire(self):
+        """모든 토큰이 만료된 구간의 filter / 로컬 항목 제거"""
+        now = time.time()
+        current = self._bucket(now)
+        for bucket in [b for b in self._filters if b < current]:
+            del self._filters[bucket]
+        self._local = {jti: exp for jti, exp in self._local.items() if exp > now}
+
+    async def sync(self) -> int:
+        """저장소에서 커서 이후 폐기 항목을 가져와 filter에 추가. 가져온 수 반환"""
+        started = datetime.utcnow()
+        since = None if self._cursor is None else self._cursor - timedelta(seconds=self.sync_overlap)
+        entries = await RevokedTokenRepository.list_since(since)
+        for entry in entries:
+            exp = _timestamp(entry.expires_at)
+            self.add(entry.id, exp)
+            # 첫 sync(기동 시 전체 적재)는 구독자에게 새 소식이 아니므로 발행하지 않음
+            self._publish(entry.id, entry.user_id, exp, entry.revoked_at, notify=since is not None)
+
+        # entries는 revoked_at 오름차순
+        if entries:
+            latest = entries[-1].revoked_at
+            self._cursor = latest if self._cursor is None else max(self._cursor, latest)
+        elif self._cursor is None:
+            self._cursor = started
+
+        # 다음 조회 구간보다 오래된 기록은 다시 조회되지 않으므로 정리
+        horizon = self._cursor - timedelta(seconds=self.sync_overlap)
+        self._recent = {jti: at for jti, at in self._recent.items() if at >= horizon}
+        self.expire()
+        return len(entries)
+
+    async def _run(self):
+        while not self._stopping.is_set():
+            try:
+                await self.sync()
+            except PyMongoError:
+                logger.warning("Revocation list sync failed", exc_info=True)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.sync_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        # 로컬 목록은 동기화할 저장소가 없음
+        if self._task is None and self.persistent:
+            self._stopping.clear()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+    def expose_metrics(self):
+        """stats()의 값을 /metrics에 노출 (싱글톤 생성 시 1회)"""
+        REVOCATION_FILTERS.labels().set_function(lambda: self.stats()["filters"])
+        REVOCATION_FILTER_ENTRIES.labels().set_function(lambda: self.stats()["entries"])
+        REVOCATION_FILTER_BYTES.labels().set_function(lambda: self.stats()["bytes"])
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "filters": len(self._filters),
+            "entries": sum(bloom.count for bloom in self._filters.values()),
+            "bytes": sum(bloom.size_bytes for bloom in self._filters.values()),
+        }
+
+
+# 싱글톤 인스턴스
+revocation_list = RevocationList(
+    bucket_seconds=settings.revocation_bucket_seconds,
+    capacity=settings.revocation_filter_capacity,
+    error_rate=settings.revocation_filter_error_rate,
+    sync_interval=settings.revocation_sync_interval_seconds,
+    persistent=settings.mongodb_enabled,
+)
+revocation_list.expose_metrics()
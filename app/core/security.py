@@ -1,25 +1,64 @@
+import base64
 import hashlib
+import hmac
+import json
 import secrets
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePrivateKey, EllipticCurvePublicKey
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
 from cryptography.hazmat.backends import default_backend
+from jose import jwk
+from jose.backends.base import Key
 
 from app.config import settings
+# EdDSA를 python-jose에 등록
+from app.core import eddsa  # noqa: F401
+from app.core.events import KEY_ROTATION, event_feed
 
 KEYS_DIR = Path(__file__).parent.parent.parent / "keys"
 
 
-def generate_rsa_keys():
-    """RS256용 RSA 키 쌍 생성"""
+# 지원 서명 알고리즘별 키 타입
+SUPPORTED_ALGORITHMS = ("RS256", "ES256", "EdDSA")
+
+PrivateKey = Union[RSAPrivateKey, EllipticCurvePrivateKey, Ed25519PrivateKey]
+PublicKey = Union[RSAPublicKey, EllipticCurvePublicKey, Ed25519PublicKey]
+
+
+def _key_paths(algorithm: str) -> Tuple[Path, Path]:
+    """알고리즘별 키 파일 경로 (RS256은 기존 파일명 유지)"""
+    suffix = "" if algorithm == "RS256" else f"_{algorithm.lower()}"
+    return KEYS_DIR / f"private_key{suffix}.pem", KEYS_DIR / f"public_key{suffix}.pem"
+
+
+def generate_private_key(algorithm: str) -> PrivateKey:
+    """알고리즘에 맞는 새 private key 생성"""
+    if algorithm == "RS256":
+        return rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=2048,
+            backend=default_backend()
+        )
+    if algorithm == "ES256":
+        return ec.generate_private_key(ec.SECP256R1(), backend=default_backend())
+    if algorithm == "EdDSA":
+        return Ed25519PrivateKey.generate()
+    raise ValueError(f"Unsupported JWT algorithm: {algorithm}")
+
+
+def generate_keys(algorithm: str = "RS256"):
+    """알고리즘별 키 쌍 생성 후 keys/에 저장"""
     KEYS_DIR.mkdir(exist_ok=True)
+    private_path, public_path = _key_paths(algorithm)
 
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048,
-        backend=default_backend()
-    )
+    private_key = generate_private_key(algorithm)
 
     # Private key 저장
     private_pem = private_key.private_bytes(
@@ -27,7 +66,7 @@ def generate_rsa_keys():
         format=serialization.PrivateFormat.PKCS8,
         encryption_algorithm=serialization.NoEncryption()
     )
-    (KEYS_DIR / "private_key.pem").write_bytes(private_pem)
+    private_path.write_bytes(private_pem)
 
     # Public key 저장
     public_key = private_key.public_key()
@@ -35,7 +74,12 @@ def generate_rsa_keys():
         encoding=serialization.Encoding.PEM,
         format=serialization.PublicFormat.SubjectPublicKeyInfo
     )
-    (KEYS_DIR / "public_key.pem").write_bytes(public_pem)
+    public_path.write_bytes(public_pem)
+
+
+def generate_rsa_keys():
+    """RS256용 RSA 키 쌍 생성"""
+    generate_keys("RS256")
 
 
 @lru_cache(maxsize=1)
@@ -43,14 +87,14 @@ def load_private_key() -> str:
     """
     Private key 로드 (최초 1회만 읽고 캐싱)
     1순위: settings.jwt_private_key (환경 변수)
-    2순위: keys/private_key.pem 파일 (없으면 자동 생성)
+    2순위: keys/private_key.pem 파일 (RS256 외 알고리즘은 private_key_<alg>.pem, 없으면 자동 생성)
     """
     if settings.jwt_private_key:
         return settings.jwt_private_key
 
-    key_path = KEYS_DIR / "private_key.pem"
+    key_path, _ = _key_paths(settings.jwt_algorithm)
     if not key_path.exists():
-        generate_rsa_keys()
+        generate_keys(settings.jwt_algorithm)
     return key_path.read_text()
 
 
@@ -59,17 +103,210 @@ def load_public_key() -> str:
     """
     Public key 로드 (최초 1회만 읽고 캐싱)
     1순위: settings.jwt_public_key (환경 변수)
-    2순위: keys/public_key.pem 파일 (없으면 자동 생성)
+    2순위: keys/public_key.pem 파일 (RS256 외 알고리즘은 public_key_<alg>.pem, 없으면 자동 생성)
     """
     if settings.jwt_public_key:
         return settings.jwt_public_key
 
-    key_path = KEYS_DIR / "public_key.pem"
+    _, key_path = _key_paths(settings.jwt_algorithm)
     if not key_path.exists():
-        generate_rsa_keys()
+        generate_keys(settings.jwt_algorithm)
     return key_path.read_text()
 
 
+@lru_cache(maxsize=1)
+def load_signing_key() -> PrivateKey:
+    """
+    서명용 Private key 객체 로드 (PEM 파싱은 프로세스당 1회)
+    매 서명마다 PEM 문자열을 다시 파싱하지 않도록 cryptography 키 객체를 캐싱
+    """
+    return serialization.load_pem_private_key(
+        load_private_key().encode(),
+        password=None,
+        backend=default_backend()
+    )
+
+
+@lru_cache(maxsize=1)
+def load_verification_key() -> PublicKey:
+    """검증용 Public key 객체 로드 (PEM 파싱은 프로세스당 1회)"""
+    return serialization.load_pem_public_key(
+        load_public_key().encode(),
+        backend=default_backend()
+    )
+
+
+def int_to_base64url(n: int) -> str:
+    """정수를 JWK용 Base64url 문자열로 인코딩"""
+    byte_length = (n.bit_length() + 7) // 8
+    return base64.urlsafe_b64encode(
+        n.to_bytes(byte_length, byteorder='big')
+    ).rstrip(b'=').decode('ascii')
+
+
+def _bytes_to_base64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def key_algorithm(public_key: PublicKey) -> str:
+    """공개키 타입에 대응하는 서명 알고리즘"""
+    if isinstance(public_key, RSAPublicKey):
+        return "RS256"
+    if isinstance(public_key, EllipticCurvePublicKey) and isinstance(public_key.curve, ec.SECP256R1):
+        return "ES256"
+    if isinstance(public_key, Ed25519PublicKey):
+        return "EdDSA"
+    raise ValueError(f"Unsupported public key type: {type(public_key).__name__}")
+
+
+def public_jwk(public_key: PublicKey) -> Dict[str, str]:
+    """
+    공개키의 JWK 필수 멤버 (RFC 7638 thumbprint 입력과 동일)
+    RSA: kty/n/e, EC: kty/crv/x/y (RFC 7518), OKP: kty/crv/x (RFC 8037)
+    """
+    if isinstance(public_key, RSAPublicKey):
+        numbers = public_key.public_numbers()
+        return {"kty": "RSA", "n": int_to_base64url(numbers.n), "e": int_to_base64url(numbers.e)}
+    if isinstance(public_key, EllipticCurvePublicKey):
+        numbers = public_key.public_numbers()
+        size = (public_key.curve.key_size + 7) // 8
+        return {
+            "kty": "EC",
+            "crv": "P-256",
+            "x": _bytes_to_base64url(numbers.x.to_bytes(size, byteorder='big')),
+            "y": _bytes_to_base64url(numbers.y.to_bytes(size, byteorder='big')),
+        }
+    if isinstance(public_key, Ed25519PublicKey):
+        raw = public_key.public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw,
+        )
+        return {"kty": "OKP", "crv": "Ed25519", "x": _bytes_to_base64url(raw)}
+    raise ValueError(f"Unsupported public key type: {type(public_key).__name__}")
+
+
+def key_id(public_key: PublicKey) -> str:
+    """RFC 7638 JWK thumbprint (노드 간 설정 없이 같은 키는 같은 kid)"""
+    canonical = json.dumps(public_jwk(public_key), separators=(",", ":"), sort_keys=True)
+    digest = hashlib.sha256(canonical.encode()).digest()
+    return _bytes_to_base64url(digest)
+
+
+@dataclass
+class RingKey:
+    public_key: PublicKey
+    algorithm: str
+    verifier: Key
+    # None이면 만료 없음 (활성 키 또는 설정으로 등록된 retired 키)
+    retire_until: Optional[datetime] = None
+
+
+class KeyRing:
+    """
+    서명/검증 키 모음
+    - 활성 서명 키 1개 (발급 토큰 헤더에 kid 포함)
+    - 검증 전용 retired 키: 로테이션 전에 발급된 토큰이 만료될 때까지 유지
+    검증 키는 kid로 dict 조회 (키 개수와 무관하게 O(1))
+    키마다 알고리즘을 따로 가지므로 RS256 → ES256/EdDSA 전환 중에도 이전 토큰 검증 가능
+    """
+
+    def __init__(self, private_key: PrivateKey, public_key: PublicKey, algorithm: str):
+        self._keys: Dict[str, RingKey] = {}
+        self._activate(private_key, public_key, algorithm)
+
+    def _activate(self, private_key: PrivateKey, public_key: PublicKey, algorithm: str):
+        if key_algorithm(public_key) != algorithm:
+            raise ValueError(
+                f"JWT algorithm {algorithm} does not match key type {type(public_key).__name__}"
+            )
+        self.algorithm = algorithm
+        self.active_kid = self.add_verification_key(public_key)
+        self.signer = jwk.construct(private_key, algorithm)
+
+    def add_verification_key(
+        self,
+        public_key: PublicKey,
+        retire_until: Optional[datetime] = None
+    ) -> str:
+        """검증 전용 키 등록 (알고리즘은 키 타입으로 결정). kid 반환"""
+        kid = key_id(public_key)
+        algorithm = key_algorithm(public_key)
+        self._keys[kid] = RingKey(
+            public_key=public_key,
+            algorithm=algorithm,
+            verifier=jwk.construct(public_key, algorithm),
+            retire_until=retire_until,
+        )
+        return kid
+
+    def rotate(self, private_key: PrivateKey) -> str:
+        """
+        새 키로 서명 시작. 이전 활성 키는 마지막 발급 토큰이 만료될 때까지 검증용으로 유지.
+        새 키 타입이 다르면 서명 알고리즘도 함께 전환. 이벤트 피드에 key_rotation 발행. 새 kid 반환
+
+        내부용 (프로세스 하나의 키 링만 바뀌므로 API / CLI로 노출하지 않음).
+        운영 로테이션은 JWT_PRIVATE_KEY / JWT_RETIRED_PUBLIC_KEYS 변경 후 재시작 (README 키 로테이션)
+        """
+        previous = self._keys[self.active_kid]
+        previous.retire_until = datetime.utcnow() + timedelta(
+            minutes=settings.access_token_expire_minutes
+        )
+        previous_kid = self.active_kid
+        public_key = private_key.public_key()
+        self._activate(private_key, public_key, key_algorithm(public_key))
+        event_feed.publish(KEY_ROTATION, {
+            "kid": self.active_kid,
+            "alg": self.algorithm,
+            "previous_kid": previous_kid,
+            "previous_retire_until": previous.retire_until.isoformat(),
+        })
+        return self.active_kid
+
+    def get_key(self, kid: Optional[str]) -> Optional[RingKey]:
+        """kid의 검증 키 항목. kid가 없으면(로테이션 도입 전 토큰) 활성 키"""
+        kid = kid or self.active_kid
+        entry = self._keys.get(kid)
+        if entry is None:
+            return None
+        if entry.retire_until is not None and entry.retire_until <= datetime.utcnow():
+            del self._keys[kid]
+            return None
+        return entry
+
+    def get_verifier(self, kid: Optional[str]) -> Optional[Key]:
+        """kid의 검증 키. kid가 없으면 활성 키"""
+        entry = self.get_key(kid)
+        return entry.verifier if entry else None
+
+    def public_keys(self) -> List[Tuple[str, RingKey]]:
+        """아직 유효한 공개키 목록 (활성 키 먼저)"""
+        now = datetime.utcnow()
+        expired = [
+            kid for kid, entry in self._keys.items()
+            if entry.retire_until is not None and entry.retire_until <= now
+        ]
+        for kid in expired:
+            del self._keys[kid]
+
+        kids = [self.active_kid] + [kid for kid in self._keys if kid != self.active_kid]
+        return [(kid, self._keys[kid]) for kid in kids]
+
+
+@lru_cache(maxsize=1)
+def get_key_ring() -> KeyRing:
+    """
+    프로세스 키 링 (최초 1회 생성)
+    활성 키: load_signing_key / load_verification_key (settings.jwt_algorithm)
+    retired 키: settings.jwt_retired_public_keys (이전 공개키 PEM 목록, RSA/EC/Ed25519 혼용 가능)
+    """
+    ring = KeyRing(load_signing_key(), load_verification_key(), settings.jwt_algorithm)
+    for pem in settings.jwt_retired_public_keys:
+        ring.add_verification_key(
+            serialization.load_pem_public_key(pem.encode(), backend=default_backend())
+        )
+    return ring
+
+
 def hash_token(token: str) -> str:
     """토큰 해싱 (DB 저장용)"""
     return hashlib.sha256(token.encode()).hexdigest()
@@ -78,3 +315,45 @@ def hash_token(token: str) -> str:
 def generate_refresh_token() -> str:
     """랜덤 refresh token 생성"""
     return secrets.token_urlsafe(32)
+
+
+def generate_client_secret() -> str:
+    """랜덤 client secret 생성 (등록 시 1회만 노출)"""
+    return secrets.token_urlsafe(32)
+
+
+def _scrypt(secret: str, salt: bytes, n: int, r: int, p: int, dklen: int = 32) -> bytes:
+    # 필요 메모리 약 128·n·r·p 바이트 (기본 maxmem 32MiB를 넘는 파라미터도 허용)
+    return hashlib.scrypt(
+        secret.encode(), salt=salt, n=n, r=r, p=p, dklen=dklen,
+        maxmem=128 * n * r * p + 1024 * 1024,
+    )
+
+
+def _base64url_to_bytes(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def hash_client_secret(secret: str) -> str:
+    """
+    client secret 저장용 scrypt 해시 ("scrypt$n$r$p$salt$hash")
+    의도적으로 느린 해시이므로 요청 경로에서는 스레드에서 실행
+    """
+    n, r, p = settings.client_secret_scrypt_n, 8, 1
+    salt = secrets.token_bytes(16)
+    digest = _scrypt(secret, salt, n, r, p)
+    return f"scrypt${n}${r}${p}${_bytes_to_base64url(salt)}${_bytes_to_base64url(digest)}"
+
+
+def verify_client_secret(secret: str, stored: str) -> bool:
+    """hash_client_secret 결과와 비교 (저장 당시 파라미터 사용)"""
+    try:
+        scheme, n, r, p, salt, expected = stored.split("$")
+    except ValueError:
+        return False
+    if scheme != "scrypt":
+        return False
+
+    expected_bytes = _base64url_to_bytes(expected)
+    digest = _scrypt(secret, _base64url_to_bytes(salt), int(n), int(r), int(p), len(expected_bytes))
+    return hmac.compare_digest(digest, expected_bytes)
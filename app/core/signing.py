@@ -0,0 +1,101 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from app.config import settings
+from app.core.jwt import sign_token
+
+
+def _sign_batch(payloads: List[dict]) -> List[object]:
+    """executor 스레드에서 실행. 항목별 토큰 또는 예외 반환"""
+    results: List[object] = []
+    for payload in payloads:
+        try:
+            results.append(sign_token(payload))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _resolve(batch: List[Tuple[dict, asyncio.Future]], done: asyncio.Future):
+    error = done.exception()
+    results = [error] * len(batch) if error else done.result()
+    for (_, future), result in zip(batch, results):
+        if future.done():
+            continue
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+class TokenSigner:
+    """
+    JWT 서명을 이벤트 루프 밖(전용 스레드 풀)에서 실행
+
+    - micro-batch: 같은 루프 반복 안에 들어온 서명 요청을 모아 worker 수만큼 나눈 executor 작업으로 처리
+      (최대 max_batch개, 초과 시 즉시 전송. 서명 중에는 GIL이 풀리므로 worker끼리 병렬 실행)
+    - backpressure: 처리 중/대기 중 서명은 최대 max_pending개, 초과 요청은 슬롯이 빌 때까지 대기
+    """
+
+    def __init__(self, max_workers: int = 2, max_batch: int = 32, max_pending: int = 1024):
+        self.max_workers = max_workers
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._batch: List[Tuple[dict, asyncio.Future]] = []
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="jwt-sign",
+            )
+        return self._executor
+
+    async def sign(self, payload: dict) -> str:
+        """payload를 서명한 JWT 반환"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._batch.append((payload, future))
+
+            if len(self._batch) >= self.max_batch:
+                self._flush()
+            elif len(self._batch) == 1:
+                # 현재 루프 반복에서 들어오는 요청까지 모은 뒤 전송
+                loop.call_soon(self._flush)
+
+            return await future
+
+    def _flush(self):
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        # 작업 1개로 보내면 나머지 worker가 놀게 되므로 worker 수만큼 나눔
+        size = -(-len(batch) // self.max_workers)
+        for start in range(0, len(batch), size):
+            chunk = batch[start:start + size]
+            job = loop.run_in_executor(executor, _sign_batch, [p for p, _ in chunk])
+            job.add_done_callback(functools.partial(_resolve, chunk))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 싱글톤 인스턴스
+token_signer = TokenSigner(
+    max_workers=settings.jwt_sign_workers,
+    max_batch=settings.jwt_sign_max_batch,
+    max_pending=settings.jwt_sign_max_pending,
+)
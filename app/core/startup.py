@@ -0,0 +1,111 @@
+"""
+기동 시간 프로파일
+
+- StartupProfile: lifespan 단계별 소요 시간 (settings.startup_profile이면 기동 직후 stderr 출력)
+- import_profile(): python -X importtime 결과를 패키지 / app 모듈별 self 시간으로 집계
+
+실행 (import 시간 + lifespan 단계, --lifespan은 MongoDB 연결 필요):
+    python -m app.core.startup [--lifespan]
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+
+class StartupProfile:
+    """lifespan 단계 이름 → 소요 시간(ms). 기록 순서 유지"""
+
+    def __init__(self):
+        self.steps: Dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = (time.perf_counter() - start) * 1000
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.steps.values())
+
+    def report(self) -> str:
+        lines = [f"lifespan {self.total_ms:8.1f} ms"]
+        lines.extend(f"  {name:<20} {ms:8.1f} ms" for name, ms in self.steps.items())
+        return "\n".join(lines)
+
+
+# 싱글톤 인스턴스
+startup_profile = StartupProfile()
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int]]:
+    """-X importtime 출력 → [(모듈, self µs, cumulative µs)]"""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def import_profile(module: str = "app.main") -> List[Tuple[str, int, int]]:
+    """새 인터프리터에서 module을 import하며 측정 (현재 프로세스의 import 캐시 영향 없음)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=os.environ,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return parse_importtime(result.stderr)
+
+
+def summarize_imports(rows: List[Tuple[str, int, int]]) -> Dict[str, Dict[str, float]]:
+    """최상위 패키지별 / app 모듈별 self 시간 (ms)"""
+    packages: Dict[str, float] = defaultdict(float)
+    app_modules: Dict[str, float] = {}
+    for module, self_us, _ in rows:
+        packages[module.split(".")[0]] += self_us / 1000
+        if module == "app" or module.startswith("app."):
+            app_modules[module] = self_us / 1000
+    return {"packages": dict(packages), "app": app_modules}
+
+
+def _top(values: Dict[str, float], limit: int) -> List[str]:
+    ranked = sorted(values.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return [f"  {name:<40} {ms:8.1f} ms" for name, ms in ranked]
+
+
+async def _profile_lifespan():
+    from app.main import app, lifespan
+
+    async with lifespan(app):
+        pass
+
+
+def _main(argv: List[str]) -> int:
+    rows = import_profile()
+    summary = summarize_imports(rows)
+    total = sum(summary["packages"].values())
+    print(f"import app.main {total:8.1f} ms")
+    print("\n".join(_top(summary["packages"], 15)))
+    print("app modules")
+    print("\n".join(_top(summary["app"], 15)))
+
+    if "--lifespan" in argv:
+        asyncio.run(_profile_lifespan())
+        print(startup_profile.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -0,0 +1,65 @@
+import hashlib
+from typing import Optional
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.exceptions import InvalidCredentialsException
+from app.core.jwt import decode_access_token
+from app.core.revocation import revocation_list
+
+
+class TokenCache(TTLCache):
+    """
+    검증된 Access token 페이로드 인메모리 LRU 캐시
+    - 키: 토큰의 SHA-256 digest (토큰 원문은 보관하지 않음)
+    - 만료: min(토큰 exp, 저장 시각 + ttl_seconds)
+    """
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        """캐시된 페이로드 반환. 없거나 만료되었으면 None."""
+        return super().get(self._key(token))
+
+    def peek(self, token: str) -> Optional[dict]:
+        """통계에 잡히지 않는 조회 (rate limiter 등 인증 외 경로)"""
+        return super().peek(self._key(token))
+
+    def put(self, token: str, payload: dict):
+        """검증된 페이로드 저장 (exp 없는 토큰은 캐싱하지 않음)"""
+        exp = payload.get("exp")
+        if exp is None:
+            return
+        super().put(self._key(token), payload, expires_at=float(exp))
+
+    def invalidate(self, token: str):
+        super().invalidate(self._key(token))
+
+
+# 싱글톤 인스턴스
+token_cache = TokenCache(
+    max_size=settings.token_cache_max_size,
+    ttl_seconds=settings.token_cache_ttl_seconds,
+)
+token_cache.expose_metrics("token")
+
+
+async def verify_access_token(token: str) -> dict:
+    """
+    Access token 검증 (token_cache 경유) + 폐기 여부 확인. 실패 시 예외 발생.
+    같은 토큰의 반복 검증은 서명 검증 생략. 폐기 확인은 캐시 적중 시에도 수행
+    """
+    if not settings.token_cache_enabled:
+        payload = decode_access_token(token)
+    else:
+        payload = token_cache.get(token)
+        if payload is None:
+            payload = decode_access_token(token)
+            token_cache.put(token, payload)
+
+    if settings.revocation_enabled and await revocation_list.is_revoked(payload):
+        token_cache.invalidate(token)
+        raise InvalidCredentialsException("Token has been revoked")
+    return payload
@@ -0,0 +1,75 @@
+"""
+refresh token compaction
+
+rotation마다 기존 토큰은 revoked: True로 남으므로, 주기적으로 폐기된 토큰을 batch 단위로 삭제하고
+만료된 토큰(bucketed 저장소는 지난 구간 컬렉션)을 정리해 저장소 크기를 살아 있는 세션 수에 맞춤
+"""
+import asyncio
+import logging
+import sqlite3
+from typing import Dict, Optional
+
+from pymongo.errors import PyMongoError
+
+from app.config import settings
+from app.core.metrics import Counter, registry
+from app.repositories.token import RefreshTokenRepository
+
+logger = logging.getLogger(__name__)
+
+REFRESH_TOKENS_REMOVED = registry.register(Counter(
+    "refresh_tokens_removed_total",
+    "Refresh tokens removed by the compactor",
+    ["reason"],
+))
+
+
+class TokenCompactor:
+    """interval마다 purge_expired + compact 실행 (lifespan에서 시작 / 종료)"""
+
+    def __init__(self, interval: float = 60.0, batch_size: int = 1000):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self._expired = REFRESH_TOKENS_REMOVED.labels("expired")
+        self._revoked = REFRESH_TOKENS_REMOVED.labels("revoked")
+
+    async def run_once(self) -> Dict[str, int]:
+        expired = await RefreshTokenRepository.purge_expired()
+        revoked = await RefreshTokenRepository.compact(self.batch_size)
+        self._expired.inc(expired)
+        self._revoked.inc(revoked)
+        return {"expired": expired, "revoked": revoked}
+
+    async def _run(self):
+        # batch 삭제 도중 취소하지 않도록 이벤트로 종료
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                return
+            try:
+                await self.run_once()
+            except (PyMongoError, sqlite3.Error):
+                logger.warning("Refresh token compaction failed", exc_info=True)
+
+    def start(self):
+        if self._task is None and self.interval > 0:
+            self._stopping.clear()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+
+# 싱글톤 인스턴스
+token_compactor = TokenCompactor(
+    interval=settings.refresh_token_compact_interval_seconds,
+    batch_size=settings.refresh_token_compact_batch_size,
+)
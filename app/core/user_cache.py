@@ -0,0 +1,43 @@
+import asyncio
+import logging
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.database import get_db
+
+logger = logging.getLogger(__name__)
+
+# change stream 미지원 (standalone mongod). 재시도해도 같으므로 구독 중단
+_CHANGE_STREAM_UNSUPPORTED = 40573
+
+# UserInDB read-through 캐시 (키: user id)
+user_cache = TTLCache(
+    max_size=settings.user_cache_max_size,
+    ttl_seconds=settings.user_cache_ttl_seconds,
+)
+user_cache.expose_metrics("user")
+
+
+async def watch_user_changes(retry_seconds: float = 5.0):
+    """
+    users 컬렉션 change stream을 구독해 다른 노드에서 변경된 유저도 캐시에서 제거
+    (replica set / MongoDB Cloud 필요, lifespan에서 백그라운드 태스크로 실행)
+    standalone이면 경고 1회 후 종료 (캐시는 TTL로만 만료)
+    """
+    while True:
+        try:
+            async with get_db().users.watch() as stream:
+                async for change in stream:
+                    doc_id = change.get("documentKey", {}).get("_id")
+                    if doc_id is not None:
+                        user_cache.invalidate(str(doc_id))
+        except PyMongoError as e:
+            if isinstance(e, OperationFailure) and e.code == _CHANGE_STREAM_UNSUPPORTED:
+                logger.warning("Change streams are not supported by this deployment; user cache relies on TTL only")
+                return
+            # 연결이 끊긴 동안 놓친 변경이 있을 수 있으므로 전체 비움
+            logger.warning("User change stream interrupted, retrying", exc_info=True)
+            user_cache.clear()
+            await asyncio.sleep(retry_seconds)
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import sys
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
@@ -6,12 +8,27 @@ from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from pymongo.errors import PyMongoError
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.config import settings
-from app.core.database import connect_db, close_db
+from app.core.audit import audit_sink
+from app.core.database import close_db, connect_db, get_db, ping, pool_stats, warm_pool
 from app.core.exceptions import AuthException, ErrorCode
-from app.routers import auth, jwks
+from app.core.indexes import drop_obsolete_indexes, reconcile_indexes, reconcile_indexes_in_background
+from app.core.jwt import get_jwks_response
+from app.core.logging import shutdown_logging, start_logging
+from app.core.metrics import MetricsMiddleware
+from app.core.oauth import prefetch_metadata
+from app.core.rate_limit import rate_limiter, RateLimitHeadersMiddleware
+from app.core.revocation import revocation_list
+from app.core.security import get_key_ring
+from app.core.signing import token_signer
+from app.core.startup import startup_profile
+from app.core.token_compaction import token_compactor
+from app.core.user_cache import watch_user_changes
+from app.repositories.backends import get_storage
+from app.routers import auth, events, jwks, metrics
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +55,59 @@ def _build_error_response(
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await connect_db()
+    step = startup_profile.step
+    background = []
+    with step("logging"):
+        start_logging()
+    with step("keys"):
+        # 서명 키 로드(없으면 생성)와 JWKS 직렬화를 첫 요청 전에 처리
+        get_key_ring()
+        get_jwks_response()
+    # memory / sqlite backend는 MongoDB 없이 기동
+    if settings.mongodb_enabled:
+        with step("connect_db"):
+            await connect_db()
+        with step("warm_pool"):
+            # 첫 요청이 TLS / 핸드셰이크 비용을 내지 않도록 min_pool_size까지 미리 연결
+            await warm_pool()
+    with step("storage"):
+        await get_storage().connect()
+    if settings.mongodb_enabled:
+        with step("indexes"):
+            # 남아 있으면 쓰기가 실패하는 인덱스는 요청 수신 전에 삭제 (skip / background 모드도 기다림)
+            await drop_obsolete_indexes(get_db())
+            if settings.index_reconcile == "blocking":
+                await reconcile_indexes(get_db())
+            elif settings.index_reconcile == "background":
+                background.append(asyncio.create_task(reconcile_indexes_in_background(get_db())))
+    # Google OpenID 메타데이터 (첫 로그인 요청이 기다리지 않도록)
+    background.append(asyncio.create_task(prefetch_metadata()))
+    with step("background_tasks"):
+        if settings.mongodb_enabled:
+            audit_sink.start()
+        # 다른 노드에서 폐기된 Access token을 filter에 반영 (mongodb backend만, 아니면 프로세스 내 목록)
+        if settings.revocation_enabled:
+            revocation_list.start()
+        # 폐기 / 만료된 refresh token 일괄 삭제
+        token_compactor.start()
+        # 다른 노드의 유저 변경을 캐시에 반영 (mongodb backend만)
+        if settings.user_cache_change_stream and settings.mongodb_enabled:
+            background.append(asyncio.create_task(watch_user_changes()))
+    if settings.startup_profile:
+        print(startup_profile.report(), file=sys.stderr)
     yield
+    for task in background:
+        task.cancel()
+    token_signer.shutdown()
+    await rate_limiter.backend.close()
+    await revocation_list.stop()
+    await token_compactor.stop()
+    # 버퍼에 남은 감사 이벤트 저장 후 연결 종료
+    if settings.mongodb_enabled:
+        await audit_sink.stop()
+    await get_storage().close()
     await close_db()
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -112,9 +179,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# RateLimit-* 응답 헤더
+app.add_middleware(RateLimitHeadersMiddleware)
+
+# 라우트별 요청 지연 (가장 바깥에서 측정)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(jwks.router)
+app.include_router(events.router)
+if settings.metrics_enabled:
+    app.include_router(metrics.router)
 
 
 @app.get("/health")
@@ -122,6 +199,22 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """트래픽 수신 가능 여부 (MongoDB ping + 연결 풀 상태). /health는 프로세스 생존만 확인"""
+    if not settings.mongodb_enabled:
+        return {"status": "ready", "storage": settings.repository_backend}
+    mongodb = {"pool": pool_stats.snapshot()}
+    try:
+        mongodb["ping_ms"] = round(
+            await asyncio.wait_for(ping(), settings.readiness_timeout_seconds), 3
+        )
+    except (PyMongoError, ConnectionError, asyncio.TimeoutError) as e:
+        mongodb["error"] = type(e).__name__
+        return JSONResponse(status_code=503, content={"status": "unavailable", "mongodb": mongodb})
+    return {"status": "ready", "mongodb": mongodb}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
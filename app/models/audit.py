@@ -0,0 +1,17 @@
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
+from typing import Optional
+
+
+class AuditEventInDB(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = Field(alias="_id")
+    event: str
+    success: bool
+    user_id: Optional[str] = None
+    email: Optional[str] = None
+    client_id: Optional[str] = None
+    ip: Optional[str] = None
+    detail: Optional[str] = None
+    created_at: datetime
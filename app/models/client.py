@@ -0,0 +1,20 @@
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
+from typing import List
+
+
+class ClientInDB(BaseModel):
+    """client_credentials grant용 머신 클라이언트 (_id = client_id)"""
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = Field(alias="_id")
+    name: str
+    secret_hash: str
+    scopes: List[str] = []
+    disabled: bool = False
+    created_at: datetime
+
+
+class ClientCreate(BaseModel):
+    name: str
+    scopes: List[str] = []
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
+
+
+class RevokedTokenInDB(BaseModel):
+    """폐기된 Access token (_id = jti, expires_at = 토큰 exp)"""
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = Field(alias="_id")
+    user_id: str
+    expires_at: datetime
+    revoked_at: datetime
@@ -0,0 +1,31 @@
+from typing import List
+
+from pymongo import DESCENDING
+
+from app.core.database import get_db
+from app.core.metrics import observe_repository
+from app.models.audit import AuditEventInDB
+from app.repositories.base import BaseRepository
+
+
+class AuditEventRepository(BaseRepository):
+    @staticmethod
+    def _collection():
+        return get_db().audit_events
+
+    @classmethod
+    @observe_repository
+    async def insert_many(cls, events: List[dict]) -> int:
+        """
+        이벤트 일괄 저장 (unordered: 일부 문서가 실패해도 나머지는 계속 기록)
+        저장된 문서 수 반환
+        """
+        result = await cls._collection().insert_many(events, ordered=False)
+        return len(result.inserted_ids)
+
+    @classmethod
+    @observe_repository
+    async def list_for_user(cls, user_id: str, limit: int = 50) -> List[AuditEventInDB]:
+        """유저의 최근 이벤트 (최신순)"""
+        cursor = cls._collection().find({"user_id": user_id}).sort("created_at", DESCENDING).limit(limit)
+        return [cls._doc_to_model(doc, AuditEventInDB) async for doc in cursor]
@@ -0,0 +1,970 @@
+"""
+User / RefreshToken / Client 저장소 backend
+
+UserRepository / RefreshTokenRepository / ClientRepository는 settings.repository_backend로 선택한
+backend의 store에 위임 (캐시 무효화, 모델 변환, 메트릭은 리포지토리에서 처리)
+- mongodb: Motor (기본). 만료 refresh token은 TTL 인덱스로 삭제
+- memory: 프로세스 내 dict + 보조 인덱스 (테스트 / 벤치마크 / 단일 프로세스, 재시작 시 유실)
+- sqlite: 단일 파일 (소규모 edge 배포). aiosqlite 대신 표준 라이브러리 sqlite3를 전용 스레드에서 실행
+  (새 의존성 없음). consume이 UPDATE ... RETURNING을 쓰므로 SQLite 3.35 이상 필요 (connect 시 확인)
+
+store는 "_id"가 str인 dict를 주고받고, unique 제약(users.email, refresh_tokens.token_hash)
+위반은 backend와 무관하게 pymongo DuplicateKeyError로 알림
+"""
+import asyncio
+import copy
+import heapq
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Dict, List, Optional, Set, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from pymongo.results import DeleteResult, UpdateResult
+
+from app.config import settings
+from app.core.database import get_db
+from app.core.indexes import REFRESH_TOKEN_INDEXES
+
+
+class UserStore(ABC):
+    @abstractmethod
+    async def insert(self, doc: dict) -> str:
+        """유저 저장 후 id 반환. email 중복이면 DuplicateKeyError"""
+        ...
+
+    @abstractmethod
+    async def find_by_id(self, user_id: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def find_by_google_id(self, google_id: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def update(self, user_id: str, fields: dict):
+        """필드 변경 (없는 id면 무시)"""
+        ...
+
+    @abstractmethod
+    async def delete(self, user_id: str) -> bool:
+        ...
+
+
+class RefreshTokenStore(ABC):
+    @abstractmethod
+    async def insert(self, doc: dict) -> str:
+        """토큰 저장 후 id 반환. token_hash 중복이면 DuplicateKeyError"""
+        ...
+
+    @abstractmethod
+    async def find_by_id(self, token_id: str) -> Optional[dict]:
+        """폐기 여부와 무관하게 id로 조회"""
+        ...
+
+    @abstractmethod
+    async def find_active(self, token_hash: str) -> Optional[dict]:
+        """폐기되지 않은 토큰"""
+        ...
+
+    @abstractmethod
+    async def consume(self, token_hash: str) -> Optional[dict]:
+        """폐기되지 않은 토큰을 원자적으로 폐기하고 폐기 전 문서 반환"""
+        ...
+
+    @abstractmethod
+    async def revoke(self, token_hash: str) -> bool:
+        """폐기 상태가 바뀌었으면 True"""
+        ...
+
+    @abstractmethod
+    async def revoke_all_for_user(self, user_id: str) -> int:
+        """새로 폐기된 토큰 수"""
+        ...
+
+    @abstractmethod
+    async def purge_expired(self, now: Optional[datetime] = None) -> int:
+        """expires_at <= now 인 토큰 삭제 (TTL). 삭제된 수 반환"""
+        ...
+
+    @abstractmethod
+    async def compact(self, batch_size: int = 1000) -> int:
+        """폐기된 토큰을 batch_size개씩 삭제. 삭제된 수 반환"""
+        ...
+
+    @abstractmethod
+    async def delete(self, token_id: str) -> bool:
+        ...
+
+
+class ClientStore(ABC):
+    """머신 클라이언트 (_id = client_id, 리포지토리가 생성)"""
+
+    @abstractmethod
+    async def insert(self, doc: dict) -> str:
+        ...
+
+    @abstractmethod
+    async def find_by_id(self, client_id: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def update(self, client_id: str, fields: dict) -> bool:
+        """클라이언트가 있으면 True"""
+        ...
+
+
+class StorageBackend(ABC):
+    users: UserStore
+    refresh_tokens: RefreshTokenStore
+    clients: ClientStore
+
+    async def connect(self):
+        """lifespan 시작 시 호출 (연결 / 스키마 준비)"""
+
+    async def close(self):
+        """lifespan 종료 시 호출"""
+
+
+# ==================== MongoDB ====================
+
+def _to_object_id(doc_id: str) -> Optional[ObjectId]:
+    try:
+        return ObjectId(doc_id)
+    except InvalidId:
+        return None
+
+
+def _with_str_id(doc: Optional[dict]) -> Optional[dict]:
+    if doc is not None:
+        doc["_id"] = str(doc["_id"])
+    return doc
+
+
+def token_key(token_hash: str) -> Optional[bytes]:
+    """hex token_hash → refresh token 문서 _id (SHA-256 digest 32바이트). 형식이 다르면 None"""
+    try:
+        key = bytes.fromhex(token_hash)
+    except ValueError:
+        return None
+    return key if len(key) == 32 else None
+
+
+def _token_to_mongo(doc: dict) -> dict:
+    """
+    refresh token 문서는 digest를 _id로 저장 (token_hash 필드 / 보조 인덱스 없음)
+    hex 문자열(4 + 65바이트) + ObjectId 대신 BinData 32바이트 하나로 조회 / 폐기 모두 _id 인덱스 사용
+    """
+    key = token_key(doc["token_hash"])
+    if key is None:
+        raise ValueError("token_hash must be a hex SHA-256 digest")
+    stored = {k: v for k, v in doc.items() if k != "token_hash"}
+    stored["_id"] = key
+    return stored
+
+
+def _token_from_mongo(doc: Optional[dict]) -> Optional[dict]:
+    if doc is not None:
+        # 이전 형식 문서는 token_hash 필드를 그대로 id로 사용 (digest 문서와 같은 값)
+        doc["token_hash"] = doc["_id"] = doc.get("token_hash") or doc["_id"].hex()
+    return doc
+
+
+async def _by_token(operation, token_hash: str, **fields):
+    """
+    _id(digest)로 먼저 실행하고 없으면 이전 형식({_id: ObjectId, token_hash: hex}) 문서로 한 번 더 실행
+    migrations refresh-token-ids 완료 전에도 배포 이전 토큰이 동작하도록 (legacy_token_hash partial 인덱스 사용)
+    """
+    result = await operation({"_id": token_key(token_hash), **fields})
+    if not _matched(result):
+        result = await operation({"token_hash": token_hash, **fields})
+    return result
+
+
+def _matched(result) -> bool:
+    """find_one / find_one_and_update(문서 또는 None), update_one / delete_one 결과"""
+    if isinstance(result, UpdateResult):
+        return result.matched_count > 0
+    if isinstance(result, DeleteResult):
+        return result.deleted_count > 0
+    return result is not None
+
+
+async def _compact_collection(collection, batch_size: int) -> int:
+    """
+    폐기된 문서를 batch_size개씩 삭제 (_id 조회 → $in 삭제)
+    한 번에 delete_many하지 않는 이유: 연산당 잠금 / oplog 크기를 제한해 요청 지연에 영향이 없도록
+    """
+    deleted = 0
+    while True:
+        cursor = collection.find({"revoked": True}, {"_id": 1}).limit(batch_size)
+        ids = [doc["_id"] async for doc in cursor]
+        if not ids:
+            return deleted
+        result = await collection.delete_many({"_id": {"$in": ids}, "revoked": True})
+        deleted += result.deleted_count
+        if len(ids) < batch_size:
+            return deleted
+
+
+class MongoUserStore(UserStore):
+    @staticmethod
+    def _collection():
+        return get_db().users
+
+    async def insert(self, doc: dict) -> str:
+        doc = dict(doc)
+        result = await self._collection().insert_one(doc)
+        return str(result.inserted_id)
+
+    async def find_by_id(self, user_id: str) -> Optional[dict]:
+        oid = _to_object_id(user_id)
+        if oid is None:
+            return None
+        return _with_str_id(await self._collection().find_one({"_id": oid}))
+
+    async def find_by_email(self, email: str) -> Optional[dict]:
+        return _with_str_id(await self._collection().find_one({"email": email}))
+
+    async def find_by_google_id(self, google_id: str) -> Optional[dict]:
+        return _with_str_id(await self._collection().find_one({"google_id": google_id}))
+
+    async def update(self, user_id: str, fields: dict):
+        oid = _to_object_id(user_id)
+        if oid is not None:
+            await self._collection().update_one({"_id": oid}, {"$set": fields})
+
+    async def delete(self, user_id: str) -> bool:
+        oid = _to_object_id(user_id)
+        if oid is None:
+            return False
+        result = await self._collection().delete_one({"_id": oid})
+        return result.deleted_count > 0
+
+
+class MongoClientStore(ClientStore):
+    @staticmethod
+    def _collection():
+        return get_db().clients
+
+    async def insert(self, doc: dict) -> str:
+        await self._collection().insert_one(dict(doc))
+        return doc["_id"]
+
+    async def find_by_id(self, client_id: str) -> Optional[dict]:
+        return await self._collection().find_one({"_id": client_id})
+
+    async def update(self, client_id: str, fields: dict) -> bool:
+        result = await self._collection().update_one({"_id": client_id}, {"$set": fields})
+        return result.matched_count > 0
+
+
+class MongoRefreshTokenStore(RefreshTokenStore):
+    """_id = token_hash digest (_token_to_mongo). id는 token_hash와 같은 hex 문자열"""
+
+    @staticmethod
+    def _collection():
+        return get_db().refresh_tokens
+
+    async def insert(self, doc: dict) -> str:
+        await self._collection().insert_one(_token_to_mongo(doc))
+        return doc["token_hash"]
+
+    async def find_by_id(self, token_id: str) -> Optional[dict]:
+        return _token_from_mongo(await _by_token(self._collection().find_one, token_id))
+
+    async def find_active(self, token_hash: str) -> Optional[dict]:
+        return _token_from_mongo(await _by_token(self._collection().find_one, token_hash, revoked=False))
+
+    async def consume(self, token_hash: str) -> Optional[dict]:
+        return _token_from_mongo(await _by_token(
+            lambda query: self._collection().find_one_and_update(
+                query,
+                {"$set": {"revoked": True}},
+                return_document=ReturnDocument.BEFORE,
+            ),
+            token_hash,
+            revoked=False,
+        ))
+
+    async def revoke(self, token_hash: str) -> bool:
+        result = await _by_token(
+            lambda query: self._collection().update_one(query, {"$set": {"revoked": True}}),
+            token_hash,
+        )
+        return result.modified_count > 0
+
+    async def revoke_all_for_user(self, user_id: str) -> int:
+        result = await self._collection().update_many(
+            {"user_id": user_id, "revoked": False},
+            {"$set": {"revoked": True}},
+        )
+        return result.modified_count
+
+    async def purge_expired(self, now: Optional[datetime] = None) -> int:
+        # 평소에는 TTL 모니터(약 60초 주기)가 삭제. 즉시 정리가 필요할 때만 호출
+        result = await self._collection().delete_many(
+            {"expires_at": {"$lte": now or datetime.utcnow()}}
+        )
+        return result.deleted_count
+
+    async def compact(self, batch_size: int = 1000) -> int:
+        return await _compact_collection(self._collection(), batch_size)
+
+    async def delete(self, token_id: str) -> bool:
+        result = await _by_token(self._collection().delete_one, token_id)
+        return result.deleted_count > 0
+
+
+class BucketedMongoRefreshTokenStore(RefreshTokenStore):
+    """
+    expires_at 구간(bucket_hours)별 컬렉션 refresh_tokens_YYYYMMDDHH에 저장
+    - 구간 끝이 지난 컬렉션은 insert 시 purge_interval마다 drop (compactor 설정과 무관,
+      TTL 모니터의 문서 단위 삭제 대신 메타데이터 연산 1회)
+    - token_hash만으로는 구간을 알 수 없으므로 조회 / 폐기는 lookup_buckets() 전체에 동시 실행
+      (보통 refresh_token_expire_days * 24 / bucket_hours + 1개)
+    - TTL 인덱스 없음. 만료 여부는 서비스에서 expires_at으로 확인
+    """
+
+    PREFIX = "refresh_tokens_"
+
+    def __init__(self, bucket_hours: int = 24, purge_interval: float = 60.0):
+        self.bucket_seconds = bucket_hours * 3600
+        self.purge_interval = purge_interval
+        self._last_purge = time.monotonic()
+        # 이 프로세스에서 인덱스를 만든 구간 (create_indexes는 멱등이라 재시작 시 다시 호출해도 무방)
+        self._indexed: Set[str] = set()
+        # 실제로 존재하는 구간 (purge_interval마다 다시 읽음)
+        self._existing: List[str] = []
+        self._existing_at: Optional[float] = None
+
+    def _bucket_start(self, moment: datetime) -> int:
+        epoch = int(moment.replace(tzinfo=timezone.utc).timestamp())
+        return epoch - epoch % self.bucket_seconds
+
+    def bucket_name(self, expires_at: datetime) -> str:
+        start = datetime.fromtimestamp(self._bucket_start(expires_at), timezone.utc)
+        return f"{self.PREFIX}{start:%Y%m%d%H}"
+
+    def bucket_end(self, name: str) -> datetime:
+        start = datetime.strptime(name[len(self.PREFIX):], "%Y%m%d%H")
+        return start + timedelta(seconds=self.bucket_seconds)
+
+    def live_buckets(self, now: Optional[datetime] = None) -> List[str]:
+        """지금 발급되어 있을 수 있는 토큰의 구간 (만료 시각 now ~ now + 최대 수명)"""
+        now = now or datetime.utcnow()
+        first = self._bucket_start(now)
+        last = self._bucket_start(now + timedelta(days=settings.refresh_token_expire_days))
+        return [
+            self.bucket_name(datetime.utcfromtimestamp(start))
+            for start in range(first, last + 1, self.bucket_seconds)
+        ]
+
+    @staticmethod
+    def _collection(name: str):
+        return get_db()[name]
+
+    async def _existing_buckets(self) -> List[str]:
+        names = await get_db().list_collection_names(filter={"name": {"$regex": f"^{self.PREFIX}"}})
+        self._existing = sorted(names)
+        self._existing_at = time.monotonic()
+        return self._existing
+
+    async def lookup_buckets(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        조회 / 폐기 대상 구간: 존재하는 구간 중 끝나지 않은 것 + live_buckets (다른 노드가 막 만든 구간)
+        refresh_token_expire_days를 줄여도 이전 설정으로 발급된 토큰의 구간을 계속 확인
+        """
+        now = now or datetime.utcnow()
+        if self._existing_at is None or time.monotonic() - self._existing_at >= self.purge_interval:
+            await self._existing_buckets()
+        names = {name for name in self._existing if self.bucket_end(name) > now}
+        names.update(self.live_buckets(now))
+        return sorted(names)
+
+    async def _fan_out(self, operation) -> list:
+        return await asyncio.gather(*(
+            operation(self._collection(name)) for name in await self.lookup_buckets()
+        ))
+
+    async def insert(self, doc: dict) -> str:
+        if time.monotonic() - self._last_purge >= self.purge_interval:
+            await self.purge_expired()
+        name = self.bucket_name(doc["expires_at"])
+        collection = self._collection(name)
+        if name not in self._indexed:
+            await collection.create_indexes(REFRESH_TOKEN_INDEXES)
+            self._indexed.add(name)
+            if name not in self._existing:
+                self._existing = sorted([*self._existing, name])
+        await collection.insert_one(_token_to_mongo(doc))
+        return doc["token_hash"]
+
+    async def find_by_id(self, token_id: str) -> Optional[dict]:
+        docs = await self._fan_out(lambda collection: _by_token(collection.find_one, token_id))
+        return _token_from_mongo(next((doc for doc in docs if doc is not None), None))
+
+    async def find_active(self, token_hash: str) -> Optional[dict]:
+        docs = await self._fan_out(
+            lambda collection: _by_token(collection.find_one, token_hash, revoked=False)
+        )
+        return _token_from_mongo(next((doc for doc in docs if doc is not None), None))
+
+    async def consume(self, token_hash: str) -> Optional[dict]:
+        # token_hash는 한 구간에만 있으므로 여러 구간에 동시에 실행해도 최대 1건만 변경
+        docs = await self._fan_out(lambda collection: _by_token(
+            lambda query: collection.find_one_and_update(
+                query,
+                {"$set": {"revoked": True}},
+                return_document=ReturnDocument.BEFORE,
+            ),
+            token_hash,
+            revoked=False,
+        ))
+        return _token_from_mongo(next((doc for doc in docs if doc is not None), None))
+
+    async def revoke(self, token_hash: str) -> bool:
+        results = await self._fan_out(lambda collection: _by_token(
+            lambda query: collection.update_one(query, {"$set": {"revoked": True}}),
+            token_hash,
+        ))
+        return any(result.modified_count for result in results)
+
+    async def revoke_all_for_user(self, user_id: str) -> int:
+        results = await self._fan_out(lambda collection: collection.update_many(
+            {"user_id": user_id, "revoked": False},
+            {"$set": {"revoked": True}},
+        ))
+        return sum(result.modified_count for result in results)
+
+    async def purge_expired(self, now: Optional[datetime] = None) -> int:
+        """구간 끝이 지난 컬렉션은 drop, 현재 구간은 만료된 문서만 삭제"""
+        self._last_purge = time.monotonic()
+        now = now or datetime.utcnow()
+        purged = 0
+        for name in list(await self._existing_buckets()):
+            if self.bucket_end(name) <= now:
+                collection = self._collection(name)
+                purged += await collection.estimated_document_count()
+                await collection.drop()
+                self._indexed.discard(name)
+                self._existing.remove(name)
+        result = await self._collection(self.bucket_name(now)).delete_many({"expires_at": {"$lte": now}})
+        return purged + result.deleted_count
+
+    async def compact(self, batch_size: int = 1000) -> int:
+        deleted = 0
+        for name in await self._existing_buckets():
+            deleted += await _compact_collection(self._collection(name), batch_size)
+        return deleted
+
+    async def delete(self, token_id: str) -> bool:
+        results = await self._fan_out(lambda collection: _by_token(collection.delete_one, token_id))
+        return any(result.deleted_count for result in results)
+
+
+class MongoStorageBackend(StorageBackend):
+    """
+    연결은 app/core/database.py (connect_db / close_db)에서 관리
+    refresh_token_storage: single(refresh_tokens + TTL 인덱스) / bucketed(만료 구간별 컬렉션)
+    """
+
+    def __init__(self, refresh_token_storage: str = "single", bucket_hours: int = 24, purge_interval: float = 60.0):
+        self.users = MongoUserStore()
+        self.clients = MongoClientStore()
+        if refresh_token_storage == "bucketed":
+            self.refresh_tokens = BucketedMongoRefreshTokenStore(bucket_hours, purge_interval)
+        else:
+            self.refresh_tokens = MongoRefreshTokenStore()
+
+
+# ==================== Memory ====================
+
+class MemoryUserStore(UserStore):
+    """_id → 문서 + email(unique) / google_id 보조 인덱스"""
+
+    def __init__(self):
+        self._docs: Dict[str, dict] = {}
+        self._by_email: Dict[str, str] = {}
+        self._by_google_id: Dict[str, Set[str]] = {}
+
+    def _index(self, doc: dict):
+        self._by_email[doc["email"]] = doc["_id"]
+        self._by_google_id.setdefault(doc["google_id"], set()).add(doc["_id"])
+
+    def _unindex(self, doc: dict):
+        del self._by_email[doc["email"]]
+        ids = self._by_google_id[doc["google_id"]]
+        ids.discard(doc["_id"])
+        if not ids:
+            del self._by_google_id[doc["google_id"]]
+
+    def _get(self, user_id: Optional[str]) -> Optional[dict]:
+        doc = self._docs.get(user_id)
+        return copy.copy(doc) if doc is not None else None
+
+    async def insert(self, doc: dict) -> str:
+        if doc["email"] in self._by_email:
+            raise DuplicateKeyError(f"E11000 duplicate key: email {doc['email']!r}")
+        stored = {**doc, "_id": str(ObjectId())}
+        self._docs[stored["_id"]] = stored
+        self._index(stored)
+        return stored["_id"]
+
+    async def find_by_id(self, user_id: str) -> Optional[dict]:
+        return self._get(user_id)
+
+    async def find_by_email(self, email: str) -> Optional[dict]:
+        return self._get(self._by_email.get(email))
+
+    async def find_by_google_id(self, google_id: str) -> Optional[dict]:
+        ids = self._by_google_id.get(google_id)
+        return self._get(next(iter(ids))) if ids else None
+
+    async def update(self, user_id: str, fields: dict):
+        doc = self._docs.get(user_id)
+        if doc is None:
+            return
+        email = fields.get("email", doc["email"])
+        if email != doc["email"] and email in self._by_email:
+            raise DuplicateKeyError(f"E11000 duplicate key: email {email!r}")
+        self._unindex(doc)
+        doc.update(fields)
+        self._index(doc)
+
+    async def delete(self, user_id: str) -> bool:
+        doc = self._docs.pop(user_id, None)
+        if doc is None:
+            return False
+        self._unindex(doc)
+        return True
+
+
+class MemoryRefreshTokenStore(RefreshTokenStore):
+    """
+    token_hash(= _id) → 문서 + user_id 보조 인덱스
+    만료는 (expires_at, _id) min-heap으로 관리해 insert마다 만료된 항목만 꺼내 삭제
+    """
+
+    def __init__(self):
+        self._docs: Dict[str, dict] = {}
+        self._by_user: Dict[str, Set[str]] = {}
+        self._expiry: List[Tuple[datetime, str]] = []
+
+    def _remove(self, doc: dict):
+        del self._docs[doc["_id"]]
+        ids = self._by_user[doc["user_id"]]
+        ids.discard(doc["_id"])
+        if not ids:
+            del self._by_user[doc["user_id"]]
+
+    def _active(self, token_hash: str) -> Optional[dict]:
+        doc = self._docs.get(token_hash)
+        return doc if doc is not None and not doc["revoked"] else None
+
+    async def insert(self, doc: dict) -> str:
+        await self.purge_expired()
+        if doc["token_hash"] in self._docs:
+            raise DuplicateKeyError("E11000 duplicate key: token_hash")
+        stored = {**doc, "_id": doc["token_hash"]}
+        self._docs[stored["_id"]] = stored
+        self._by_user.setdefault(stored["user_id"], set()).add(stored["_id"])
+        heapq.heappush(self._expiry, (stored["expires_at"], stored["_id"]))
+        return stored["_id"]
+
+    async def find_by_id(self, token_id: str) -> Optional[dict]:
+        doc = self._docs.get(token_id)
+        return copy.copy(doc) if doc is not None else None
+
+    async def find_active(self, token_hash: str) -> Optional[dict]:
+        doc = self._active(token_hash)
+        return copy.copy(doc) if doc is not None else None
+
+    async def consume(self, token_hash: str) -> Optional[dict]:
+        # await 없이 확인과 변경을 끝내므로 같은 루프의 동시 호출 중 하나만 성공
+        doc = self._active(token_hash)
+        if doc is None:
+            return None
+        before = copy.copy(doc)
+        doc["revoked"] = True
+        return before
+
+    async def revoke(self, token_hash: str) -> bool:
+        doc = self._active(token_hash)
+        if doc is None:
+            return False
+        doc["revoked"] = True
+        return True
+
+    async def revoke_all_for_user(self, user_id: str) -> int:
+        count = 0
+        for token_id in self._by_user.get(user_id, ()):
+            doc = self._docs[token_id]
+            if not doc["revoked"]:
+                doc["revoked"] = True
+                count += 1
+        return count
+
+    async def purge_expired(self, now: Optional[datetime] = None) -> int:
+        now = now or datetime.utcnow()
+        count = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            _, token_id = heapq.heappop(self._expiry)
+            doc = self._docs.get(token_id)
+            if doc is not None:
+                self._remove(doc)
+                count += 1
+        return count
+
+    async def compact(self, batch_size: int = 1000) -> int:
+        revoked = [doc for doc in self._docs.values() if doc["revoked"]]
+        for doc in revoked:
+            self._remove(doc)
+        return len(revoked)
+
+    async def delete(self, token_id: str) -> bool:
+        # heap 항목은 purge 시 문서가 없으면 건너뜀
+        doc = self._docs.get(token_id)
+        if doc is None:
+            return False
+        self._remove(doc)
+        return True
+
+
+class MemoryClientStore(ClientStore):
+    def __init__(self):
+        self._docs: Dict[str, dict] = {}
+
+    async def insert(self, doc: dict) -> str:
+        if doc["_id"] in self._docs:
+            raise DuplicateKeyError(f"E11000 duplicate key: client_id {doc['_id']!r}")
+        self._docs[doc["_id"]] = copy.deepcopy(doc)
+        return doc["_id"]
+
+    async def find_by_id(self, client_id: str) -> Optional[dict]:
+        doc = self._docs.get(client_id)
+        return copy.deepcopy(doc) if doc is not None else None
+
+    async def update(self, client_id: str, fields: dict) -> bool:
+        doc = self._docs.get(client_id)
+        if doc is None:
+            return False
+        doc.update(copy.deepcopy(fields))
+        return True
+
+
+class MemoryStorageBackend(StorageBackend):
+    def __init__(self):
+        self.users = MemoryUserStore()
+        self.refresh_tokens = MemoryRefreshTokenStore()
+        self.clients = MemoryClientStore()
+
+
+# ==================== SQLite ====================
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    email TEXT NOT NULL UNIQUE,
+    google_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    picture TEXT,
+    role TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_google_id ON users (google_id);
+CREATE TABLE IF NOT EXISTS refresh_tokens (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    token_hash TEXT NOT NULL UNIQUE,
+    expires_at TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    revoked INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS refresh_tokens_user_id ON refresh_tokens (user_id, revoked);
+CREATE INDEX IF NOT EXISTS refresh_tokens_expires_at ON refresh_tokens (expires_at);
+CREATE INDEX IF NOT EXISTS refresh_tokens_revoked ON refresh_tokens (revoked) WHERE revoked = 1;
+CREATE TABLE IF NOT EXISTS clients (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    secret_hash TEXT NOT NULL,
+    scopes TEXT NOT NULL,
+    disabled INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL
+);
+"""
+
+# UPDATE ... RETURNING (SQLiteRefreshTokenStore.consume)
+SQLITE_MIN_VERSION = (3, 35, 0)
+
+# 테이블별 컬럼 (문서 키 → 컬럼, update 허용 필드 검사에도 사용)
+USER_COLUMNS = ("email", "google_id", "name", "picture", "role", "created_at", "updated_at")
+REFRESH_TOKEN_COLUMNS = ("user_id", "token_hash", "expires_at", "created_at", "revoked")
+CLIENT_COLUMNS = ("name", "secret_hash", "scopes", "disabled", "created_at")
+DATETIME_COLUMNS = {"created_at", "updated_at", "expires_at"}
+BOOL_COLUMNS = {"revoked", "disabled"}
+# JSON 문자열로 저장하는 목록 컬럼
+JSON_COLUMNS = {"scopes"}
+
+
+def _to_sql(value):
+    # datetime은 naive UTC ISO 문자열 (문자열 비교 = 시간 순서)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, list):
+        return json.dumps(value)
+    return value
+
+
+def _row_to_doc(row) -> Optional[dict]:
+    if row is None:
+        return None
+    doc = dict(row)
+    doc["_id"] = doc.pop("id")
+    for key in DATETIME_COLUMNS & doc.keys():
+        doc[key] = datetime.fromisoformat(doc[key])
+    for key in BOOL_COLUMNS & doc.keys():
+        doc[key] = bool(doc[key])
+    for key in JSON_COLUMNS & doc.keys():
+        doc[key] = json.loads(doc[key])
+    return doc
+
+
+class _SQLiteStore:
+    def __init__(self, backend: "SQLiteStorageBackend"):
+        self._backend = backend
+
+    async def _execute(self, sql: str, params: tuple = ()) -> Tuple[int, Optional[dict]]:
+        """(변경된 행 수, 첫 행)"""
+        rowcount, row = await self._backend.run(sql, params)
+        return rowcount, _row_to_doc(row)
+
+    async def _insert(self, table: str, columns: Tuple[str, ...], doc: dict) -> str:
+        doc_id = doc.get("_id") or str(ObjectId())
+        values = [doc_id] + [_to_sql(doc.get(column)) for column in columns]
+        placeholders = ", ".join("?" * len(values))
+        await self._execute(
+            f"INSERT INTO {table} (id, {', '.join(columns)}) VALUES ({placeholders})",
+            tuple(values),
+        )
+        return doc_id
+
+
+class SQLiteUserStore(_SQLiteStore, UserStore):
+    async def insert(self, doc: dict) -> str:
+        return await self._insert("users", USER_COLUMNS, doc)
+
+    async def find_by_id(self, user_id: str) -> Optional[dict]:
+        _, doc = await self._execute("SELECT * FROM users WHERE id = ?", (user_id,))
+        return doc
+
+    async def find_by_email(self, email: str) -> Optional[dict]:
+        _, doc = await self._execute("SELECT * FROM users WHERE email = ?", (email,))
+        return doc
+
+    async def find_by_google_id(self, google_id: str) -> Optional[dict]:
+        _, doc = await self._execute("SELECT * FROM users WHERE google_id = ? LIMIT 1", (google_id,))
+        return doc
+
+    async def update(self, user_id: str, fields: dict):
+        unknown = fields.keys() - set(USER_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown user fields: {sorted(unknown)}")
+        if not fields:
+            return
+        assignments = ", ".join(f"{key} = ?" for key in fields)
+        params = tuple(_to_sql(value) for value in fields.values()) + (user_id,)
+        await self._execute(f"UPDATE users SET {assignments} WHERE id = ?", params)
+
+    async def delete(self, user_id: str) -> bool:
+        rowcount, _ = await self._execute("DELETE FROM users WHERE id = ?", (user_id,))
+        return rowcount > 0
+
+
+class SQLiteRefreshTokenStore(_SQLiteStore, RefreshTokenStore):
+    """만료 토큰은 insert 시 purge_interval마다 한 번 DELETE (expires_at 인덱스 사용)"""
+
+    def __init__(self, backend: "SQLiteStorageBackend", purge_interval: float):
+        super().__init__(backend)
+        self.purge_interval = purge_interval
+        self._last_purge = time.monotonic()
+
+    async def insert(self, doc: dict) -> str:
+        if time.monotonic() - self._last_purge >= self.purge_interval:
+            await self.purge_expired()
+        return await self._insert("refresh_tokens", REFRESH_TOKEN_COLUMNS, {"revoked": False, **doc})
+
+    async def find_by_id(self, token_id: str) -> Optional[dict]:
+        _, doc = await self._execute("SELECT * FROM refresh_tokens WHERE id = ?", (token_id,))
+        return doc
+
+    async def find_active(self, token_hash: str) -> Optional[dict]:
+        _, doc = await self._execute(
+            "SELECT * FROM refresh_tokens WHERE token_hash = ? AND revoked = 0",
+            (token_hash,),
+        )
+        return doc
+
+    async def consume(self, token_hash: str) -> Optional[dict]:
+        # 조건부 UPDATE 1문장이라 동시에 호출해도 한 번만 행을 돌려받음
+        _, doc = await self._execute(
+            "UPDATE refresh_tokens SET revoked = 1 WHERE token_hash = ? AND revoked = 0 RETURNING *",
+            (token_hash,),
+        )
+        if doc is not None:
+            doc["revoked"] = False
+        return doc
+
+    async def revoke(self, token_hash: str) -> bool:
+        rowcount, _ = await self._execute(
+            "UPDATE refresh_tokens SET revoked = 1 WHERE token_hash = ? AND revoked = 0",
+            (token_hash,),
+        )
+        return rowcount > 0
+
+    async def revoke_all_for_user(self, user_id: str) -> int:
+        rowcount, _ = await self._execute(
+            "UPDATE refresh_tokens SET revoked = 1 WHERE user_id = ? AND revoked = 0",
+            (user_id,),
+        )
+        return rowcount
+
+    async def purge_expired(self, now: Optional[datetime] = None) -> int:
+        self._last_purge = time.monotonic()
+        rowcount, _ = await self._execute(
+            "DELETE FROM refresh_tokens WHERE expires_at <= ?",
+            (_to_sql(now or datetime.utcnow()),),
+        )
+        return rowcount
+
+    async def compact(self, batch_size: int = 1000) -> int:
+        deleted = 0
+        while True:
+            rowcount, _ = await self._execute(
+                "DELETE FROM refresh_tokens WHERE id IN "
+                "(SELECT id FROM refresh_tokens WHERE revoked = 1 LIMIT ?)",
+                (batch_size,),
+            )
+            deleted += rowcount
+            if rowcount < batch_size:
+                return deleted
+
+    async def delete(self, token_id: str) -> bool:
+        rowcount, _ = await self._execute("DELETE FROM refresh_tokens WHERE id = ?", (token_id,))
+        return rowcount > 0
+
+
+class SQLiteClientStore(_SQLiteStore, ClientStore):
+    async def insert(self, doc: dict) -> str:
+        return await self._insert("clients", CLIENT_COLUMNS, doc)
+
+    async def find_by_id(self, client_id: str) -> Optional[dict]:
+        _, doc = await self._execute("SELECT * FROM clients WHERE id = ?", (client_id,))
+        return doc
+
+    async def update(self, client_id: str, fields: dict) -> bool:
+        unknown = fields.keys() - set(CLIENT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown client fields: {sorted(unknown)}")
+        if not fields:
+            return await self.find_by_id(client_id) is not None
+        assignments = ", ".join(f"{key} = ?" for key in fields)
+        params = tuple(_to_sql(value) for value in fields.values()) + (client_id,)
+        rowcount, _ = await self._execute(f"UPDATE clients SET {assignments} WHERE id = ?", params)
+        return rowcount > 0
+
+
+class SQLiteStorageBackend(StorageBackend):
+    """
+    표준 라이브러리 sqlite3 + 전용 스레드 1개 (연결 1개를 한 스레드에서만 사용, 쿼리는 순서대로 실행)
+    autocommit + WAL: 문장마다 커밋, 읽기는 쓰기를 기다리지 않음
+    """
+
+    def __init__(self, path: str, purge_interval: float = 60.0):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.users = SQLiteUserStore(self)
+        self.refresh_tokens = SQLiteRefreshTokenStore(self, purge_interval)
+        self.clients = SQLiteClientStore(self)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SQLITE_SCHEMA)
+        self._conn = conn
+
+    def _run(self, sql: str, params: tuple) -> Tuple[int, Optional[sqlite3.Row]]:
+        try:
+            cursor = self._conn.execute(sql, params)
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE" in str(e):
+                raise DuplicateKeyError(f"E11000 duplicate key: {e}") from e
+            raise
+        # RETURNING 문은 행을 끝까지 읽어야 문장이 완료됨
+        rows = cursor.fetchall()
+        return cursor.rowcount, rows[0] if rows else None
+
+    async def run(self, sql: str, params: tuple = ()) -> Tuple[int, Optional[sqlite3.Row]]:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._run, sql, params)
+
+    async def connect(self):
+        if sqlite3.sqlite_version_info < SQLITE_MIN_VERSION:
+            raise RuntimeError(
+                f"SQLite {'.'.join(map(str, SQLITE_MIN_VERSION))}+ is required "
+                f"(found {sqlite3.sqlite_version})"
+            )
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._connect)
+
+    async def close(self):
+        if self._executor is not None:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._conn.close)
+            self._executor.shutdown()
+            self._executor = None
+            self._conn = None
+
+
+def create_storage_backend() -> StorageBackend:
+    """settings.repository_backend 값에 따라 저장소 생성"""
+    if settings.repository_backend == "memory":
+        return MemoryStorageBackend()
+    if settings.repository_backend == "sqlite":
+        return SQLiteStorageBackend(
+            settings.sqlite_path,
+            purge_interval=settings.repository_purge_interval_seconds,
+        )
+    return MongoStorageBackend(
+        settings.refresh_token_storage,
+        bucket_hours=settings.refresh_token_bucket_hours,
+        purge_interval=settings.repository_purge_interval_seconds,
+    )
+
+
+storage: Optional[StorageBackend] = None
+
+
+def get_storage() -> StorageBackend:
+    global storage
+    if storage is None:
+        storage = create_storage_backend()
+    return storage
@@ -5,11 +5,17 @@ from bson import ObjectId
 from bson.errors import InvalidId
 from pydantic import BaseModel
 
+from app.core.metrics import observe_repository
+
 T = TypeVar("T", bound=BaseModel)
 
 
 class BaseRepository(ABC):
-    """MongoDB Repository 공통 추상 클래스"""
+    """
+    MongoDB Repository 공통 추상 클래스
+    User / RefreshToken 리포지토리는 _collection 대신 storage backend의 store 사용 (app/repositories/backends.py)
+    이 경우 get_by_id / delete_by_id도 store를 거치도록 재정의해야 함
+    """
 
     @staticmethod
     @abstractmethod
@@ -34,6 +40,7 @@ class BaseRepository(ABC):
             return None
 
     @classmethod
+    @observe_repository
     async def get_by_id(cls, doc_id: str, model_cls: Type[T]) -> Optional[T]:
         """ID로 문서 조회"""
         oid = cls._to_object_id(doc_id)
@@ -43,6 +50,7 @@ class BaseRepository(ABC):
         return cls._doc_to_model(doc, model_cls)
 
     @classmethod
+    @observe_repository
     async def delete_by_id(cls, doc_id: str) -> bool:
         """ID로 문서 삭제"""
         oid = cls._to_object_id(doc_id)
@@ -0,0 +1,43 @@
+import secrets
+from datetime import datetime
+from typing import Optional
+
+from app.core.client_cache import client_secret_cache
+from app.core.metrics import observe_repository
+from app.models.client import ClientCreate, ClientInDB
+from app.repositories.backends import ClientStore, get_storage
+from app.repositories.base import BaseRepository
+
+
+class ClientRepository(BaseRepository):
+    @staticmethod
+    def _store() -> ClientStore:
+        return get_storage().clients
+
+    @classmethod
+    @observe_repository
+    async def create(cls, client: ClientCreate, secret_hash: str) -> ClientInDB:
+        """클라이언트 등록. client_id는 랜덤 생성"""
+        doc = {
+            "_id": secrets.token_urlsafe(16),
+            **client.model_dump(),
+            "secret_hash": secret_hash,
+            "disabled": False,
+            "created_at": datetime.utcnow(),
+        }
+        await cls._store().insert(doc)
+        return ClientInDB(**doc)
+
+    @classmethod
+    @observe_repository
+    async def get_by_client_id(cls, client_id: str) -> Optional[ClientInDB]:
+        doc = await cls._store().find_by_id(client_id)
+        return cls._doc_to_model(doc, ClientInDB)
+
+    @classmethod
+    @observe_repository
+    async def update(cls, client_id: str, **fields) -> bool:
+        """secret_hash / scopes / disabled 변경. 이 프로세스에 캐시된 검증 결과도 제거"""
+        updated = await cls._store().update(client_id, fields)
+        client_secret_cache.invalidate_client(client_id)
+        return updated
@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pymongo import ASCENDING
+from pymongo.errors import DuplicateKeyError
+
+from app.core.database import get_db
+from app.core.metrics import observe_repository
+from app.models.revocation import RevokedTokenInDB
+from app.repositories.base import BaseRepository
+
+
+class RevokedTokenRepository(BaseRepository):
+    @staticmethod
+    def _collection():
+        return get_db().revoked_tokens
+
+    @classmethod
+    @observe_repository
+    async def revoke(cls, jti: str, user_id: str, expires_at: datetime) -> RevokedTokenInDB:
+        """jti 폐기 등록 (이미 있으면 기존 문서 유지). 문서는 expires_at에 TTL로 삭제"""
+        doc = {
+            "_id": jti,
+            "user_id": user_id,
+            "expires_at": expires_at,
+            "revoked_at": datetime.utcnow(),
+        }
+        try:
+            await cls._collection().insert_one(doc)
+        except DuplicateKeyError:
+            pass
+        return RevokedTokenInDB(**doc)
+
+    @classmethod
+    @observe_repository
+    async def is_revoked(cls, jti: str) -> bool:
+        return await cls._collection().find_one({"_id": jti}) is not None
+
+    @classmethod
+    @observe_repository
+    async def list_since(cls, since: Optional[datetime] = None) -> List[RevokedTokenInDB]:
+        """
+        since 이후 폐기된 항목 (revoked_at 오름차순). since가 없으면 아직 만료되지 않은 전체
+        TTL 모니터는 약 60초 주기라 만료된 문서가 남아 있을 수 있음
+        """
+        if since is None:
+            query = {"expires_at": {"$gt": datetime.utcnow()}}
+        else:
+            query = {"revoked_at": {"$gte": since}}
+        cursor = cls._collection().find(query).sort("revoked_at", ASCENDING)
+        return [cls._doc_to_model(doc, RevokedTokenInDB) async for doc in cursor]
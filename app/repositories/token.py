@@ -1,47 +1,73 @@
 from typing import Optional
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.metrics import observe_repository
 from app.models.token import RefreshTokenCreate, RefreshTokenInDB
+from app.repositories.backends import RefreshTokenStore, get_storage
 from app.repositories.base import BaseRepository
 
 
 class RefreshTokenRepository(BaseRepository):
     @staticmethod
-    def _collection():
-        return get_db().refresh_tokens
+    def _store() -> RefreshTokenStore:
+        return get_storage().refresh_tokens
 
     @classmethod
+    @observe_repository
     async def create(cls, token: RefreshTokenCreate) -> RefreshTokenInDB:
         doc = {
             **token.model_dump(),
             "created_at": datetime.utcnow(),
             "revoked": False,
         }
-        result = await cls._collection().insert_one(doc)
-        doc["_id"] = str(result.inserted_id)
+        doc["_id"] = await cls._store().insert(doc)
         return RefreshTokenInDB(**doc)
 
     @classmethod
+    @observe_repository
+    async def get_by_id(cls, token_id: str) -> Optional[RefreshTokenInDB]:
+        doc = await cls._store().find_by_id(token_id)
+        return cls._doc_to_model(doc, RefreshTokenInDB)
+
+    @classmethod
+    @observe_repository
     async def get_by_token_hash(cls, token_hash: str) -> Optional[RefreshTokenInDB]:
-        doc = await cls._collection().find_one({
-            "token_hash": token_hash,
-            "revoked": False
-        })
+        doc = await cls._store().find_active(token_hash)
+        return cls._doc_to_model(doc, RefreshTokenInDB)
+
+    @classmethod
+    @observe_repository
+    async def consume(cls, token_hash: str) -> Optional[RefreshTokenInDB]:
+        """
+        유효한 토큰을 조회와 동시에 폐기 (저장소의 원자적 연산 1회)
+        동시에 같은 토큰으로 요청해도 하나만 문서를 받음
+        """
+        doc = await cls._store().consume(token_hash)
         return cls._doc_to_model(doc, RefreshTokenInDB)
 
     @classmethod
+    @observe_repository
     async def revoke(cls, token_hash: str) -> bool:
-        result = await cls._collection().update_one(
-            {"token_hash": token_hash},
-            {"$set": {"revoked": True}}
-        )
-        return result.modified_count > 0
+        return await cls._store().revoke(token_hash)
 
     @classmethod
+    @observe_repository
     async def revoke_all_for_user(cls, user_id: str) -> int:
-        result = await cls._collection().update_many(
-            {"user_id": user_id, "revoked": False},
-            {"$set": {"revoked": True}}
-        )
-        return result.modified_count
+        return await cls._store().revoke_all_for_user(user_id)
+
+    @classmethod
+    @observe_repository
+    async def purge_expired(cls, now: Optional[datetime] = None) -> int:
+        """만료된 토큰 삭제 (mongodb는 TTL 인덱스가 자동 처리)"""
+        return await cls._store().purge_expired(now)
+
+    @classmethod
+    @observe_repository
+    async def compact(cls, batch_size: int = 1000) -> int:
+        """폐기된 토큰 일괄 삭제 (app/core/token_compaction.py에서 주기 실행)"""
+        return await cls._store().compact(batch_size)
+
+    @classmethod
+    @observe_repository
+    async def delete_by_id(cls, token_id: str) -> bool:
+        return await cls._store().delete(token_id)
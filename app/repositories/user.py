@@ -1,17 +1,20 @@
 from typing import Optional
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.metrics import observe_repository
+from app.core.user_cache import user_cache
 from app.models.user import UserCreate, UserInDB, UserRole
+from app.repositories.backends import UserStore, get_storage
 from app.repositories.base import BaseRepository
 
 
 class UserRepository(BaseRepository):
     @staticmethod
-    def _collection():
-        return get_db().users
+    def _store() -> UserStore:
+        return get_storage().users
 
     @classmethod
+    @observe_repository
     async def create(cls, user: UserCreate) -> UserInDB:
         now = datetime.utcnow()
         doc = {
@@ -20,32 +23,51 @@ class UserRepository(BaseRepository):
             "created_at": now,
             "updated_at": now,
         }
-        result = await cls._collection().insert_one(doc)
-        doc["_id"] = str(result.inserted_id)
+        doc["_id"] = await cls._store().insert(doc)
+        user_cache.invalidate(doc["_id"])
         return UserInDB(**doc)
 
     @classmethod
+    @observe_repository
     async def get_by_id(cls, user_id: str) -> Optional[UserInDB]:
-        return await super().get_by_id(user_id, UserInDB)
+        doc = await cls._store().find_by_id(user_id)
+        return cls._doc_to_model(doc, UserInDB)
+
+    @classmethod
+    async def get_by_id_cached(cls, user_id: str) -> Optional[UserInDB]:
+        """user_cache를 거쳐 조회 (read-through). 지연 시간은 miss 시 get_by_id로만 기록"""
+        user = user_cache.get(user_id)
+        if user is None:
+            user = await cls.get_by_id(user_id)
+            if user is not None:
+                user_cache.put(user_id, user)
+        return user
 
     @classmethod
+    @observe_repository
     async def get_by_email(cls, email: str) -> Optional[UserInDB]:
-        doc = await cls._collection().find_one({"email": email})
+        doc = await cls._store().find_by_email(email)
         return cls._doc_to_model(doc, UserInDB)
 
     @classmethod
+    @observe_repository
     async def get_by_google_id(cls, google_id: str) -> Optional[UserInDB]:
-        doc = await cls._collection().find_one({"google_id": google_id})
+        doc = await cls._store().find_by_google_id(google_id)
         return cls._doc_to_model(doc, UserInDB)
 
     @classmethod
+    @observe_repository
     async def update(cls, user_id: str, **fields) -> Optional[UserInDB]:
-        oid = cls._to_object_id(user_id)
-        if oid is None:
+        if cls._to_object_id(user_id) is None:
             return None
         fields["updated_at"] = datetime.utcnow()
-        await cls._collection().update_one(
-            {"_id": oid},
-            {"$set": fields}
-        )
+        await cls._store().update(user_id, fields)
+        user_cache.invalidate(user_id)
         return await cls.get_by_id(user_id)
+
+    @classmethod
+    @observe_repository
+    async def delete_by_id(cls, user_id: str) -> bool:
+        deleted = await cls._store().delete(user_id)
+        user_cache.invalidate(user_id)
+        return deleted
@@ -1,10 +1,22 @@
+import base64
+import binascii
+import json
+from typing import Optional, Tuple, Type, TypeVar
+from urllib.parse import parse_qs, unquote_plus
+
 from fastapi import APIRouter, Depends, Request
-from authlib.integrations.starlette_client import OAuth
-from starlette.config import Config
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
 
 from app.config import settings
 from app.schemas.auth import (
+    BatchIntrospectionResponse,
+    ClientCredentialsRequest,
+    ClientTokenResponse,
     ErrorResponse,
+    IntrospectionRequest,
+    IntrospectionResponse,
     TokenResponse,
     RefreshRequest,
     UserResponse,
@@ -13,30 +25,22 @@ from app.services.auth import AuthService
 from app.core.dependencies import get_current_user, get_current_user_db
 from app.core.exceptions import (
     AuthException,
+    InvalidCredentialsException,
     OAuthFailedException,
 )
 from app.core.logging import (
+    log_client_token,
     log_login,
     log_logout,
     log_token_refresh,
 )
-from app.core.rate_limit import rate_limiter, RateLimitConfig
+from app.core.oauth import get_google_client
+from app.core.rate_limit import rate_limit, RateLimitConfig
 from app.models.user import UserInDB
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-# OAuth 설정
-config = Config(environ={
-    "GOOGLE_CLIENT_ID": settings.google_client_id,
-    "GOOGLE_CLIENT_SECRET": settings.google_client_secret,
-})
-oauth = OAuth(config)
-oauth.register(
-    name="google",
-    server_metadata_url="https://accounts.google.com/.well-known/openid-configuration",
-    client_kwargs={"scope": "openid email profile"},
-)
-
+BodyT = TypeVar("BodyT", bound=BaseModel)
 
 def get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
@@ -56,11 +60,14 @@ _error_responses = {
 
 # ==================== Google OAuth ====================
 
-@router.get("/google", responses={429: _error_responses[429], 500: _error_responses[500]})
+@router.get(
+    "/google",
+    dependencies=[Depends(rate_limit(RateLimitConfig.LOGIN))],
+    responses={429: _error_responses[429], 500: _error_responses[500]},
+)
 async def google_login(request: Request):
     """Google OAuth 로그인 시작"""
-    rate_limiter.check_rate_limit(request, "login", **RateLimitConfig.LOGIN)
-    return await oauth.google.authorize_redirect(
+    return await get_google_client().authorize_redirect(
         request,
         settings.google_redirect_uri
     )
@@ -80,7 +87,7 @@ async def google_callback(request: Request):
     ip = get_client_ip(request)
 
     try:
-        token = await oauth.google.authorize_access_token(request)
+        token = await get_google_client().authorize_access_token(request)
     except Exception as e:
         log_login("unknown", ip=ip, success=False)
         raise OAuthFailedException(detail=f"OAuth failed: {str(e)}")
@@ -100,11 +107,87 @@ async def google_callback(request: Request):
     )
 
 
+# ==================== Request Parsing ====================
+
+async def _parse_body(request: Request, model: Type[BodyT]) -> BodyT:
+    """form(RFC 6749 / 7662) 또는 JSON 본문을 model로 변환 (python-multipart 없이 parse_qs 사용)"""
+    raw = await request.body()
+    try:
+        if request.headers.get("content-type", "").startswith("application/json"):
+            data = json.loads(raw or b"{}")
+        else:
+            data = {key: values[0] for key, values in parse_qs(raw.decode()).items()}
+        return model.model_validate(data)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    except ValueError:
+        raise RequestValidationError([{"loc": ("body",), "msg": "Malformed request body"}])
+
+
+def _basic_credentials(request: Request) -> Optional[Tuple[str, str]]:
+    """Authorization: Basic 헤더의 (client_id, client_secret). 헤더가 없으면 None"""
+    scheme, _, value = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "basic":
+        return None
+    try:
+        decoded = base64.b64decode(value, validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise InvalidCredentialsException("Malformed Basic credentials")
+    client_id, sep, client_secret = decoded.partition(":")
+    if not sep:
+        raise InvalidCredentialsException("Malformed Basic credentials")
+    # RFC 6749 2.3.1: form-urlencoded 후 Basic 인코딩
+    return unquote_plus(client_id), unquote_plus(client_secret)
+
+
+# ==================== Client Credentials ====================
+
+@router.post(
+    "/token",
+    response_model=ClientTokenResponse,
+    dependencies=[Depends(rate_limit(RateLimitConfig.CLIENT_TOKEN))],
+    responses={
+        400: _error_responses[400],
+        401: _error_responses[401],
+        422: _error_responses[422],
+        429: _error_responses[429],
+        500: _error_responses[500],
+    },
+)
+async def client_token(request: Request):
+    """
+    client_credentials grant (머신 에이전트용 Access token 발급)
+    - client 인증: HTTP Basic 또는 본문 client_id / client_secret
+    - scope: 공백 구분, 클라이언트에 허용된 범위 내에서만
+    """
+    body = await _parse_body(request, ClientCredentialsRequest)
+    credentials = _basic_credentials(request) or (body.client_id, body.client_secret)
+    client_id, client_secret = credentials
+    if not client_id or not client_secret:
+        raise InvalidCredentialsException("Client authentication required")
+
+    ip = get_client_ip(request)
+    try:
+        access_token, scopes = await AuthService.issue_client_token(client_id, client_secret, body.scope)
+    except AuthException:
+        log_client_token(client_id, ip=ip, success=False)
+        raise
+    log_client_token(client_id, ip=ip, success=True)
+
+    content = ClientTokenResponse(
+        access_token=access_token,
+        expires_in=settings.access_token_expire_minutes * 60,
+        scope=" ".join(scopes),
+    )
+    return JSONResponse(content=content.model_dump(), headers={"Cache-Control": "no-store"})
+
+
 # ==================== Token Management ====================
 
 @router.post(
     "/refresh",
     response_model=TokenResponse,
+    dependencies=[Depends(rate_limit(RateLimitConfig.TOKEN_REFRESH))],
     responses={
         401: _error_responses[401],
         404: _error_responses[404],
@@ -113,12 +196,16 @@ async def google_callback(request: Request):
         500: _error_responses[500],
     },
 )
-async def refresh_token(body: RefreshRequest, request: Request):
+async def refresh_token(request: Request, body: RefreshRequest):
     """Refresh token으로 새 토큰 발급"""
-    rate_limiter.check_rate_limit(request, "token_refresh", **RateLimitConfig.TOKEN_ISSUE)
-
-    access_token, new_refresh_token = await AuthService.refresh_tokens(body.refresh_token)
-    log_token_refresh("user", success=True)
+    ip = get_client_ip(request)
+    try:
+        access_token, new_refresh_token, user_id = await AuthService.refresh_tokens(body.refresh_token)
+    except AuthException as e:
+        # 무효 / 재사용 / 만료된 토큰은 subject를 알 수 없으므로 에러 코드만 기록
+        log_token_refresh(ip=ip, success=False, detail=e.error_code.value)
+        raise
+    log_token_refresh(user_id, ip=ip, success=True)
 
     return TokenResponse(
         access_token=access_token,
@@ -138,8 +225,8 @@ async def logout(
     request: Request,
     current_user: dict = Depends(get_current_user)
 ):
-    """로그아웃 (모든 refresh token 폐기)"""
-    count = await AuthService.logout(current_user["sub"])
+    """로그아웃 (모든 refresh token + 현재 Access token 폐기)"""
+    count = await AuthService.logout(current_user["sub"], access_claims=current_user)
     log_logout(current_user["sub"], ip=get_client_ip(request))
 
     return {"message": "Logged out", "revoked_tokens": count}
@@ -148,9 +235,11 @@ async def logout(
 @router.get(
     "/me",
     response_model=UserResponse,
+    dependencies=[Depends(rate_limit(RateLimitConfig.API))],
     responses={
         401: _error_responses[401],
         404: _error_responses[404],
+        429: _error_responses[429],
         500: _error_responses[500],
     },
 )
@@ -163,3 +252,33 @@ async def get_me(current_user: UserInDB = Depends(get_current_user_db)):
         picture=current_user.picture,
         role=current_user.role.value
     )
+
+
+# ==================== Token Introspection ====================
+
+@router.post(
+    "/introspect",
+    dependencies=[
+        Depends(get_current_user),
+        Depends(rate_limit(RateLimitConfig.INTROSPECT)),
+    ],
+    responses={
+        200: {"model": IntrospectionResponse | BatchIntrospectionResponse},
+        401: _error_responses[401],
+        422: _error_responses[422],
+        429: _error_responses[429],
+        500: _error_responses[500],
+    },
+)
+async def introspect(request: Request):
+    """
+    Access token introspection (RFC 7662, 서명 + 폐기 여부 검증). 호출자도 Bearer 토큰 필요.
+    - form: token=... → {"active": ...}
+    - JSON: {"token": ...} 또는 {"tokens": [...]} (배치) → {"results": [...]}
+    """
+    body = await _parse_body(request, IntrospectionRequest)
+    if body.tokens is not None:
+        content = {"results": await AuthService.introspect_many(body.tokens)}
+    else:
+        content = await AuthService.introspect(body.token)
+    return JSONResponse(content=content, headers={"Cache-Control": "no-store"})
@@ -0,0 +1,30 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.core.dependencies import require_client_scope
+from app.core.events import event_feed
+
+router = APIRouter(tags=["events"])
+
+# 폐기 이벤트에 다른 사용자의 jti / sub가 포함되므로 머신 클라이언트 전용
+EVENTS_SCOPE = "events:read"
+
+
+@router.get("/events", dependencies=[Depends(require_client_scope(EVENTS_SCOPE))])
+async def events(last_event_id: Optional[str] = Header(default=None)):
+    """
+    키 로테이션 / Access token 폐기 이벤트 스트림 (Server-Sent Events)
+    재연결 시 Last-Event-ID 이후 이벤트부터 전송, 버퍼에 없으면 reset 이벤트
+    """
+    return StreamingResponse(
+        event_feed.stream(last_event_id, heartbeat=settings.event_feed_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-store",
+            # nginx 등 리버스 프록시의 응답 버퍼링 비활성화
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -1,10 +1,29 @@
-from fastapi import APIRouter
-from app.core.jwt import get_jwks
+from fastapi import APIRouter, Request, Response
+from app.config import settings
+from app.core.jwt import get_jwks_response
 
 router = APIRouter(tags=["jwks"])
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더와 ETag 비교 (weak 비교, * 허용)"""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
 @router.get("/.well-known/jwks.json")
-async def jwks():
-    """공개키 JWKS 엔드포인트"""
-    return get_jwks()
+async def jwks(request: Request):
+    """공개키 JWKS 엔드포인트 (ETag / If-None-Match 지원)"""
+    body, etag = get_jwks_response()
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.jwks_max_age_seconds}",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
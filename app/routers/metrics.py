@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+
+from app.core.metrics import MetricsRegistry, registry
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape 엔드포인트 (text format 0.0.4)"""
+    return Response(content=registry.render(), media_type=MetricsRegistry.CONTENT_TYPE)
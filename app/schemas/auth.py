@@ -1,5 +1,7 @@
-from pydantic import BaseModel
-from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import Any, List, Literal, Optional
+
+from app.config import settings
 
 
 class ErrorResponse(BaseModel):
@@ -18,6 +20,22 @@ class TokenResponse(BaseModel):
     expires_in: int
 
 
+class ClientCredentialsRequest(BaseModel):
+    """RFC 6749 4.4 요청. client 인증은 HTTP Basic 또는 본문 client_id / client_secret"""
+    grant_type: Literal["client_credentials"]
+    client_id: Optional[str] = None
+    client_secret: Optional[str] = None
+    # 공백 구분 scope 목록 (생략 시 클라이언트에 허용된 전체)
+    scope: Optional[str] = None
+
+
+class ClientTokenResponse(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+    expires_in: int
+    scope: str
+
+
 class RefreshRequest(BaseModel):
     refresh_token: str
 
@@ -28,3 +46,27 @@ class UserResponse(BaseModel):
     name: str
     picture: Optional[str] = None
     role: str
+
+
+class IntrospectionRequest(BaseModel):
+    """RFC 7662 요청. token(단건) 또는 tokens(배치) 중 하나"""
+    token: Optional[str] = None
+    token_type_hint: Optional[str] = None
+    tokens: Optional[List[str]] = Field(default=None, min_length=1, max_length=settings.introspect_max_batch)
+
+    @model_validator(mode="after")
+    def check_one_of(self):
+        if (self.token is None) == (self.tokens is None):
+            raise ValueError("Provide either token or tokens")
+        return self
+
+
+class IntrospectionResponse(BaseModel):
+    """RFC 7662 응답. active=false면 다른 필드 없음"""
+    model_config = ConfigDict(extra="allow")
+
+    active: bool
+
+
+class BatchIntrospectionResponse(BaseModel):
+    results: List[IntrospectionResponse]
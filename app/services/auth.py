@@ -1,16 +1,31 @@
+import asyncio
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from app.config import settings
+from app.models.client import ClientCreate, ClientInDB
 from app.models.user import UserCreate, UserInDB
 from app.models.token import RefreshTokenCreate
+from app.repositories.client import ClientRepository
 from app.repositories.user import UserRepository
 from app.repositories.token import RefreshTokenRepository
-from app.core.jwt import create_access_token
-from app.core.security import generate_refresh_token, hash_token
+from app.core.client_cache import client_secret_cache
+from app.core.jwt import build_access_payload, build_client_payload
+from app.core.signing import token_signer
+from app.core.security import (
+    generate_client_secret,
+    generate_refresh_token,
+    hash_client_secret,
+    hash_token,
+    verify_client_secret,
+)
+from app.core.revocation import revocation_list
+from app.core.token_cache import verify_access_token
 from app.core.exceptions import (
+    AuthException,
     InvalidCredentialsException,
     InvalidEmailDomainException,
+    InvalidScopeException,
     TokenExpiredException,
     UserInfoNotFoundException,
     UserNotFoundException,
@@ -18,6 +33,9 @@ from app.core.exceptions import (
 
 
 class AuthService:
+    # 같은 client credentials의 동시 검증은 slow hash 1회로 합침 {(캐시 키, secret_hash): 검증 태스크}
+    _client_verifications: Dict[tuple, asyncio.Task] = {}
+
     @staticmethod
     def is_allowed_email(email: str) -> bool:
         """허용된 이메일 도메인인지 확인"""
@@ -72,52 +90,159 @@ class AuthService:
         )
         return await UserRepository.create(user_create)
 
-    @classmethod
-    async def create_tokens(cls, user: UserInDB) -> Tuple[str, str]:
-        """Access + Refresh 토큰 쌍 생성"""
-        access_token = create_access_token(
-            user_id=user.id,
-            email=user.email,
-            role=user.role.value
-        )
-
+    @staticmethod
+    def _new_refresh_token(user_id: str) -> Tuple[str, RefreshTokenCreate]:
+        """새 refresh token과 DB 저장용 문서 생성"""
         refresh_token = generate_refresh_token()
         expires_at = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
+        return refresh_token, RefreshTokenCreate(
+            user_id=user_id,
+            token_hash=hash_token(refresh_token),
+            expires_at=expires_at
+        )
 
-        await RefreshTokenRepository.create(
-            RefreshTokenCreate(
+    @classmethod
+    async def create_tokens(cls, user: UserInDB) -> Tuple[str, str]:
+        """Access + Refresh 토큰 쌍 생성"""
+        access_token = await token_signer.sign(
+            build_access_payload(
                 user_id=user.id,
-                token_hash=hash_token(refresh_token),
-                expires_at=expires_at
+                email=user.email,
+                role=user.role.value
             )
         )
 
+        refresh_token, token_create = cls._new_refresh_token(user.id)
+        await RefreshTokenRepository.create(token_create)
+
         return access_token, refresh_token
 
     @classmethod
-    async def refresh_tokens(cls, refresh_token: str) -> Tuple[str, str]:
-        """Refresh token으로 새 토큰 쌍 발급. 실패 시 예외 발생."""
-        token_hash = hash_token(refresh_token)
-        stored_token = await RefreshTokenRepository.get_by_token_hash(token_hash)
+    async def refresh_tokens(cls, refresh_token: str) -> Tuple[str, str, str]:
+        """
+        Refresh token으로 새 토큰 쌍 발급. (Access token, refresh token, user id) 반환. 실패 시 예외 발생.
+        기존 토큰은 조회와 동시에 폐기되므로 같은 refresh token은 한 번만 사용 가능.
+        """
+        stored_token = await RefreshTokenRepository.consume(hash_token(refresh_token))
 
         if not stored_token:
             raise InvalidCredentialsException("Invalid refresh token")
 
         if stored_token.expires_at < datetime.utcnow():
-            await RefreshTokenRepository.revoke(token_hash)
             raise TokenExpiredException()
 
-        # 기존 토큰 폐기
-        await RefreshTokenRepository.revoke(token_hash)
-
-        # 유저 조회 후 새 토큰 발급
-        user = await UserRepository.get_by_id(stored_token.user_id)
+        # 유저 조회와 새 refresh token 저장을 동시에 실행
+        new_refresh_token, token_create = cls._new_refresh_token(stored_token.user_id)
+        user, _ = await asyncio.gather(
+            UserRepository.get_by_id(stored_token.user_id),
+            RefreshTokenRepository.create(token_create),
+        )
         if not user:
+            await RefreshTokenRepository.revoke(token_create.token_hash)
             raise UserNotFoundException()
 
-        return await cls.create_tokens(user)
+        access_token = await token_signer.sign(
+            build_access_payload(
+                user_id=user.id,
+                email=user.email,
+                role=user.role.value
+            )
+        )
+        return access_token, new_refresh_token, user.id
+
+    @classmethod
+    async def logout(cls, user_id: str, access_claims: Optional[dict] = None) -> int:
+        """
+        유저의 모든 refresh token 폐기
+        access_claims(요청에 쓴 Access token)가 있으면 해당 토큰도 exp까지 폐기
+        """
+        if access_claims is None:
+            return await RefreshTokenRepository.revoke_all_for_user(user_id)
+
+        count, _ = await asyncio.gather(
+            RefreshTokenRepository.revoke_all_for_user(user_id),
+            revocation_list.revoke(access_claims),
+        )
+        return count
+
+    @staticmethod
+    async def introspect(token: str) -> dict:
+        """
+        RFC 7662 토큰 introspection (폐기 목록 filter 양성일 때만 DB 조회)
+        유효한 Access token이면 active=true + 클레임, 아니면 active=false만 반환
+        """
+        try:
+            payload = await verify_access_token(token)
+        except AuthException:
+            return {"active": False}
+        return {"active": True, "token_type": "Bearer", **payload}
+
+    @classmethod
+    async def introspect_many(cls, tokens: List[str]) -> List[dict]:
+        """배치 introspection. 같은 토큰이 여러 번 있으면 1회만 검증"""
+        unique = list(dict.fromkeys(tokens))
+        results: Dict[str, dict] = dict(zip(
+            unique,
+            await asyncio.gather(*(cls.introspect(token) for token in unique)),
+        ))
+        return [results[token] for token in tokens]
+
+    @classmethod
+    async def register_client(cls, name: str, scopes: List[str]) -> Tuple[ClientInDB, str]:
+        """머신 클라이언트 등록. (클라이언트, client secret) 반환 - secret 원문은 저장하지 않음"""
+        client_secret = generate_client_secret()
+        secret_hash = await asyncio.to_thread(hash_client_secret, client_secret)
+        client = await ClientRepository.create(ClientCreate(name=name, scopes=scopes), secret_hash)
+        return client, client_secret
+
+    @classmethod
+    async def authenticate_client(cls, client_id: str, client_secret: str) -> ClientInDB:
+        """
+        client credentials 검증. 실패 시 예외 발생.
+        클라이언트 문서는 매번 조회 (disabled / scopes 즉시 반영). secret_hash가 그대로면
+        client_secret_cache로 slow hash 생략
+        """
+        client = await ClientRepository.get_by_client_id(client_id)
+        if client is None or client.disabled:
+            raise InvalidCredentialsException("Invalid client credentials")
+        if client_secret_cache.get(client_id, client_secret) == client.secret_hash:
+            return client
+
+        # secret 교체 직후에는 이전 해시의 진행 중 검증과 합치지 않음
+        key = (client_secret_cache.key(client_id, client_secret), client.secret_hash)
+        task = cls._client_verifications.get(key)
+        if task is None:
+            # scrypt는 GIL을 놓으므로 스레드에서 실행해 이벤트 루프를 막지 않음
+            task = asyncio.ensure_future(
+                asyncio.to_thread(verify_client_secret, client_secret, client.secret_hash)
+            )
+            cls._client_verifications[key] = task
+            task.add_done_callback(lambda _: cls._client_verifications.pop(key, None))
+
+        if not await asyncio.shield(task):
+            raise InvalidCredentialsException("Invalid client credentials")
+        client_secret_cache.put(client_id, client_secret, client.secret_hash)
+        return client
 
     @classmethod
-    async def logout(cls, user_id: str) -> int:
-        """유저의 모든 refresh token 폐기"""
-        return await RefreshTokenRepository.revoke_all_for_user(user_id)
+    async def issue_client_token(
+        cls,
+        client_id: str,
+        client_secret: str,
+        scope: Optional[str] = None,
+    ) -> Tuple[str, List[str]]:
+        """
+        client_credentials grant: (Access token, 부여된 scope 목록) 반환
+        scope를 생략하면 클라이언트에 허용된 scope 전체
+        """
+        client = await cls.authenticate_client(client_id, client_secret)
+
+        if scope is None:
+            scopes = client.scopes
+        else:
+            scopes = list(dict.fromkeys(scope.split()))
+            if not set(scopes) <= set(client.scopes):
+                raise InvalidScopeException()
+
+        access_token = await token_signer.sign(build_client_payload(client.id, scopes))
+        return access_token, scopes
@@ -0,0 +1,49 @@
+"""
+머신 클라이언트(client_credentials grant) 관리 CLI
+
+    python -m app.services.clients create <name> --scopes <scope> ...
+    python -m app.services.clients disable <client_id>
+
+client secret은 생성 시 1회만 출력 (DB에는 scrypt 해시만 저장)
+"""
+import argparse
+import asyncio
+import sys
+
+from app.config import settings
+from app.core.database import close_db, connect_db
+from app.repositories.backends import get_storage
+from app.repositories.client import ClientRepository
+from app.services.auth import AuthService
+
+
+async def _main(args) -> int:
+    if settings.mongodb_enabled:
+        await connect_db()
+    await get_storage().connect()
+    try:
+        if args.command == "create":
+            client, client_secret = await AuthService.register_client(args.name, args.scopes)
+            print(f"client_id:     {client.id}")
+            print(f"client_secret: {client_secret}")
+            print(f"scopes:        {' '.join(client.scopes)}")
+            return 0
+
+        if not await ClientRepository.update(args.client_id, disabled=True):
+            print(f"Unknown client: {args.client_id}", file=sys.stderr)
+            return 1
+        return 0
+    finally:
+        await get_storage().close()
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    create = commands.add_parser("create")
+    create.add_argument("name")
+    create.add_argument("--scopes", nargs="*", default=[])
+    disable = commands.add_parser("disable")
+    disable.add_argument("client_id")
+    sys.exit(asyncio.run(_main(parser.parse_args())))
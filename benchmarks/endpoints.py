@@ -0,0 +1,281 @@
+"""
+인증 엔드포인트 성능 벤치마크 (in-process ASGI)
+
+httpx ASGITransport로 앱을 직접 호출하고 엔드포인트 / 동시성별로 측정:
+- 처리량 (req/s), p50 / p95 / p99 지연 (ms)
+- 요청당 메모리 할당 (tracemalloc peak, 동시성 1로 별도 측정해 지연 측정에 영향 없음)
+- 각 지표는 --rounds회 반복 측정의 중앙값 (실행 간 노이즈 완화)
+
+DB는 기본적으로 in-process 대역(benchmarks/fake_mongo.py) 사용.
+--mongodb-uri를 주면 로컬 mongod에 연결 (인덱스 적용 포함).
+--storage memory / sqlite면 users / refresh_tokens는 해당 storage backend 사용
+Rate limit은 카운터 갱신 비용은 그대로 두고 거부만 하지 않음.
+인증 이벤트 로그는 포맷 비용은 그대로 두고 /dev/null로 출력.
+
+결과는 --output JSON으로 저장하고, --baseline JSON과 비교해 threshold를 넘는
+회귀(처리량 감소, p50/p95 지연 증가, 할당 증가)가 있으면 exit 1.
+
+실행:
+    python -m benchmarks.endpoints --output bench.json
+    python -m benchmarks.endpoints --baseline bench.json --threshold 0.15
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from httpx import ASGITransport, AsyncClient
+
+from app.config import settings
+from app.core import database
+from app.core.audit import audit_sink
+from app.core.indexes import ensure_indexes
+from app.core.logging import console_handler
+from app.core.rate_limit import rate_limiter
+from app.core.rate_limit_backends import MemoryRateLimitBackend
+from app.core.signing import token_signer
+from app.main import app
+from app.models.user import UserCreate
+from app.repositories import backends
+from app.repositories.user import UserRepository
+from app.services.auth import AuthService
+from benchmarks.fake_mongo import FakeDatabase
+
+ENDPOINTS = ("jwks", "me", "refresh")
+
+# 회귀 판정 지표: (이름, 클수록 좋은지)
+METRICS = (
+    ("throughput", True),
+    ("p50_ms", False),
+    ("p95_ms", False),
+    ("alloc_kib", False),
+)
+
+
+class _NoRejectBackend(MemoryRateLimitBackend):
+    """GCRA 상태는 갱신하되 항상 허용 (벤치마크 부하가 429로 끝나지 않도록)"""
+
+    async def gcra(self, key: str, interval: float, tolerance: float):
+        _, tat_offset = await super().gcra(key, interval, tolerance)
+        return True, min(tat_offset, tolerance)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class VirtualClient:
+    """유저 1명 (Access token 1개, refresh할 때마다 새 refresh token)"""
+
+    def __init__(self, client: AsyncClient, access_token: str, refresh_token: str):
+        self.client = client
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+
+    async def request(self, endpoint: str) -> int:
+        if endpoint == "jwks":
+            response = await self.client.get("/.well-known/jwks.json")
+        elif endpoint == "me":
+            response = await self.client.get(
+                "/auth/me", headers={"Authorization": f"Bearer {self.access_token}"}
+            )
+        else:
+            response = await self.client.post(
+                "/auth/refresh", json={"refresh_token": self.refresh_token}
+            )
+            if response.status_code == 200:
+                self.refresh_token = response.json()["refresh_token"]
+        return response.status_code
+
+
+async def _new_virtual_client(client: AsyncClient, index: int) -> VirtualClient:
+    user = await UserRepository.create(UserCreate(
+        email=f"bench{index}@jbnu.ac.kr",
+        name=f"Bench {index}",
+        google_id=f"bench_{index}",
+    ))
+    access_token, refresh_token = await AuthService.create_tokens(user)
+    return VirtualClient(client, access_token, refresh_token)
+
+
+async def run_load(clients: List[VirtualClient], endpoint: str, total: int) -> dict:
+    """clients 수만큼 동시에 요청, 합계 total개"""
+    latencies: List[float] = []
+    errors = 0
+    remaining = [total]
+
+    async def worker(vc: VirtualClient):
+        nonlocal errors
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            start = time.perf_counter()
+            status = await vc.request(endpoint)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(vc) for vc in clients])
+    elapsed = time.perf_counter() - start
+
+    ms = 1000
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * ms,
+        "p95_ms": _percentile(latencies, 95) * ms,
+        "p99_ms": _percentile(latencies, 99) * ms,
+    }
+
+
+async def run_rounds(clients: List[VirtualClient], endpoint: str, total: int, rounds: int) -> dict:
+    """run_load를 rounds회 반복하고 지표별 중앙값 반환"""
+    samples = [await run_load(clients, endpoint, total) for _ in range(rounds)]
+    return {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+
+
+async def measure_allocations(vc: VirtualClient, endpoint: str, samples: int) -> float:
+    """요청 1개 처리 중 추가로 할당된 메모리 peak 평균 (KiB)"""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            await vc.request(endpoint)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+    return statistics.mean(peaks) / 1024
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """baseline 대비 threshold(비율)를 넘는 회귀 목록"""
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        for metric, higher_is_better in METRICS:
+            if not base.get(metric):
+                continue
+            change = (result[metric] - base[metric]) / base[metric]
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(
+                    f"{name} {metric}: {base[metric]:,.2f} -> {result[metric]:,.2f} ({change:+.1%})"
+                )
+    return regressions
+
+
+async def _setup_db(args):
+    if args.mongodb_uri:
+        settings.mongodb_uri = args.mongodb_uri
+        settings.mongodb_db_name = args.mongodb_db_name
+        await database.connect_db()
+        await database.get_db().users.delete_many({"google_id": {"$regex": "^bench_"}})
+    else:
+        database.db = FakeDatabase(latency=args.db_latency_ms / 1000)
+    await ensure_indexes(database.db)
+
+    if args.storage == "memory":
+        backends.storage = backends.MemoryStorageBackend()
+    elif args.storage == "sqlite":
+        backends.storage = backends.SQLiteStorageBackend(args.sqlite_path)
+    await backends.get_storage().connect()
+
+
+async def main(args) -> int:
+    await _setup_db(args)
+    rate_limiter.backend = _NoRejectBackend()
+    console_handler.setStream(open(os.devnull, "w"))
+    audit_sink.start()
+
+    results: Dict[str, dict] = {}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        pool = [await _new_virtual_client(client, i) for i in range(max(args.concurrency))]
+
+        print(f"{'endpoint':<10}{'conc':>6}{'req/s':>10}{'p50':>9}{'p95':>9}{'p99':>9}"
+              f"{'KiB/req':>9}{'errors':>8}   (ms)")
+        for endpoint in args.endpoints:
+            await run_load(pool[:1], endpoint, args.warmup)
+            alloc_kib = await measure_allocations(pool[0], endpoint, args.alloc_samples)
+
+            for concurrency in args.concurrency:
+                result = await run_rounds(pool[:concurrency], endpoint, args.requests, args.rounds)
+                result["alloc_kib"] = alloc_kib
+                results[f"{endpoint}@{concurrency}"] = result
+                print(
+                    f"{endpoint:<10}{concurrency:>6}{result['throughput']:>10,.0f}"
+                    f"{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}{result['p99_ms']:>9.2f}"
+                    f"{alloc_kib:>9.1f}{result['errors']:>8}"
+                )
+
+    token_signer.shutdown()
+    await audit_sink.stop()
+    await backends.get_storage().close()
+    if args.mongodb_uri:
+        await database.close_db()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "jwt_algorithm": settings.jwt_algorithm,
+            "database": "mongodb" if args.mongodb_uri else f"fake (latency {args.db_latency_ms}ms)",
+            "storage": args.storage,
+            "requests": args.requests,
+            "rounds": args.rounds,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"saved: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        print(f"{len(regressions)} regression(s) vs {args.baseline} (threshold {args.threshold:.0%})")
+        return 1 if regressions else 0
+    return 0
+
+
+def _parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64], help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=2000, help="엔드포인트/동시성당 요청 수")
+    parser.add_argument("--rounds", type=int, default=3, help="반복 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--alloc-samples", type=int, default=50, help="할당 측정 요청 수")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="DB 대역 연산당 지연")
+    parser.add_argument("--mongodb-uri", help="로컬 mongod 사용 (미지정 시 in-process 대역)")
+    parser.add_argument("--mongodb-db-name", default="authentic_bench")
+    parser.add_argument(
+        "--storage", choices=("mongodb", "memory", "sqlite"), default="mongodb",
+        help="users / refresh_tokens 저장소 (mongodb는 --mongodb-uri 또는 대역)",
+    )
+    parser.add_argument("--sqlite-path", default=":memory:")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 baseline JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀 판정 비율 (0.10 = 10%%)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(_parse_args())))
@@ -0,0 +1,75 @@
+"""
+이벤트 피드(SSE) 구독자 수별 전달 지연 / 메모리 측정
+
+구독자마다 EventFeed.stream()을 소비하는 태스크를 띄우고, 이벤트 발행 시각부터
+모든 구독자가 프레임을 받을 때까지의 시간을 잰다 (HTTP 계층 제외, 팬아웃 비용만).
+
+실행: python -m benchmarks.event_feed [--subscribers 100 1000 5000] [--events 50]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+from app.core.events import EventFeed
+
+
+async def _consume(stream, remaining: dict, done: asyncio.Event):
+    async for frame in stream:
+        if frame.startswith(b"id:"):
+            remaining["count"] -= 1
+            if remaining["count"] == 0:
+                done.set()
+
+
+async def _measure(subscribers: int, events: int):
+    feed = EventFeed(buffer_size=1024)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    remaining = {"count": 0}
+    done = asyncio.Event()
+    streams = [feed.stream(heartbeat=3600) for _ in range(subscribers)]
+    tasks = [asyncio.create_task(_consume(s, remaining, done)) for s in streams]
+    # 모든 구독자가 대기 상태가 될 때까지
+    await asyncio.sleep(0.1)
+    per_subscriber = (tracemalloc.get_traced_memory()[0] - before) / subscribers
+    tracemalloc.stop()
+
+    latencies = []
+    for i in range(events):
+        remaining["count"] = subscribers
+        done.clear()
+        start = time.perf_counter()
+        feed.publish("revocation", {"jti": f"jti-{i}", "sub": "user", "exp": 0})
+        await done.wait()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies.sort()
+    return (
+        statistics.median(latencies),
+        latencies[int(len(latencies) * 0.99) - 1],
+        per_subscriber,
+    )
+
+
+async def main(args):
+    print(f"{'subscribers':>12}{'p50 ms':>10}{'p99 ms':>10}{'µs/sub':>10}{'KiB/sub':>10}")
+    for subscribers in args.subscribers:
+        p50, p99, memory = await _measure(subscribers, args.events)
+        print(
+            f"{subscribers:>12}{p50:>10.2f}{p99:>10.2f}"
+            f"{p50 * 1000 / subscribers:>10.2f}{memory / 1024:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--events", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
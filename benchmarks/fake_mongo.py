@@ -0,0 +1,148 @@
+"""
+벤치마크용 in-process MongoDB 대역
+
+리포지토리가 쓰는 Motor 연산만 구현 (find_one, insert_one, insert_many, update_one,
+update_many, find_one_and_update, delete_one, create_indexes). 필터는 최상위 필드 동등 비교만 지원.
+create_indexes로 선언된 인덱스의 첫 필드는 해시 인덱스로 유지해 문서 수와 무관하게 조회.
+latency를 주면 연산마다 네트워크 왕복 시간만큼 대기.
+"""
+import asyncio
+import copy
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Set
+
+from bson import ObjectId
+from pymongo import IndexModel, ReturnDocument
+
+
+class FakeCollection:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self._docs: Dict[object, dict] = {}
+        # {필드: {값: {_id}}}
+        self._indexes: Dict[str, Dict[object, Set[object]]] = {}
+
+    async def _round_trip(self):
+        await asyncio.sleep(self.latency)
+
+    def _index_add(self, doc: dict):
+        for field, index in self._indexes.items():
+            if field in doc:
+                index[doc[field]].add(doc["_id"])
+
+    def _index_remove(self, doc: dict):
+        for field, index in self._indexes.items():
+            if field in doc:
+                index[doc[field]].discard(doc["_id"])
+
+    def _candidates(self, query: dict) -> List[dict]:
+        if "_id" in query:
+            doc = self._docs.get(query["_id"])
+            return [doc] if doc else []
+        for field, index in self._indexes.items():
+            if field in query:
+                return [self._docs[_id] for _id in index.get(query[field], ())]
+        return list(self._docs.values())
+
+    def _find(self, query: dict) -> List[dict]:
+        return [
+            doc for doc in self._candidates(query)
+            if all(doc.get(key) == value for key, value in query.items())
+        ]
+
+    def _apply(self, doc: dict, update: dict):
+        self._index_remove(doc)
+        doc.update(update.get("$set", {}))
+        self._index_add(doc)
+
+    async def create_indexes(self, indexes: List[IndexModel]):
+        for model in indexes:
+            field = next(iter(model.document["key"]))
+            if field not in self._indexes:
+                self._indexes[field] = defaultdict(set)
+                for doc in self._docs.values():
+                    self._index_add(doc)
+
+    async def find_one(self, query: dict) -> Optional[dict]:
+        await self._round_trip()
+        found = self._find(query)
+        return copy.copy(found[0]) if found else None
+
+    async def insert_one(self, doc: dict):
+        await self._round_trip()
+        doc.setdefault("_id", ObjectId())
+        stored = copy.copy(doc)
+        self._docs[stored["_id"]] = stored
+        self._index_add(stored)
+        return SimpleNamespace(inserted_id=stored["_id"])
+
+    async def insert_many(self, docs: List[dict], ordered: bool = True):
+        await self._round_trip()
+        inserted_ids = []
+        for doc in docs:
+            doc.setdefault("_id", ObjectId())
+            stored = copy.copy(doc)
+            self._docs[stored["_id"]] = stored
+            self._index_add(stored)
+            inserted_ids.append(stored["_id"])
+        return SimpleNamespace(inserted_ids=inserted_ids)
+
+    async def update_one(self, query: dict, update: dict, upsert: bool = False):
+        await self._round_trip()
+        found = self._find(query)[:1]
+        for doc in found:
+            self._apply(doc, update)
+        if not found and upsert:
+            doc = {"_id": ObjectId(), **query}
+            self._apply(doc, update)
+            self._docs[doc["_id"]] = doc
+        return SimpleNamespace(matched_count=len(found), modified_count=len(found))
+
+    async def update_many(self, query: dict, update: dict):
+        await self._round_trip()
+        found = self._find(query)
+        for doc in found:
+            self._apply(doc, update)
+        return SimpleNamespace(matched_count=len(found), modified_count=len(found))
+
+    async def find_one_and_update(
+        self,
+        query: dict,
+        update: dict,
+        return_document: bool = ReturnDocument.BEFORE,
+    ) -> Optional[dict]:
+        await self._round_trip()
+        found = self._find(query)
+        if not found:
+            return None
+        doc = found[0]
+        before = copy.copy(doc)
+        self._apply(doc, update)
+        return before if return_document == ReturnDocument.BEFORE else copy.copy(doc)
+
+    async def delete_one(self, query: dict):
+        await self._round_trip()
+        found = self._find(query)[:1]
+        for doc in found:
+            self._index_remove(doc)
+            del self._docs[doc["_id"]]
+        return SimpleNamespace(deleted_count=len(found))
+
+
+class FakeDatabase:
+    """컬렉션은 속성/인덱싱 접근 시 생성"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self._collections: Dict[str, FakeCollection] = {}
+
+    def __getitem__(self, name: str) -> FakeCollection:
+        if name not in self._collections:
+            self._collections[name] = FakeCollection(self.latency)
+        return self._collections[name]
+
+    def __getattr__(self, name: str) -> FakeCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
@@ -0,0 +1,58 @@
+"""
+JWT 서명 알고리즘별 서명/검증 처리량과 토큰 크기 비교
+
+RS256: RSA 2048-bit
+ES256: ECDSA P-256
+EdDSA: Ed25519
+
+실행: python -m benchmarks.jwt_algorithms [--seconds 2]
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from jose import jwk, jwt
+
+from app.core.security import SUPPORTED_ALGORITHMS, generate_private_key
+from benchmarks.jwt_keys import _rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=2.0, help="측정 항목당 실행 시간")
+    args = parser.parse_args()
+
+    payload = {
+        "sub": "bench_user",
+        "email": "bench@jbnu.ac.kr",
+        "role": "user",
+        "exp": datetime.utcnow() + timedelta(minutes=15),
+        "iat": datetime.utcnow(),
+        "type": "access",
+    }
+
+    print(f"{'alg':<8}{'sign/s':>12}{'verify/s':>12}{'sig bytes':>11}{'token bytes':>13}")
+    for algorithm in SUPPORTED_ALGORITHMS:
+        private_key = generate_private_key(algorithm)
+        signer = jwk.construct(private_key, algorithm)
+        verifier = jwk.construct(private_key.public_key(), algorithm)
+        headers = {"kid": "x" * 43}  # 실제 kid(thumbprint)와 같은 길이
+
+        token = jwt.encode(payload, signer, algorithm=algorithm, headers=headers)
+        signature = token.rsplit(".", 1)[1]
+
+        sign_rate = _rate(
+            lambda: jwt.encode(payload, signer, algorithm=algorithm, headers=headers),
+            args.seconds,
+        )
+        verify_rate = _rate(
+            lambda: jwt.decode(token, verifier, algorithms=[algorithm]),
+            args.seconds,
+        )
+        print(
+            f"{algorithm:<8}{sign_rate:>12,.0f}{verify_rate:>12,.0f}"
+            f"{len(signature) * 3 // 4:>11}{len(token):>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
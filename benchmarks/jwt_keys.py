@@ -0,0 +1,77 @@
+"""
+JWT 서명/검증 키 처리 방식별 처리량 비교 (2048-bit RSA)
+
+before: 매 호출마다 PEM 문자열을 python-jose에 전달 (호출마다 키 파싱)
+after:  PEM을 1회 파싱한 jose Key 객체를 재사용
+
+실행: python -m benchmarks.jwt_keys [--seconds 2]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+ALGORITHM = "RS256"
+
+
+def _rate(fn: Callable[[], object], seconds: float) -> float:
+    """seconds 동안 fn을 반복 실행하고 초당 실행 횟수 반환"""
+    fn()  # warmup
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=2.0, help="측정 항목당 실행 시간")
+    args = parser.parse_args()
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+
+    signer = jwk.construct(private_key, ALGORITHM)
+    verifier = jwk.construct(private_key.public_key(), ALGORITHM)
+
+    payload = {
+        "sub": "bench_user",
+        "email": "bench@jbnu.ac.kr",
+        "role": "user",
+        "exp": datetime.utcnow() + timedelta(minutes=15),
+        "iat": datetime.utcnow(),
+        "type": "access",
+    }
+    token = jwt.encode(payload, private_pem, algorithm=ALGORITHM)
+
+    results = {
+        "sign (PEM str)": _rate(lambda: jwt.encode(payload, private_pem, algorithm=ALGORITHM), args.seconds),
+        "sign (parsed key)": _rate(lambda: jwt.encode(payload, signer, algorithm=ALGORITHM), args.seconds),
+        "verify (PEM str)": _rate(lambda: jwt.decode(token, public_pem, algorithms=[ALGORITHM]), args.seconds),
+        "verify (parsed key)": _rate(lambda: jwt.decode(token, verifier, algorithms=[ALGORITHM]), args.seconds),
+    }
+
+    print(f"{'case':<22}{'ops/sec':>12}")
+    for name, rate in results.items():
+        print(f"{name:<22}{rate:>12,.0f}")
+    print(f"sign speedup:   {results['sign (parsed key)'] / results['sign (PEM str)']:.2f}x")
+    print(f"verify speedup: {results['verify (parsed key)'] / results['verify (PEM str)']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+메트릭 계측 비용 측정 (µs/호출)
+
+- histogram observe / counter inc
+- observe_repository 데코레이터 (계측 없는 같은 코루틴 대비 추가 비용)
+- MetricsMiddleware (빈 ASGI 앱 직접 호출 대비 추가 비용)
+- 요청당 합계 추정: 미들웨어 1 + 리포지토리 연산 2 + JWT 검증 1 + rate limit 카운터 1
+
+실행: python -m benchmarks.metrics_overhead [--iterations 200000]
+"""
+import argparse
+import asyncio
+import time
+
+from app.core.metrics import (
+    Counter,
+    Histogram,
+    MetricsMiddleware,
+    observe_repository,
+)
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def _async_per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def _noop_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _noop_send(message):
+    pass
+
+
+async def _noop_receive():
+    return {"type": "http.request"}
+
+
+async def main(args):
+    n = args.iterations
+    histogram = Histogram("bench_seconds", "bench", ["op"]).labels("x")
+    counter = Counter("bench_total", "bench", ["op"]).labels("x")
+
+    observe = _per_call_us(lambda: histogram.observe(0.0012), n)
+    inc = _per_call_us(lambda: counter.inc(), n)
+
+    class Repo:
+        @classmethod
+        async def plain(cls):
+            return None
+
+        @classmethod
+        @observe_repository
+        async def timed(cls):
+            return None
+
+    repo = await _async_per_call_us(Repo.timed, n) - await _async_per_call_us(Repo.plain, n)
+
+    scope = {"type": "http", "method": "GET", "path": "/health"}
+    middleware = MetricsMiddleware(_noop_app)
+    bare = await _async_per_call_us(lambda: _noop_app(scope, _noop_receive, _noop_send), n)
+    wrapped = await _async_per_call_us(lambda: middleware(scope, _noop_receive, _noop_send), n)
+    request = wrapped - bare
+
+    rows = [
+        ("histogram.observe", observe),
+        ("counter.inc", inc),
+        ("observe_repository", repo),
+        ("MetricsMiddleware", request),
+        ("per request (est.)", request + 2 * repo + observe + inc),
+    ]
+    print(f"{'case':<22}{'µs/call':>10}")
+    for name, value in rows:
+        print(f"{name:<22}{value:>10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200_000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,95 @@
+"""
+RateLimiter 추적 키 수별 check_rate_limit 지연 시간 측정
+
+legacy: 매 요청마다 전체 dict를 스캔하던 이전 구현 (비교용 재현)
+memory: MemoryRateLimitBackend (expiry heap + LRU 상한)
+shm:    SharedMemoryRateLimitBackend (mmap 해시 테이블 + flock)
+
+실행: python -m benchmarks.rate_limit [--keys 1000 10000 100000 200000]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Dict, Tuple
+
+from app.core.rate_limit import RateLimiter
+from app.core.rate_limit_backends import MemoryRateLimitBackend, SharedMemoryRateLimitBackend
+
+
+class LegacyRateLimiter(RateLimiter):
+    """이전 구현: check마다 _requests 전체를 스캔"""
+
+    def __init__(self):
+        self._requests: Dict[str, Tuple[int, datetime]] = {}
+
+    def prefill(self, num_keys: int):
+        # check_rate_limit으로 채우면 O(n^2)이므로 직접 삽입
+        now = datetime.utcnow()
+        for i in range(num_keys):
+            self._requests[self._get_key(_request(i), "bench")] = (1, now)
+
+    async def check_rate_limit(self, request, endpoint, max_requests=10, window_seconds=60):
+        now = datetime.utcnow()
+        expired = [
+            key for key, (_, start) in self._requests.items()
+            if now - start > timedelta(minutes=5)
+        ]
+        for key in expired:
+            del self._requests[key]
+
+        key = self._get_key(request, endpoint)
+        count, start = self._requests.get(key, (0, now))
+        self._requests[key] = (count + 1, start)
+        return True
+
+
+def _request(i: int):
+    return SimpleNamespace(client=SimpleNamespace(host=f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"))
+
+
+async def _measure(limiter: RateLimiter, num_keys: int, checks: int) -> float:
+    """num_keys개 키를 채운 뒤 새 키 checks회의 평균 지연(µs) 반환"""
+    if isinstance(limiter, LegacyRateLimiter):
+        limiter.prefill(num_keys)
+    else:
+        for i in range(num_keys):
+            await limiter.check_rate_limit(_request(i), "bench", max_requests=1_000_000)
+
+    requests = [_request(num_keys + i) for i in range(checks)]
+    start = time.perf_counter()
+    for request in requests:
+        await limiter.check_rate_limit(request, "bench", max_requests=1_000_000)
+    return (time.perf_counter() - start) / checks * 1e6
+
+
+async def run(args):
+    max_keys = max(args.keys)
+    print(f"{'keys':>10}{'legacy µs':>12}{'memory µs':>12}{'shm µs':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_keys in args.keys:
+            legacy = await _measure(LegacyRateLimiter(), num_keys, args.legacy_checks)
+            memory = await _measure(
+                RateLimiter(MemoryRateLimitBackend(max_keys=max_keys)), num_keys, args.checks
+            )
+            shm_backend = SharedMemoryRateLimitBackend(
+                os.path.join(tmp, f"rate-limit-{num_keys}"), slots=max_keys * 2
+            )
+            shm = await _measure(RateLimiter(shm_backend), num_keys, args.checks)
+            await shm_backend.close()
+            print(f"{num_keys:>10,}{legacy:>12.2f}{memory:>12.2f}{shm:>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, nargs="+", default=[1_000, 10_000, 100_000, 200_000])
+    parser.add_argument("--checks", type=int, default=10_000, help="memory/shm 측정 횟수")
+    parser.add_argument("--legacy-checks", type=int, default=20, help="legacy 구현 측정 횟수")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+refresh token 저장소 크기: rotation 횟수에 따른 문서 수 / 크기 (compaction 전후)
+
+세션 --sessions개가 각각 --rotations번 refresh(consume + 새 토큰 저장)한 뒤
+저장소 크기를 재고, compact 후 다시 측정. compaction 후 문서 수는 세션 수와 같아야 함
+
+backend:
+- memory, sqlite (임시 파일, 사용 중인 페이지 크기)
+- mongodb, mongodb-bucketed (--mongodb-uri 지정 시, collStats storageSize + totalIndexSize)
+
+실행: python -m benchmarks.refresh_token_storage [--sessions 1000] [--rotations 20] [--mongodb-uri ...]
+"""
+import argparse
+import asyncio
+import os
+import secrets
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from app.core import database
+from app.core.indexes import ensure_indexes
+from app.core.security import hash_token
+from app.models.token import RefreshTokenCreate
+from app.repositories import backends
+from app.repositories.token import RefreshTokenRepository
+
+
+def _new_token(user_id: str) -> Tuple[str, RefreshTokenCreate]:
+    token = secrets.token_urlsafe(32)
+    return token, RefreshTokenCreate(
+        user_id=user_id,
+        token_hash=hash_token(token),
+        expires_at=datetime.utcnow() + timedelta(days=7),
+    )
+
+
+async def _size(backend: backends.StorageBackend) -> Tuple[int, int]:
+    """(문서 수, 바이트). memory는 바이트를 재지 않음"""
+    store = backend.refresh_tokens
+    if isinstance(store, backends.MemoryRefreshTokenStore):
+        return len(store._docs), 0
+    if isinstance(store, backends.SQLiteRefreshTokenStore):
+        _, row = await backend.run("SELECT COUNT(*) AS n FROM refresh_tokens")
+        # 삭제된 페이지는 freelist로 재사용되므로 사용 중인 페이지만
+        _, pages = await backend.run("PRAGMA page_count")
+        _, free = await backend.run("PRAGMA freelist_count")
+        _, page_size = await backend.run("PRAGMA page_size")
+        return row["n"], (pages[0] - free[0]) * page_size[0]
+
+    names = await database.get_db().list_collection_names(filter={"name": {"$regex": "^refresh_tokens"}})
+    count = size = 0
+    for name in names:
+        stats = await database.get_db().command("collStats", name)
+        count += stats["count"]
+        size += stats.get("storageSize", 0) + stats.get("totalIndexSize", 0)
+    return count, size
+
+
+async def _run_backend(backend: backends.StorageBackend, args) -> Dict[str, float]:
+    backends.storage = backend
+    await backend.connect()
+
+    tokens: List[str] = []
+    for i in range(args.sessions):
+        token, create = _new_token(f"user_{i}")
+        await RefreshTokenRepository.create(create)
+        tokens.append(token)
+
+    start = time.perf_counter()
+    for _ in range(args.rotations):
+        for i, token in enumerate(tokens):
+            await RefreshTokenRepository.consume(hash_token(token))
+            tokens[i], create = _new_token(f"user_{i}")
+            await RefreshTokenRepository.create(create)
+    elapsed = time.perf_counter() - start
+
+    before = await _size(backend)
+    compact_start = time.perf_counter()
+    removed = await RefreshTokenRepository.compact(args.batch_size)
+    compact_ms = (time.perf_counter() - compact_start) * 1000
+    after = await _size(backend)
+    await backend.close()
+    return {
+        "rotations_per_s": args.sessions * args.rotations / elapsed,
+        "docs_before": before[0],
+        "kib_before": before[1] / 1024,
+        "removed": removed,
+        "compact_ms": compact_ms,
+        "docs_after": after[0],
+        "kib_after": after[1] / 1024,
+    }
+
+
+async def run(args):
+    print(f"{'backend':<18}{'rot/s':>9}{'docs':>10}{'KiB':>10}{'removed':>10}{'ms':>8}{'docs':>8}{'KiB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        candidates = [
+            ("memory", lambda: backends.MemoryStorageBackend()),
+            ("sqlite", lambda: backends.SQLiteStorageBackend(os.path.join(tmp, "bench.db"))),
+        ]
+        if args.mongodb_uri:
+            database.settings.mongodb_uri = args.mongodb_uri
+            database.settings.mongodb_db_name = args.mongodb_db_name
+            await database.connect_db()
+            await database.client.drop_database(args.mongodb_db_name)
+            await ensure_indexes(database.get_db())
+            candidates += [
+                ("mongodb", lambda: backends.MongoStorageBackend("single")),
+                ("mongodb-bucketed", lambda: backends.MongoStorageBackend("bucketed")),
+            ]
+
+        for name, factory in candidates:
+            r = await _run_backend(factory(), args)
+            print(
+                f"{name:<18}{r['rotations_per_s']:>9,.0f}{r['docs_before']:>10,}{r['kib_before']:>10,.0f}"
+                f"{r['removed']:>10,}{r['compact_ms']:>8.0f}{r['docs_after']:>8,}{r['kib_after']:>10,.0f}"
+            )
+
+        if args.mongodb_uri:
+            await database.client.drop_database(args.mongodb_db_name)
+            await database.close_db()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--rotations", type=int, default=20, help="세션당 refresh 횟수")
+    parser.add_argument("--batch-size", type=int, default=1000, help="compact 연산당 삭제 수")
+    parser.add_argument("--mongodb-uri", help="로컬 mongod 사용 (mongodb / mongodb-bucketed 측정)")
+    parser.add_argument("--mongodb-db-name", default="authentic_bench_tokens")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
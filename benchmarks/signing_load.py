@@ -0,0 +1,103 @@
+"""
+토큰 발급 부하 중 이벤트 루프 지연과 /health 응답 시간 측정
+
+inline:   요청 경로에서 create_access_token 직접 호출 (이벤트 루프에서 RSA 서명)
+executor: token_signer.sign (전용 스레드 풀 + micro-batch)
+
+실행: python -m benchmarks.signing_load [--seconds 3] [--concurrency 32]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from httpx import ASGITransport, AsyncClient
+
+from app.core.jwt import build_access_payload, create_access_token
+from app.core.signing import TokenSigner
+from app.main import app
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def _lag_probe(stop: asyncio.Event, lags: List[float], interval: float = 0.001):
+    """interval마다 깨어나며 예정보다 늦어진 시간 기록"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def _health_probe(stop: asyncio.Event, client: AsyncClient, latencies: List[float]):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/health")
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.005)
+
+
+async def _issue_inline(stop: asyncio.Event, counter: List[int]):
+    while not stop.is_set():
+        create_access_token("bench_user", "bench@jbnu.ac.kr", "user")
+        counter[0] += 1
+        await asyncio.sleep(0)
+
+
+async def _issue_executor(stop: asyncio.Event, counter: List[int], signer: TokenSigner):
+    while not stop.is_set():
+        await signer.sign(build_access_payload("bench_user", "bench@jbnu.ac.kr", "user"))
+        counter[0] += 1
+
+
+async def run_mode(mode: str, seconds: float, concurrency: int, workers: int):
+    stop = asyncio.Event()
+    lags: List[float] = []
+    health: List[float] = []
+    counter = [0]
+    signer = TokenSigner(max_workers=workers)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        probes = [
+            asyncio.create_task(_lag_probe(stop, lags)),
+            asyncio.create_task(_health_probe(stop, client, health)),
+        ]
+        if mode == "inline":
+            load = [asyncio.create_task(_issue_inline(stop, counter)) for _ in range(concurrency)]
+        else:
+            load = [
+                asyncio.create_task(_issue_executor(stop, counter, signer))
+                for _ in range(concurrency)
+            ]
+
+        await asyncio.sleep(seconds)
+        stop.set()
+        await asyncio.gather(*probes, *load)
+
+    signer.shutdown()
+    ms = 1000
+    print(
+        f"{mode:<10}{counter[0] / seconds:>10,.0f}"
+        f"{statistics.median(lags) * ms:>10.2f}{_percentile(lags, 99) * ms:>10.2f}{max(lags) * ms:>10.2f}"
+        f"{statistics.median(health) * ms:>10.2f}{_percentile(health, 99) * ms:>10.2f}"
+    )
+
+
+async def main(args):
+    print(f"{'mode':<10}{'tokens/s':>10}{'lag p50':>10}{'lag p99':>10}{'lag max':>10}"
+          f"{'hc p50':>10}{'hc p99':>10}   (ms)")
+    for mode in ("inline", "executor"):
+        await run_mode(mode, args.seconds, args.concurrency, args.workers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 토큰 발급 태스크 수")
+    parser.add_argument("--workers", type=int, default=2, help="서명 스레드 수")
+    asyncio.run(main(parser.parse_args()))
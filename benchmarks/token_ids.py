@@ -0,0 +1,153 @@
+"""
+refresh token 문서 키: {_id: ObjectId, token_hash: hex} vs {_id: SHA-256 digest(BinData)}
+
+항상 출력: 문서 1개의 BSON 크기와 인덱스 키 바이트 (legacy는 _id + token_hash 두 인덱스)
+--mongodb-uri 지정 시: --tokens개(기본 1,000,000)를 두 컬렉션에 적재한 뒤
+collStats(storageSize / totalIndexSize)와 조회 / consume 지연 시간(p50 / p99) 비교
+
+실행: python -m benchmarks.token_ids [--tokens 1000000] [--lookups 10000] [--mongodb-uri ...]
+"""
+import argparse
+import asyncio
+import random
+import secrets
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+import bson
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import ASCENDING
+
+from app.core.security import hash_token
+
+_INSERT_BATCH = 10_000
+
+
+def _legacy_doc(token_hash: str, now: datetime) -> dict:
+    return {
+        "_id": ObjectId(),
+        "user_id": str(ObjectId()),
+        "token_hash": token_hash,
+        "expires_at": now + timedelta(days=7),
+        "created_at": now,
+        "revoked": False,
+    }
+
+
+def _digest_doc(token_hash: str, now: datetime) -> dict:
+    doc = _legacy_doc(token_hash, now)
+    del doc["token_hash"]
+    doc["_id"] = bytes.fromhex(token_hash)
+    return doc
+
+
+def document_sizes() -> Dict[str, Dict[str, int]]:
+    """BSON 문서 크기 / 토큰 조회에 쓰는 인덱스 키 크기 (바이트, 값 인코딩 기준)"""
+    token_hash = hash_token("token")
+    now = datetime.utcnow()
+    legacy = _legacy_doc(token_hash, now)
+    digest = _digest_doc(token_hash, now)
+    return {
+        "legacy": {
+            "document": len(bson.encode(legacy)),
+            # _id 인덱스 + token_hash unique 인덱스
+            "index_keys": len(bson.encode({"": legacy["_id"]})) + len(bson.encode({"": token_hash})),
+        },
+        "digest": {
+            "document": len(bson.encode(digest)),
+            "index_keys": len(bson.encode({"": digest["_id"]})),
+        },
+    }
+
+
+async def _seed(collection: AsyncIOMotorCollection, hashes: List[str], make: Callable[[str, datetime], dict]):
+    now = datetime.utcnow()
+    for start in range(0, len(hashes), _INSERT_BATCH):
+        batch = hashes[start:start + _INSERT_BATCH]
+        await collection.insert_many([make(h, now) for h in batch], ordered=False)
+
+
+async def _latency(op: Callable, samples: List[str]) -> Dict[str, float]:
+    timings = []
+    for token_hash in samples:
+        start = time.perf_counter()
+        await op(token_hash)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p99": timings[int(len(timings) * 0.99) - 1],
+    }
+
+
+async def _stats(collection: AsyncIOMotorCollection) -> Dict[str, float]:
+    stats = await collection.database.command("collStats", collection.name)
+    return {
+        "storage_mib": stats.get("storageSize", 0) / 2**20,
+        "index_mib": stats.get("totalIndexSize", 0) / 2**20,
+    }
+
+
+async def run_mongodb(args):
+    client = AsyncIOMotorClient(args.mongodb_uri)
+    await client.drop_database(args.mongodb_db_name)
+    db = client[args.mongodb_db_name]
+    legacy, digest = db["legacy_tokens"], db["digest_tokens"]
+    await legacy.create_index([("token_hash", ASCENDING)], unique=True)
+
+    hashes = [hash_token(secrets.token_urlsafe(32)) for _ in range(args.tokens)]
+    await _seed(legacy, hashes, _legacy_doc)
+    await _seed(digest, hashes, _digest_doc)
+
+    find_samples = random.sample(hashes, args.lookups)
+    consume_samples = random.sample(hashes, args.lookups)
+    active = {"revoked": False}
+    consumed = {"$set": {"revoked": True}}
+    ops = {
+        "legacy": {
+            "find": lambda h: legacy.find_one({"token_hash": h, **active}),
+            "consume": lambda h: legacy.find_one_and_update({"token_hash": h, **active}, consumed),
+        },
+        "digest": {
+            "find": lambda h: digest.find_one({"_id": bytes.fromhex(h), **active}),
+            "consume": lambda h: digest.find_one_and_update({"_id": bytes.fromhex(h), **active}, consumed),
+        },
+    }
+
+    print(f"\n{args.tokens:,} tokens, {args.lookups:,} lookups (ms)")
+    print(f"{'layout':<10}{'data MiB':>10}{'index MiB':>11}{'find p50':>10}{'p99':>8}{'consume p50':>13}{'p99':>8}")
+    for name, collection in (("legacy", legacy), ("digest", digest)):
+        find = await _latency(ops[name]["find"], find_samples)
+        consume = await _latency(ops[name]["consume"], consume_samples)
+        stats = await _stats(collection)
+        print(
+            f"{name:<10}{stats['storage_mib']:>10.1f}{stats['index_mib']:>11.1f}"
+            f"{find['p50']:>10.3f}{find['p99']:>8.3f}{consume['p50']:>13.3f}{consume['p99']:>8.3f}"
+        )
+
+    await client.drop_database(args.mongodb_db_name)
+    client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=10_000, help="지연 시간 측정 횟수 (연산별)")
+    parser.add_argument("--mongodb-uri", help="로컬 mongod 사용 (컬렉션 크기 / 지연 시간 측정)")
+    parser.add_argument("--mongodb-db-name", default="authentic_bench_token_ids")
+    args = parser.parse_args()
+
+    sizes = document_sizes()
+    print(f"{'layout':<10}{'doc bytes':>10}{'index key bytes':>17}")
+    for name, size in sizes.items():
+        print(f"{name:<10}{size['document']:>10}{size['index_keys']:>17}")
+
+    if args.mongodb_uri:
+        asyncio.run(run_mongodb(args))
+
+
+if __name__ == "__main__":
+    main()
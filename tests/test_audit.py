@@ -0,0 +1,135 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+from app.core.audit import AuditSink
+from app.repositories.audit import AuditEventRepository
+
+
+class FakeAuditCollection:
+    """insert_many 호출만 기록하는 audit_events 컬렉션 대역"""
+
+    def __init__(self, fail: bool = False):
+        self.batches = []
+        self.fail = fail
+
+    async def insert_many(self, docs, ordered=True):
+        await asyncio.sleep(0)
+        assert ordered is False
+        if self.fail:
+            raise BulkWriteError({"nInserted": len(docs) - 1, "writeErrors": [{}]})
+        self.batches.append(list(docs))
+        return SimpleNamespace(inserted_ids=list(range(len(docs))))
+
+
+@pytest.fixture
+def audit_collection(monkeypatch):
+    collection = FakeAuditCollection()
+    monkeypatch.setattr(AuditEventRepository, "_collection", staticmethod(lambda: collection))
+    return collection
+
+
+async def test_flush_on_batch_size_and_stop(audit_collection):
+    """batch_size마다 insert_many 1회, 종료 시 남은 이벤트 저장"""
+    sink = AuditSink(batch_size=3, flush_interval=60)
+    sink.start()
+
+    for i in range(7):
+        sink.record({"event": "TOKEN_REFRESH", "success": True, "user_id": f"u{i}"})
+    await sink.stop()
+
+    assert [len(batch) for batch in audit_collection.batches] == [3, 3, 1]
+    assert all("created_at" in event for batch in audit_collection.batches for event in batch)
+
+
+async def test_flush_on_interval(audit_collection):
+    """batch_size 미만이어도 flush_interval이 지나면 저장"""
+    sink = AuditSink(batch_size=100, flush_interval=0.01)
+    sink.start()
+
+    sink.record({"event": "LOGIN", "success": True})
+    await asyncio.sleep(0.05)
+
+    assert len(audit_collection.batches) == 1
+    await sink.stop()
+
+
+async def test_buffer_drops_oldest_when_full(audit_collection):
+    """시작 전(또는 DB 장애 중) 버퍼는 max_buffer까지만 유지"""
+    sink = AuditSink(batch_size=100, max_buffer=2)
+
+    for i in range(5):
+        sink.record({"event": "LOGIN", "success": True, "user_id": f"u{i}"})
+    await sink.flush()
+
+    assert [e["user_id"] for e in audit_collection.batches[0]] == ["u3", "u4"]
+
+
+async def test_partial_failure_counts_inserted(monkeypatch):
+    """unordered insert 일부 실패 시 성공한 문서 수만 written"""
+    monkeypatch.setattr(
+        AuditEventRepository, "_collection", staticmethod(lambda: FakeAuditCollection(fail=True))
+    )
+    sink = AuditSink(batch_size=10)
+    for _ in range(4):
+        sink.record({"event": "LOGIN", "success": False})
+
+    assert await sink.flush() == 3
+
+
+class FlakyAuditCollection(FakeAuditCollection):
+    """down이면 연결 오류, 동시에 실행 중인 insert_many 최대 수 기록"""
+
+    def __init__(self):
+        super().__init__()
+        self.down = True
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def insert_many(self, docs, ordered=True):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.down:
+                raise AutoReconnect("connection refused")
+            return await super().insert_many(docs, ordered)
+        finally:
+            self.in_flight -= 1
+
+
+async def test_outage_keeps_events_buffered(monkeypatch):
+    """연결 오류 시 batch를 버리지 않고 버퍼 앞에 되돌린 뒤 복구되면 순서대로 저장"""
+    collection = FlakyAuditCollection()
+    monkeypatch.setattr(AuditEventRepository, "_collection", staticmethod(lambda: collection))
+    sink = AuditSink(batch_size=2, max_buffer=3)
+    for i in range(3):
+        sink.record({"event": "LOGIN", "success": True, "user_id": f"u{i}"})
+
+    assert await sink.flush() == 0
+    sink.record({"event": "LOGIN", "success": True, "user_id": "u3"})
+
+    collection.down = False
+    assert await sink.flush() == 3
+    saved = [e["user_id"] for batch in collection.batches for e in batch]
+    # max_buffer를 넘은 가장 오래된 이벤트만 버림
+    assert saved == ["u1", "u2", "u3"]
+
+
+async def test_single_flush_in_flight(monkeypatch):
+    """batch_size 이상 쌓인 동안 record()마다 flush를 띄우지 않음"""
+    collection = FlakyAuditCollection()
+    collection.down = False
+    monkeypatch.setattr(AuditEventRepository, "_collection", staticmethod(lambda: collection))
+    sink = AuditSink(batch_size=2, flush_interval=60)
+    sink.start()
+
+    for i in range(20):
+        sink.record({"event": "LOGIN", "success": True, "user_id": f"u{i}"})
+        await asyncio.sleep(0)
+    await sink.stop()
+
+    assert collection.max_in_flight == 1
+    assert sum(len(batch) for batch in collection.batches) == 20
@@ -14,9 +14,36 @@ async def test_jwks_endpoint(client: AsyncClient):
     assert len(data["keys"]) > 0
 
 
+@pytest.mark.asyncio
+async def test_jwks_conditional_get(client: AsyncClient):
+    """JWKS ETag로 조건부 요청 시 304"""
+    response = await client.get("/.well-known/jwks.json")
+    etag = response.headers["etag"]
+
+    assert "max-age" in response.headers["cache-control"]
+
+    cached = await client.get("/.well-known/jwks.json", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    stale = await client.get("/.well-known/jwks.json", headers={"If-None-Match": '"other"'})
+    assert stale.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_me_without_auth(client: AsyncClient):
     """인증 없이 /me 접근 시 에러"""
     response = await client.get("/auth/me")
 
     assert response.status_code in (401, 403)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_headers(client: AsyncClient):
+    """Rate limit 정책이 걸린 엔드포인트는 RateLimit-* 헤더 포함"""
+    response = await client.get("/auth/me")
+
+    assert response.headers["ratelimit-limit"] == "100"
+    assert int(response.headers["ratelimit-remaining"]) < 100
+    assert "ratelimit-reset" in response.headers
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.core.exceptions import InvalidCredentialsException
+from app.core.security import hash_token
+from app.models.token import RefreshTokenInDB
+from app.models.user import UserInDB
+from app.repositories.token import RefreshTokenRepository
+from app.repositories.user import UserRepository
+from app.routers import auth as auth_router
+from app.services.auth import AuthService
+
+
+@pytest.fixture
+def token_store(monkeypatch):
+    """DB 대신 dict에 refresh token 저장 (consume은 원자적)"""
+    store = {}
+    user = UserInDB(
+        _id="user_1",
+        email="test@jbnu.ac.kr",
+        name="Test",
+        google_id="google_1",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+
+    async def create(token):
+        await asyncio.sleep(0)
+        store[token.token_hash] = RefreshTokenInDB(
+            _id=token.token_hash, created_at=datetime.utcnow(), **token.model_dump()
+        )
+        return store[token.token_hash]
+
+    async def consume(token_hash):
+        stored = store.get(token_hash)
+        if stored is None or stored.revoked:
+            return None
+        store[token_hash] = stored.model_copy(update={"revoked": True})
+        return stored
+
+    async def get_by_id(user_id):
+        return user if user_id == user.id else None
+
+    monkeypatch.setattr(RefreshTokenRepository, "create", create)
+    monkeypatch.setattr(RefreshTokenRepository, "consume", consume)
+    monkeypatch.setattr(UserRepository, "get_by_id", get_by_id)
+    return store, user
+
+
+async def test_refresh_token_rotates(token_store):
+    """refresh 시 기존 토큰은 폐기되고 새 토큰이 저장됨"""
+    store, user = token_store
+    _, refresh_token = await AuthService.create_tokens(user)
+
+    access_token, new_refresh_token, user_id = await AuthService.refresh_tokens(refresh_token)
+
+    assert access_token
+    assert user_id == user.id
+    assert store[hash_token(refresh_token)].revoked
+    assert not store[hash_token(new_refresh_token)].revoked
+
+
+async def test_refresh_token_single_use_under_concurrency(token_store):
+    """같은 refresh token으로 동시에 요청해도 하나만 성공"""
+    _, user = token_store
+    _, refresh_token = await AuthService.create_tokens(user)
+
+    results = await asyncio.gather(
+        *[AuthService.refresh_tokens(refresh_token) for _ in range(5)],
+        return_exceptions=True,
+    )
+
+    assert sum(not isinstance(r, Exception) for r in results) == 1
+    assert sum(isinstance(r, InvalidCredentialsException) for r in results) == 4
+
+
+async def test_refresh_endpoint_audits_subject_and_failures(client, token_store, monkeypatch):
+    """refresh 감사 로그에 실제 user id 기록, 실패한 refresh는 success=False로 기록"""
+    _, user = token_store
+    _, refresh_token = await AuthService.create_tokens(user)
+    events = []
+    monkeypatch.setattr(
+        auth_router, "log_token_refresh",
+        lambda user_id=None, ip=None, success=True, detail=None: events.append((user_id, success, detail)),
+    )
+
+    ok = await client.post("/auth/refresh", json={"refresh_token": refresh_token})
+    reused = await client.post("/auth/refresh", json={"refresh_token": refresh_token})
+
+    assert ok.status_code == 200
+    assert reused.status_code == 401
+    assert events[0] == (user.id, True, None)
+    assert events[1][:2] == (None, False)
+    assert events[1][2]
@@ -0,0 +1,174 @@
+import asyncio
+import base64
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+
+from app.config import settings
+from app.core import security
+from app.core.client_cache import client_secret_cache
+from app.core.exceptions import InvalidCredentialsException, InvalidScopeException
+from app.core.jwt import decode_access_token
+from app.models.client import ClientInDB
+from app.repositories.client import ClientRepository
+from app.services.auth import AuthService
+
+
+@pytest.fixture
+def registered_client(monkeypatch):
+    """DB 대신 dict에 클라이언트 저장 (scrypt 비용은 낮춤). secret 검증 횟수 기록"""
+    monkeypatch.setattr(settings, "client_secret_scrypt_n", 1024)
+    client_secret_cache.clear()
+    secret = security.generate_client_secret()
+    client = ClientInDB(
+        _id="agent_1",
+        name="agent",
+        secret_hash=security.hash_client_secret(secret),
+        scopes=["events:read", "introspect"],
+        created_at=datetime.utcnow(),
+    )
+    calls = {"verify": 0}
+    verify = security.verify_client_secret
+
+    async def get_by_client_id(client_id):
+        return client if client_id == client.id else None
+
+    def counting_verify(secret, stored):
+        calls["verify"] += 1
+        return verify(secret, stored)
+
+    monkeypatch.setattr(ClientRepository, "get_by_client_id", get_by_client_id)
+    monkeypatch.setattr("app.services.auth.verify_client_secret", counting_verify)
+    return client, secret, calls
+
+
+def test_client_secret_hash_roundtrip():
+    """scrypt 해시는 같은 secret만 통과, 파라미터는 해시에 포함"""
+    stored = security.hash_client_secret("s3cret")
+
+    assert stored.startswith(f"scrypt${settings.client_secret_scrypt_n}$")
+    assert security.verify_client_secret("s3cret", stored)
+    assert not security.verify_client_secret("wrong", stored)
+    assert not security.verify_client_secret("s3cret", "bcrypt$garbage")
+
+
+async def test_verified_credentials_are_cached(registered_client):
+    """검증 성공한 (client_id, secret)은 캐시, 동시 요청도 slow hash 1회"""
+    client, secret, calls = registered_client
+
+    results = await asyncio.gather(*(AuthService.authenticate_client(client.id, secret) for _ in range(5)))
+    await AuthService.authenticate_client(client.id, secret)
+
+    assert all(result.id == client.id for result in results)
+    assert calls["verify"] == 1
+
+
+async def test_disabled_or_rekeyed_client_rejected_while_cached(registered_client, monkeypatch):
+    """다른 프로세스(CLI)에서 비활성화 / secret 교체해도 캐시와 무관하게 즉시 거부"""
+    client, secret, calls = registered_client
+    await AuthService.authenticate_client(client.id, secret)
+    assert client_secret_cache.get(client.id, secret) == client.secret_hash
+
+    async def disabled(client_id):
+        return client.model_copy(update={"disabled": True})
+
+    monkeypatch.setattr(ClientRepository, "get_by_client_id", disabled)
+    with pytest.raises(InvalidCredentialsException):
+        await AuthService.authenticate_client(client.id, secret)
+
+    rekeyed = client.model_copy(update={"secret_hash": security.hash_client_secret("new-secret")})
+
+    async def get_rekeyed(client_id):
+        return rekeyed
+
+    monkeypatch.setattr(ClientRepository, "get_by_client_id", get_rekeyed)
+    with pytest.raises(InvalidCredentialsException):
+        await AuthService.authenticate_client(client.id, secret)
+    assert calls["verify"] == 2
+    assert (await AuthService.authenticate_client(client.id, "new-secret")).id == client.id
+
+
+async def test_wrong_secret_is_not_cached(registered_client):
+    """실패한 검증은 캐시하지 않음"""
+    client, _, calls = registered_client
+
+    for _ in range(2):
+        with pytest.raises(InvalidCredentialsException):
+            await AuthService.authenticate_client(client.id, "wrong")
+    with pytest.raises(InvalidCredentialsException):
+        await AuthService.authenticate_client("unknown", "wrong")
+
+    assert calls["verify"] == 2
+
+
+async def test_issue_client_token_scopes(registered_client):
+    """요청 scope는 허용 범위 내로 제한, 생략 시 전체"""
+    client, secret, _ = registered_client
+
+    token, scopes = await AuthService.issue_client_token(client.id, secret, "introspect")
+    payload = decode_access_token(token)
+    assert scopes == ["introspect"]
+    assert payload["type"] == "client_credentials"
+    assert payload["client_id"] == client.id
+    assert payload["scope"] == "introspect"
+
+    _, scopes = await AuthService.issue_client_token(client.id, secret)
+    assert scopes == client.scopes
+
+    with pytest.raises(InvalidScopeException):
+        await AuthService.issue_client_token(client.id, secret, "introspect admin")
+
+
+@pytest.mark.asyncio
+async def test_token_endpoint_basic_auth(client: AsyncClient, registered_client):
+    """HTTP Basic 인증 + form 요청으로 발급, 응답은 no-store"""
+    agent, secret, _ = registered_client
+    basic = base64.b64encode(f"{agent.id}:{secret}".encode()).decode()
+
+    response = await client.post(
+        "/auth/token",
+        data={"grant_type": "client_credentials", "scope": "events:read"},
+        headers={"Authorization": f"Basic {basic}"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-store"
+    data = response.json()
+    assert data["scope"] == "events:read"
+    assert decode_access_token(data["access_token"])["sub"] == agent.id
+
+    me = await client.get("/auth/me", headers={"Authorization": f"Bearer {data['access_token']}"})
+    assert me.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_token_endpoint_rejects_bad_requests(client: AsyncClient, registered_client):
+    """잘못된 secret은 401, 지원하지 않는 grant_type은 422"""
+    agent, _, _ = registered_client
+
+    wrong = await client.post("/auth/token", data={
+        "grant_type": "client_credentials", "client_id": agent.id, "client_secret": "wrong",
+    })
+    unsupported = await client.post("/auth/token", data={"grant_type": "password"})
+
+    assert wrong.status_code == 401
+    assert unsupported.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_token_endpoint_with_memory_backend(client: AsyncClient, monkeypatch):
+    """MongoDB 없이 memory backend에 등록한 클라이언트로 발급"""
+    from app.repositories import backends
+
+    monkeypatch.setattr(settings, "client_secret_scrypt_n", 1024)
+    monkeypatch.setattr(backends, "storage", backends.MemoryStorageBackend())
+    client_secret_cache.clear()
+    agent, secret = await AuthService.register_client("agent", ["introspect"])
+
+    response = await client.post("/auth/token", data={
+        "grant_type": "client_credentials", "client_id": agent.id, "client_secret": secret,
+    })
+
+    assert response.status_code == 200
+    assert response.json()["scope"] == "introspect"
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.dependencies import require_client_scope
+from app.core.events import KEY_ROTATION, EventFeed, event_feed
+from app.core.exceptions import InsufficientPermissionException
+from app.core.jwt import build_client_payload, create_access_token, sign_token
+from app.core.security import KeyRing, generate_private_key
+
+
+def test_since_resumes_after_last_event_id():
+    """Last-Event-ID 이후 이벤트만 반환"""
+    feed = EventFeed(buffer_size=10)
+    first = feed.publish("revocation", {"jti": "a"})
+    feed.publish("revocation", {"jti": "b"})
+    feed.publish("revocation", {"jti": "c"})
+
+    events, reset = feed.since(first.id)
+
+    assert not reset
+    assert [e.data["jti"] for e in events] == ["b", "c"]
+    assert feed.since(feed.last_id) == ([], False)
+    assert feed.since(None) == ([], False)
+
+
+def test_since_resets_on_gap_or_foreign_id():
+    """버퍼에서 밀려난 ID, 다른 프로세스의 ID는 reset"""
+    feed = EventFeed(buffer_size=2)
+    first = feed.publish("revocation", {"jti": "a"})
+    for jti in "bcd":
+        feed.publish("revocation", {"jti": jti})
+
+    assert feed.since(first.id) == ([], True)
+    assert feed.since("other-1") == ([], True)
+    assert feed.since(f"{feed.epoch}-99") == ([], True)
+
+
+async def test_stream_delivers_published_events():
+    """구독 중 발행된 이벤트는 SSE 프레임으로 전달, 없으면 heartbeat"""
+    feed = EventFeed()
+    stream = feed.stream(heartbeat=0.01)
+
+    assert (await anext(stream)).startswith(b"retry:")
+    assert await anext(stream) == b": keepalive\n\n"
+
+    next_frame = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0)
+    event = feed.publish("revocation", {"jti": "a", "sub": "u"})
+    frame = await asyncio.wait_for(next_frame, 1)
+
+    assert frame == event.frame
+    assert frame.startswith(f"id: {event.id}\nevent: revocation\ndata: ".encode())
+    await stream.aclose()
+
+
+async def test_stream_sends_reset_for_stale_cursor():
+    """재연결 커서가 버퍼에 없으면 reset 후 최신 위치부터"""
+    feed = EventFeed(buffer_size=1)
+    stale = feed.publish("revocation", {"jti": "a"})
+    feed.publish("revocation", {"jti": "b"})
+    feed.publish("revocation", {"jti": "c"})
+    stream = feed.stream(stale.id, heartbeat=0.01)
+
+    await anext(stream)
+    reset = await anext(stream)
+
+    assert b"event: reset" in reset
+    assert f"id: {feed.last_id}".encode() in reset
+    await stream.aclose()
+
+
+def test_key_rotation_publishes_event():
+    """로테이션 시 새 kid / 이전 kid를 담은 key_rotation 발행"""
+    private_key = generate_private_key("ES256")
+    ring = KeyRing(private_key, private_key.public_key(), "ES256")
+    previous_kid = ring.active_kid
+    cursor = event_feed.last_id
+
+    ring.rotate(generate_private_key("EdDSA"))
+
+    events, _ = event_feed.since(cursor)
+    assert [e.type for e in events] == [KEY_ROTATION]
+    assert events[0].data["kid"] == ring.active_kid
+    assert events[0].data["alg"] == "EdDSA"
+    assert events[0].data["previous_kid"] == previous_kid
+
+
+@pytest.mark.asyncio
+async def test_events_requires_auth(client: AsyncClient):
+    """Bearer 토큰 없이 구독 불가"""
+    response = await client.get("/events")
+
+    assert response.status_code in (401, 403)
+
+
+async def test_events_rejects_user_tokens(client: AsyncClient):
+    """사용자 토큰 / events:read scope가 없는 클라이언트 토큰은 403"""
+    user_token = create_access_token(user_id="user_1", email="a@jbnu.ac.kr", role="user")
+    client_token = sign_token(build_client_payload("client_1", ["introspect"]))
+
+    for token in (user_token, client_token):
+        response = await client.get("/events", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 403
+
+
+async def test_events_scope_dependency():
+    """events:read scope가 있는 client_credentials 토큰만 통과"""
+    dependency = require_client_scope("events:read")
+    payload = build_client_payload("client_1", ["introspect", "events:read"])
+
+    assert await dependency(payload) is payload
+    with pytest.raises(InsufficientPermissionException):
+        await dependency({"sub": "user_1", "type": "access", "scope": "events:read"})
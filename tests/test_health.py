@@ -1,6 +1,13 @@
 import pytest
 from httpx import AsyncClient
 
+from app.config import settings
+from app.core import database
+from app.core.audit import audit_sink
+from app.core.revocation import revocation_list
+from app.main import app, lifespan
+from app.repositories import backends
+
 
 @pytest.mark.asyncio
 async def test_health_check(client: AsyncClient):
@@ -8,3 +15,63 @@ async def test_health_check(client: AsyncClient):
     response = await client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_ready_reports_unavailable_without_db(client: AsyncClient, monkeypatch):
+    """MongoDB에 연결되지 않았으면 503 + 풀 상태"""
+    monkeypatch.setattr(database, "client", None)
+
+    response = await client.get("/ready")
+
+    assert response.status_code == 503
+    data = response.json()
+    assert data["status"] == "unavailable"
+    assert data["mongodb"]["error"] == "ConnectionError"
+    assert data["mongodb"]["pool"]["max_pool_size"] == settings.mongodb_max_pool_size
+
+
+def test_pool_stats_tracks_connections():
+    """연결 생성 / 체크아웃 / 반납 / 종료 이벤트 집계"""
+    stats = database.PoolStats()
+    for _ in range(3):
+        stats.connection_created(None)
+    stats.connection_checked_out(None)
+    stats.connection_closed(None)
+
+    snapshot = stats.snapshot()
+    assert snapshot["open"] == 2
+    assert snapshot["in_use"] == 1
+    assert snapshot["idle"] == 1
+    assert snapshot["created"] == 3
+
+
+def test_client_options_skip_missing_compressors(monkeypatch):
+    """설치되지 않은 압축 모듈은 제외하고 타임아웃 / 풀 설정 전달"""
+    monkeypatch.setattr(settings, "mongodb_compressors", ["not-a-codec", "zlib"])
+
+    options = database.client_options()
+
+    assert options["compressors"] == ["zlib"]
+    assert options["maxPoolSize"] == settings.mongodb_max_pool_size
+    assert options["timeoutMS"] == settings.mongodb_timeout_ms
+    assert database.pool_stats in options["event_listeners"]
+
+
+async def test_memory_backend_starts_without_mongodb(client: AsyncClient, monkeypatch):
+    """memory backend는 MongoDB 없이 기동하고 /ready도 storage만 보고"""
+    monkeypatch.setattr(settings, "repository_backend", "memory")
+    # 연결을 시도하면 서버 선택에서 바로 실패하도록
+    monkeypatch.setattr(settings, "mongodb_uri", "mongodb://127.0.0.1:1")
+    monkeypatch.setattr(settings, "mongodb_server_selection_timeout_ms", 100)
+    monkeypatch.setattr(database, "client", None)
+    monkeypatch.setattr(backends, "storage", backends.MemoryStorageBackend())
+    monkeypatch.setattr(revocation_list, "persistent", False)
+
+    async with lifespan(app):
+        assert database.client is None
+        assert audit_sink._task is None
+        response = await client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready", "storage": "memory"}
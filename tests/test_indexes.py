@@ -0,0 +1,115 @@
+import re
+
+from pymongo.errors import OperationFailure
+
+from app.core import indexes
+from app.core.indexes import (
+    INDEXES,
+    QUERY_SHAPES,
+    drop_obsolete_indexes,
+    find_stages,
+    index_fingerprint,
+    reconcile_indexes,
+)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = {}
+        self.create_calls = 0
+        self.index_names = {"_id_"}
+
+    async def drop_index(self, name):
+        if name not in self.index_names:
+            raise OperationFailure("index not found", code=27)
+        self.index_names.discard(name)
+
+    async def create_indexes(self, models):
+        self.create_calls += 1
+
+    async def find_one(self, query):
+        return self.docs.get(query["_id"])
+
+    async def update_one(self, query, update, upsert=False):
+        self.docs.setdefault(query["_id"], {"_id": query["_id"]}).update(update["$set"])
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+    async def list_collection_names(self, filter):
+        pattern = filter["name"]["$regex"]
+        return [name for name in self if re.match(pattern, name)]
+
+
+def _index_prefixes(collection: str) -> list:
+    return [
+        list(index.document["key"].keys())
+        for index in INDEXES.get(collection, [])
+    ]
+
+
+def test_every_query_shape_has_index():
+    """모든 리포지토리 쿼리의 첫 필드가 인덱스 prefix에 포함"""
+    for collection, query_filter, location in QUERY_SHAPES:
+        fields = list(query_filter.keys())
+        # _id는 항상 인덱스 있음
+        if "_id" in fields:
+            continue
+        assert any(
+            prefix[0] in fields for prefix in _index_prefixes(collection)
+        ), location
+
+
+def test_find_stages_detects_nested_collscan():
+    """중첩된 plan 트리에서 COLLSCAN 탐지"""
+    plan = {"stage": "FETCH", "inputStage": {"stage": "COLLSCAN"}}
+    assert find_stages(plan, "COLLSCAN")
+
+    plan = {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}
+    assert not find_stages(plan, "COLLSCAN")
+
+    plan = {"queryPlan": {"stage": "OR", "inputStages": [{"stage": "IXSCAN"}, {"stage": "COLLSCAN"}]}}
+    assert find_stages(plan, "COLLSCAN")
+
+
+async def test_reconcile_skips_when_fingerprint_matches():
+    """첫 기동에 적용 + 지문 기록, 이후에는 조회 1회로 생략"""
+    db = FakeDatabase()
+
+    assert await reconcile_indexes(db) is True
+    assert db["users"].create_calls == 1
+    assert db[indexes.META_COLLECTION].docs["indexes"]["fingerprint"] == index_fingerprint()
+
+    assert await reconcile_indexes(db) is False
+    assert db["users"].create_calls == 1
+
+
+async def test_reconcile_applies_when_indexes_change(monkeypatch):
+    """INDEXES 선언이 바뀌면 다시 적용"""
+    db = FakeDatabase()
+    await reconcile_indexes(db)
+    before = index_fingerprint()
+
+    changed = {**INDEXES, "users": INDEXES["users"][:1]}
+    monkeypatch.setattr(indexes, "INDEXES", changed)
+
+    assert index_fingerprint() != before
+    assert await reconcile_indexes(db) is True
+    assert db["users"].create_calls == 2
+
+
+async def test_drop_obsolete_indexes_is_idempotent():
+    """token_hash unique 인덱스를 refresh_tokens / 구간 컬렉션에서 제거, 다시 실행하면 변경 없음"""
+    db = FakeDatabase()
+    for name in ("refresh_tokens", "refresh_tokens_2026030500", "users"):
+        db[name].index_names.add("token_hash_1")
+
+    assert await drop_obsolete_indexes(db) == [
+        "refresh_tokens.token_hash_1",
+        "refresh_tokens_2026030500.token_hash_1",
+    ]
+    assert "token_hash_1" in db["users"].index_names
+    assert await drop_obsolete_indexes(db) == []
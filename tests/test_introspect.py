@@ -0,0 +1,75 @@
+import pytest
+from httpx import AsyncClient
+
+from app.config import settings
+from app.core.jwt import create_access_token
+
+
+def _bearer(user_id: str = "gateway") -> dict:
+    token = create_access_token(user_id=user_id, email="gw@jbnu.ac.kr", role="user")
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_introspect_form(client: AsyncClient):
+    """RFC 7662 form 요청: 유효한 토큰은 active=true + 클레임"""
+    token = create_access_token(user_id="user_1", email="a@jbnu.ac.kr", role="user")
+    response = await client.post(
+        "/auth/introspect",
+        data={"token": token, "token_type_hint": "access_token"},
+        headers=_bearer(),
+    )
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-store"
+    data = response.json()
+    assert data["active"] is True
+    assert data["sub"] == "user_1"
+    assert data["token_type"] == "Bearer"
+
+
+@pytest.mark.asyncio
+async def test_introspect_inactive_token(client: AsyncClient):
+    """검증 실패한 토큰은 active=false만 반환"""
+    response = await client.post("/auth/introspect", json={"token": "not-a-jwt"}, headers=_bearer())
+
+    assert response.status_code == 200
+    assert response.json() == {"active": False}
+
+
+@pytest.mark.asyncio
+async def test_introspect_batch(client: AsyncClient):
+    """배치 요청은 입력 순서대로 결과 반환 (중복 토큰 포함)"""
+    valid = create_access_token(user_id="user_2", email="b@jbnu.ac.kr", role="user")
+    response = await client.post(
+        "/auth/introspect",
+        json={"tokens": [valid, "garbage", valid]},
+        headers=_bearer(),
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["active"] for r in results] == [True, False, True]
+    assert results[2]["sub"] == "user_2"
+
+
+@pytest.mark.asyncio
+async def test_introspect_rejects_invalid_body(client: AsyncClient):
+    """token/tokens 둘 다 없거나 배치 한도 초과 시 422"""
+    empty = await client.post("/auth/introspect", json={}, headers=_bearer())
+    too_many = await client.post(
+        "/auth/introspect",
+        json={"tokens": ["t"] * (settings.introspect_max_batch + 1)},
+        headers=_bearer(),
+    )
+
+    assert empty.status_code == 422
+    assert too_many.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_introspect_requires_auth(client: AsyncClient):
+    """호출자 Bearer 토큰 없이 접근 시 에러"""
+    response = await client.post("/auth/introspect", json={"token": "x"})
+
+    assert response.status_code in (401, 403)
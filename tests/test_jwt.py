@@ -4,7 +4,10 @@ from app.core.jwt import (
     create_access_token,
     decode_access_token,
     get_jwks,
+    get_signer,
+    get_verifier,
 )
+from app.core.security import load_verification_key
 from app.core.exceptions import InvalidCredentialsException
 
 
@@ -57,3 +60,103 @@ def test_get_jwks():
     assert key["alg"] == "RS256"
     assert "n" in key
     assert "e" in key
+
+
+def test_key_objects_are_parsed_once():
+    """서명/검증 키 객체는 프로세스 내에서 재사용"""
+    assert get_signer() is get_signer()
+    assert get_verifier() is get_verifier()
+    assert load_verification_key() is load_verification_key()
+
+
+@pytest.fixture
+def rotated_key_ring():
+    """테스트 후 원래 키 링으로 복원"""
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from app.core.security import get_key_ring
+
+    ring = get_key_ring()
+    old_token = create_access_token(user_id="before_rotation", email="r@jbnu.ac.kr", role="user")
+    old_kid = ring.active_kid
+    ring.rotate(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+    yield ring, old_token, old_kid
+    get_key_ring.cache_clear()
+
+
+def test_token_header_has_kid():
+    """발급 토큰 헤더에 활성 키의 kid 포함"""
+    from jose import jwt
+    from app.core.security import get_key_ring
+
+    token = create_access_token(user_id="u", email="u@jbnu.ac.kr", role="user")
+
+    assert jwt.get_unverified_header(token)["kid"] == get_key_ring().active_kid
+
+
+def test_key_rotation_keeps_old_tokens_valid(rotated_key_ring):
+    """로테이션 후에도 이전 키로 발급된 토큰 검증, JWKS에 두 키 모두 공개"""
+    ring, old_token, old_kid = rotated_key_ring
+
+    assert decode_access_token(old_token)["sub"] == "before_rotation"
+
+    new_token = create_access_token(user_id="after_rotation", email="r@jbnu.ac.kr", role="user")
+    assert decode_access_token(new_token)["sub"] == "after_rotation"
+
+    kids = [key["kid"] for key in get_jwks()["keys"]]
+    assert kids == [ring.active_kid, old_kid]
+
+
+def test_decode_unknown_kid():
+    """키 링에 없는 kid로 서명된 토큰은 거부"""
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from jose import jwt
+
+    foreign_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    token = jwt.encode(
+        {"sub": "x", "type": "access"},
+        foreign_key,
+        algorithm="RS256",
+        headers={"kid": "unknown"},
+    )
+
+    with pytest.raises(InvalidCredentialsException):
+        decode_access_token(token)
+
+
+@pytest.mark.parametrize("algorithm, kty", [("ES256", "EC"), ("EdDSA", "OKP")])
+def test_rotate_to_other_algorithm(rotated_key_ring, algorithm, kty):
+    """ES256/EdDSA 키로 전환: 새 알고리즘으로 발급, 이전 RS256 토큰도 계속 검증"""
+    from jose import jwk, jwt
+    from app.core.security import generate_private_key
+
+    ring, old_token, _ = rotated_key_ring
+    ring.rotate(generate_private_key(algorithm))
+
+    token = create_access_token(user_id="u", email="u@jbnu.ac.kr", role="user")
+    assert jwt.get_unverified_header(token)["alg"] == algorithm
+    assert decode_access_token(token)["sub"] == "u"
+    assert decode_access_token(old_token)["sub"] == "before_rotation"
+
+    # 외부 검증자: JWKS 문서만으로 검증
+    published = get_jwks()["keys"][0]
+    assert published["kty"] == kty
+    assert published["alg"] == algorithm
+    assert jwt.decode(token, jwk.construct(published), algorithms=[algorithm])["sub"] == "u"
+
+
+def test_reject_algorithm_mismatch(rotated_key_ring):
+    """kid의 키 알고리즘과 다른 alg 헤더의 토큰은 거부"""
+    from jose import jwt
+    from app.core.security import generate_private_key
+
+    ring, _, _ = rotated_key_ring
+    ring.rotate(generate_private_key("EdDSA"))
+    token = jwt.encode(
+        {"sub": "x", "type": "access"},
+        "shared-secret",
+        algorithm="HS256",
+        headers={"kid": ring.active_kid},
+    )
+
+    with pytest.raises(InvalidCredentialsException):
+        decode_access_token(token)
@@ -0,0 +1,64 @@
+import io
+import json
+import logging
+
+import pytest
+
+from app.config import settings
+from app.core import logging as auth_logging
+from app.core.logging import BoundedQueueHandler, log_auth_event
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    """listener가 쓰는 stream을 StringIO로 교체. flush()는 큐를 비울 때까지 대기"""
+    stream = io.StringIO()
+    monkeypatch.setattr(auth_logging.console_handler, "stream", stream)
+
+    def flush():
+        auth_logging.shutdown_logging()
+        auth_logging.start_logging()
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    return flush
+
+
+def test_auth_event_json_line(captured):
+    """인증 이벤트는 JSON 한 줄로 기록"""
+    log_auth_event("LOGIN", email="test@jbnu.ac.kr", ip_address="1.2.3.4")
+    log_auth_event("LOGIN", email="test@jbnu.ac.kr", success=False, detail='bad "state"')
+
+    first, second = captured()
+
+    assert first["event"] == "LOGIN"
+    assert first["level"] == "INFO"
+    assert first["ip"] == "1.2.3.4"
+    assert first["success"] is True
+    assert second["level"] == "WARNING"
+    assert second["detail"] == 'bad "state"'
+
+
+def test_bounded_queue_drops_when_full():
+    """큐가 가득 차면 대기하지 않고 버린 수를 센다"""
+    handler = BoundedQueueHandler(maxsize=2)
+    log = logging.getLogger("test.bounded_queue")
+    log.propagate = False
+    log.addHandler(handler)
+
+    for i in range(5):
+        log.warning("event %d", i)
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_success_events_sampled(captured, monkeypatch):
+    """샘플링 비율 0이면 성공 이벤트는 생략, 실패 이벤트는 기록"""
+    monkeypatch.setattr(settings, "log_success_sample_rate", 0.0)
+
+    log_auth_event("TOKEN_REFRESH", user_id="u1")
+    log_auth_event("TOKEN_REFRESH", user_id="u1", success=False)
+
+    records = captured()
+
+    assert [r["success"] for r in records] == [False]
@@ -0,0 +1,94 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.metrics import (
+    RATE_LIMIT_DECISIONS,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    observe_repository,
+    REPOSITORY_LATENCY,
+)
+from app.core.rate_limit import RateLimiter, RateLimitExceededException, RateLimitPolicy
+from app.core.token_cache import token_cache
+from tests.test_rate_limit import create_mock_request
+
+
+def test_histogram_text_format():
+    """버킷은 누적값, +Inf 버킷 = count"""
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("op_seconds", "Op latency", ["op"], buckets=[0.1, 1.0]))
+    counter = registry.register(Counter("op_total", "Ops", ["op"]))
+
+    child = histogram.labels("a")
+    for value in (0.05, 0.5, 2.0):
+        child.observe(value)
+    counter.labels('say "hi"').inc()
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE op_seconds histogram" in lines
+    assert 'op_seconds_bucket{op="a",le="0.1"} 1' in lines
+    assert 'op_seconds_bucket{op="a",le="1.0"} 2' in lines
+    assert 'op_seconds_bucket{op="a",le="+Inf"} 3' in lines
+    assert 'op_seconds_count{op="a"} 3' in lines
+    assert 'op_total{op="say \\"hi\\""} 1' in lines
+
+
+async def test_observe_repository_labels():
+    """리포지토리 메서드는 클래스 / 메서드 이름으로 기록"""
+    class SampleRepository:
+        @classmethod
+        @observe_repository
+        async def find(cls):
+            return "ok"
+
+    child = REPOSITORY_LATENCY.labels("SampleRepository", "find")
+    before = child.count
+
+    assert await SampleRepository.find() == "ok"
+    assert child.count == before + 1
+
+
+async def test_rate_limit_decision_counters():
+    """정책별 허용 / 거부 카운터"""
+    limiter = RateLimiter()
+    policy = RateLimitPolicy("metrics_test", limit=1, period=60)
+    accepted = RATE_LIMIT_DECISIONS.labels("metrics_test", "accepted")
+    rejected = RATE_LIMIT_DECISIONS.labels("metrics_test", "rejected")
+    before = (accepted.value, rejected.value)
+
+    await limiter.check_policy(create_mock_request(), policy)
+    with pytest.raises(RateLimitExceededException):
+        await limiter.check_policy(create_mock_request(), policy)
+
+    assert (accepted.value, rejected.value) == (before[0] + 1, before[1] + 1)
+
+
+async def test_metrics_endpoint(client: AsyncClient):
+    """/metrics에 라우트 템플릿별 요청 지연과 JWT 검증 지연 노출"""
+    await client.get("/health")
+    await client.get("/auth/me", headers={"Authorization": "Bearer invalid"})
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in body
+    assert 'route="/auth/me",status="401"' in body
+    assert "# TYPE jwt_operation_duration_seconds histogram" in body
+
+
+async def test_metrics_endpoint_exposes_cache_stats(client: AsyncClient):
+    """캐시 / 폐기 filter 통계를 scrape 시점 값으로 노출"""
+    token_cache.get("metrics-test-miss")
+
+    body = (await client.get("/metrics")).text
+
+    assert "# TYPE cache_entries gauge" in body
+    assert f'cache_lookups_total{{cache="token",result="miss"}} {token_cache.misses}' in body
+    for name in ("token", "user", "client_secret"):
+        assert f'cache_max_entries{{cache="{name}"}}' in body
+    assert "# TYPE revocation_filter_bytes gauge" in body
+    assert "revocation_filters " in body
@@ -0,0 +1,82 @@
+from datetime import datetime
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from app.core.migrations import migrate_collection
+from app.core.security import hash_token
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, key, direction):
+        self.docs.sort(key=lambda doc: doc[key])
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    async def to_list(self, length):
+        return [dict(doc) for doc in self.docs]
+
+
+class FakeTokenCollection:
+    """ObjectId _id 범위 조회 / insert_many / $in 삭제만 지원"""
+
+    def __init__(self, docs):
+        self.docs = {doc["_id"]: doc for doc in docs}
+
+    def find(self, query):
+        return FakeCursor([doc for doc in self.docs.values() if isinstance(doc["_id"], ObjectId)])
+
+    async def insert_many(self, docs, ordered=True):
+        errors = []
+        for doc in docs:
+            if doc["_id"] in self.docs:
+                errors.append({"code": 11000})
+            else:
+                self.docs[doc["_id"]] = doc
+        if errors:
+            raise BulkWriteError({"writeErrors": errors})
+
+    async def delete_many(self, query):
+        for _id in query["_id"]["$in"]:
+            self.docs.pop(_id, None)
+
+
+def _legacy_doc(n: int) -> dict:
+    return {
+        "_id": ObjectId(),
+        "user_id": f"user_{n}",
+        "token_hash": hash_token(f"token_{n}"),
+        "expires_at": datetime.utcnow(),
+        "created_at": datetime.utcnow(),
+        "revoked": False,
+    }
+
+
+async def test_migrate_converts_to_digest_ids():
+    """ObjectId + token_hash 문서를 digest _id 문서로 변환"""
+    collection = FakeTokenCollection([_legacy_doc(n) for n in range(5)])
+
+    assert await migrate_collection(collection, batch_size=2) == 5
+
+    assert set(collection.docs) == {bytes.fromhex(hash_token(f"token_{n}")) for n in range(5)}
+    doc = collection.docs[bytes.fromhex(hash_token("token_0"))]
+    assert "token_hash" not in doc
+    assert doc["user_id"] == "user_0"
+
+
+async def test_migrate_resumes_after_partial_run():
+    """이미 변환된 문서가 있어도 (중단 후 재실행) 남은 문서만 변환"""
+    docs = [_legacy_doc(n) for n in range(3)]
+    collection = FakeTokenCollection(docs)
+    converted = {k: v for k, v in docs[0].items() if k not in ("_id", "token_hash")}
+    collection.docs[bytes.fromhex(docs[0]["token_hash"])] = {**converted, "_id": bytes.fromhex(docs[0]["token_hash"])}
+
+    assert await migrate_collection(collection) == 3
+    assert len(collection.docs) == 3
+    assert all(isinstance(_id, bytes) for _id in collection.docs)
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock
-from app.core.rate_limit import RateLimiter, RateLimitExceededException
+from app.core.rate_limit import RateLimiter, RateLimitExceededException, RateLimitPolicy
+from app.core.rate_limit_backends import MemoryRateLimitBackend
 
 
 def create_mock_request(ip: str = "127.0.0.1"):
@@ -10,14 +11,14 @@ def create_mock_request(ip: str = "127.0.0.1"):
     return request
 
 
-def test_rate_limiter_allows_requests():
+async def test_rate_limiter_allows_requests():
     """Rate Limiter가 정상 요청을 허용하는지 테스트"""
     limiter = RateLimiter()
     request = create_mock_request()
 
     # 5회 요청 허용
     for _ in range(5):
-        result = limiter.check_rate_limit(
+        result = await limiter.check_rate_limit(
             request,
             "test_endpoint",
             max_requests=5,
@@ -26,14 +27,14 @@ def test_rate_limiter_allows_requests():
         assert result is True
 
 
-def test_rate_limiter_blocks_excess_requests():
+async def test_rate_limiter_blocks_excess_requests():
     """Rate Limiter가 초과 요청을 차단하는지 테스트"""
     limiter = RateLimiter()
     request = create_mock_request()
 
     # 5회 허용
     for _ in range(5):
-        limiter.check_rate_limit(
+        await limiter.check_rate_limit(
             request,
             "test_endpoint",
             max_requests=5,
@@ -42,7 +43,7 @@ def test_rate_limiter_blocks_excess_requests():
 
     # 6번째 요청은 차단
     with pytest.raises(RateLimitExceededException):
-        limiter.check_rate_limit(
+        await limiter.check_rate_limit(
             request,
             "test_endpoint",
             max_requests=5,
@@ -50,7 +51,7 @@ def test_rate_limiter_blocks_excess_requests():
         )
 
 
-def test_rate_limiter_different_ips():
+async def test_rate_limiter_different_ips():
     """다른 IP는 별도로 카운트되는지 테스트"""
     limiter = RateLimiter()
 
@@ -59,7 +60,7 @@ def test_rate_limiter_different_ips():
 
     # IP 1에서 5회
     for _ in range(5):
-        limiter.check_rate_limit(
+        await limiter.check_rate_limit(
             request1,
             "test_endpoint",
             max_requests=5,
@@ -67,7 +68,7 @@ def test_rate_limiter_different_ips():
         )
 
     # IP 2에서는 여전히 허용
-    result = limiter.check_rate_limit(
+    result = await limiter.check_rate_limit(
         request2,
         "test_endpoint",
         max_requests=5,
@@ -76,14 +77,14 @@ def test_rate_limiter_different_ips():
     assert result is True
 
 
-def test_rate_limiter_different_endpoints():
+async def test_rate_limiter_different_endpoints():
     """다른 엔드포인트는 별도로 카운트되는지 테스트"""
     limiter = RateLimiter()
     request = create_mock_request()
 
     # endpoint_1에서 5회
     for _ in range(5):
-        limiter.check_rate_limit(
+        await limiter.check_rate_limit(
             request,
             "endpoint_1",
             max_requests=5,
@@ -91,10 +92,97 @@ def test_rate_limiter_different_endpoints():
         )
 
     # endpoint_2에서는 여전히 허용
-    result = limiter.check_rate_limit(
+    result = await limiter.check_rate_limit(
         request,
         "endpoint_2",
         max_requests=5,
         window_seconds=60
     )
     assert result is True
+
+
+async def test_rate_limiter_expires_old_windows():
+    """윈도우가 끝난 키는 다음 요청 시 정리되는지 테스트"""
+    limiter = RateLimiter()
+
+    await limiter.check_rate_limit(
+        create_mock_request("192.168.1.1"),
+        "test_endpoint",
+        max_requests=5,
+        window_seconds=0
+    )
+    await limiter.check_rate_limit(create_mock_request("192.168.1.2"), "test_endpoint")
+
+    assert "192.168.1.1:test_endpoint" not in limiter.backend._entries
+
+
+async def test_rate_limiter_evicts_least_recently_used_key():
+    """추적 키 수가 상한을 넘으면 LRU 키를 제거하는지 테스트"""
+    limiter = RateLimiter(MemoryRateLimitBackend(max_keys=2))
+
+    for ip in ("10.0.0.1", "10.0.0.2", "10.0.0.1", "10.0.0.3"):
+        await limiter.check_rate_limit(create_mock_request(ip), "test_endpoint")
+
+    assert len(limiter.backend._entries) == 2
+    assert "10.0.0.2:test_endpoint" not in limiter.backend._entries
+
+
+async def test_gcra_policy_allows_burst_then_blocks():
+    """GCRA 정책: burst만큼 허용 후 차단, Remaining 헤더 감소"""
+    limiter = RateLimiter(MemoryRateLimitBackend())
+    request = create_mock_request()
+    request.headers = {}
+    policy = RateLimitPolicy("test", limit=3, period=60)
+
+    remaining = [
+        (await limiter.check_policy(request, policy))["RateLimit-Remaining"]
+        for _ in range(3)
+    ]
+    assert remaining == ["2", "1", "0"]
+
+    with pytest.raises(RateLimitExceededException) as exc_info:
+        await limiter.check_policy(request, policy)
+    # 20초(60/3)마다 1개씩 회복
+    assert exc_info.value.headers["Retry-After"] == "20"
+
+
+async def test_gcra_policy_keyed_by_subject():
+    """sub 기준 정책: 같은 IP라도 유저별로 별도 버킷"""
+    from app.core.jwt import create_access_token
+
+    limiter = RateLimiter(MemoryRateLimitBackend())
+    policy = RateLimitPolicy("test", limit=1, period=60, key="sub")
+
+    for user_id in ("user_a", "user_b"):
+        request = create_mock_request()
+        token = create_access_token(user_id=user_id, email="a@jbnu.ac.kr", role="user")
+        request.headers = {"authorization": f"Bearer {token}"}
+        await limiter.check_policy(request, policy)
+
+    with pytest.raises(RateLimitExceededException):
+        await limiter.check_policy(request, policy)
+
+
+async def test_bearer_claims_warm_token_cache_without_stats(monkeypatch):
+    """rate limiter의 토큰 조회는 cache hit / miss에 잡히지 않고, 검증한 토큰은 인증 경로에서 재사용"""
+    from app.core import jwt as jwt_module
+    from app.core.jwt import create_access_token
+    from app.core.token_cache import token_cache, verify_access_token
+
+    token_cache.clear()
+    token = create_access_token(user_id="user_a", email="a@jbnu.ac.kr", role="user")
+    request = create_mock_request()
+    request.headers = {"authorization": f"Bearer {token}"}
+    hits, misses = token_cache.hits, token_cache.misses
+
+    assert RateLimiter._bearer_claims(request)["sub"] == "user_a"
+    assert RateLimiter._bearer_claims(request)["sub"] == "user_a"
+    assert (token_cache.hits, token_cache.misses) == (hits, misses)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("token verified twice")
+
+    monkeypatch.setattr(jwt_module, "decode_token", fail)
+    assert (await verify_access_token(token))["sub"] == "user_a"
+    assert token_cache.hits == hits + 1
+    token_cache.clear()
@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import multiprocessing
+import time
+
+import pytest
+
+from app.core.rate_limit_backends import (
+    MemoryRateLimitBackend,
+    RedisRateLimitBackend,
+    SharedMemoryRateLimitBackend,
+    gcra_update,
+)
+
+
+class FakeRedisServer:
+    """
+    테스트용 최소 RESP 서버 (MULTI/EXEC, SET NX PX, INCR, PTTL, EVAL/EVALSHA)
+    EVAL은 GCRA 스크립트만 지원하며 gcra_update로 동일 동작을 수행
+    """
+
+    def __init__(self):
+        self.data = {}  # {key: (value, expires_at)}
+        self.scripts = set()
+        self.connections = 0
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def _get(self, key):
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None, None
+        return value, expires_at
+
+    def _run(self, cmd):
+        name = cmd[0].upper()
+        if name == b"SET":
+            key, value = cmd[1], int(cmd[2])
+            opts = [c.upper() for c in cmd[3:]]
+            if b"NX" in opts and self._get(key)[0] is not None:
+                return b"$-1\r\n"
+            px = int(cmd[3 + opts.index(b"PX") + 1]) if b"PX" in opts else None
+            self.data[key] = (value, time.monotonic() + px / 1000 if px else None)
+            return b"+OK\r\n"
+        if name == b"INCR":
+            value, expires_at = self._get(cmd[1])
+            value = (value or 0) + 1
+            self.data[cmd[1]] = (value, expires_at)
+            return b":%d\r\n" % value
+        if name == b"PTTL":
+            value, expires_at = self._get(cmd[1])
+            if value is None:
+                return b":-2\r\n"
+            if expires_at is None:
+                return b":-1\r\n"
+            return b":%d\r\n" % int((expires_at - time.monotonic()) * 1000)
+        if name in (b"EVAL", b"EVALSHA"):
+            if name == b"EVAL":
+                sha = hashlib.sha1(cmd[1]).hexdigest().encode()
+                self.scripts.add(sha)
+            else:
+                sha = cmd[1]
+            if sha.decode() != RedisRateLimitBackend.GCRA_SHA:
+                return b"-NOSCRIPT No matching script\r\n"
+            if sha not in self.scripts:
+                return b"-NOSCRIPT No matching script. Please use EVAL.\r\n"
+
+            key, interval, tolerance = cmd[3], float(cmd[4]), float(cmd[5])
+            now = time.monotonic()
+            tat, _ = self._get(key)
+            allowed, tat = gcra_update(tat, now, interval, tolerance)
+            if allowed:
+                self.data[key] = (tat, tat)
+            offset = str(tat - now).encode()
+            return b"*2\r\n:%d\r\n$%d\r\n%s\r\n" % (allowed, len(offset), offset)
+        return b"-ERR unknown command\r\n"
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        queued = None
+        try:
+            while True:
+                header = await reader.readline()
+                if not header:
+                    break
+                cmd = []
+                for _ in range(int(header[1:])):
+                    length = int((await reader.readline())[1:])
+                    cmd.append((await reader.readexactly(length + 2))[:-2])
+
+                name = cmd[0].upper()
+                if name == b"MULTI":
+                    queued = []
+                    writer.write(b"+OK\r\n")
+                elif name == b"EXEC":
+                    replies = [self._run(c) for c in queued]
+                    queued = None
+                    writer.write(b"*%d\r\n" % len(replies) + b"".join(replies))
+                elif queued is not None:
+                    queued.append(cmd)
+                    writer.write(b"+QUEUED\r\n")
+                else:
+                    writer.write(self._run(cmd))
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def redis_server():
+    server = FakeRedisServer()
+    port = await server.start()
+    yield server, port
+    await server.stop()
+
+
+async def test_memory_backend_counts_within_window():
+    """메모리 저장소: 같은 윈도우 내 요청 수 누적"""
+    backend = MemoryRateLimitBackend()
+
+    assert (await backend.incr("k", 60))[0] == 1
+    count, ttl = await backend.incr("k", 60)
+    assert count == 2
+    assert 0 < ttl <= 60
+
+
+async def test_redis_backend_counts_and_expires(redis_server):
+    """Redis 저장소: 원자적 증가 후 윈도우 TTL 적용"""
+    server, port = redis_server
+    backend = RedisRateLimitBackend(f"redis://127.0.0.1:{port}/0")
+
+    for expected in (1, 2, 3):
+        count, ttl = await backend.incr("k", 60)
+        assert count == expected
+        assert 0 < ttl <= 60
+
+    server.data.clear()
+    assert (await backend.incr("k", 60))[0] == 1
+
+    # 연결은 재사용
+    assert server.connections == 1
+    await backend.close()
+
+
+async def test_redis_backend_concurrent_increments(redis_server):
+    """Redis 저장소: 동시 요청도 카운트 누락 없음"""
+    _, port = redis_server
+    backend = RedisRateLimitBackend(f"redis://127.0.0.1:{port}/0", pool_size=4)
+
+    results = await asyncio.gather(*[backend.incr("k", 60) for _ in range(50)])
+
+    assert sorted(count for count, _ in results) == list(range(1, 51))
+    await backend.close()
+
+
+def _shm_worker(path: str, n: int):
+    backend = SharedMemoryRateLimitBackend(path, slots=1024)
+    for _ in range(n):
+        backend._incr("shared", 60)
+
+
+async def test_shared_memory_backend_across_processes(tmp_path):
+    """공유 메모리 저장소: 여러 프로세스의 증가가 하나의 카운터에 합산"""
+    path = str(tmp_path / "rate-limit")
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_shm_worker, args=(path, 200)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    backend = SharedMemoryRateLimitBackend(path, slots=1024)
+    count, _ = await backend.incr("shared", 60)
+    assert count == 801
+    await backend.close()
+
+
+async def test_memory_backend_gcra_single_timestamp():
+    """메모리 저장소 GCRA: 키당 TAT 하나만 저장"""
+    backend = MemoryRateLimitBackend()
+
+    results = [await backend.gcra("k", 10.0, 20.0) for _ in range(3)]
+
+    assert [allowed for allowed, _ in results] == [True, True, False]
+    assert len(backend._entries) == 1
+
+
+async def test_shared_memory_backend_gcra(tmp_path):
+    """공유 메모리 저장소 GCRA"""
+    backend = SharedMemoryRateLimitBackend(str(tmp_path / "rate-limit"), slots=64)
+
+    results = [await backend.gcra("k", 10.0, 20.0) for _ in range(3)]
+
+    assert [allowed for allowed, _ in results] == [True, True, False]
+    await backend.close()
+
+
+async def test_redis_backend_gcra_loads_script_once(redis_server):
+    """Redis 저장소 GCRA: NOSCRIPT 시 EVAL로 1회 로드 후 EVALSHA 사용"""
+    server, port = redis_server
+    backend = RedisRateLimitBackend(f"redis://127.0.0.1:{port}/0")
+
+    results = [await backend.gcra("k", 10.0, 20.0) for _ in range(3)]
+
+    assert [allowed for allowed, _ in results] == [True, True, False]
+    assert 0 < results[1][1] <= 20.0
+    assert len(server.scripts) == 1
+    await backend.close()
+
+
+def test_gcra_burst_boundary_is_allowed():
+    """burst번째 요청(new_tat - tolerance == now)은 시각 값과 무관하게 허용"""
+    for i in range(1000):
+        now = 1000.1 + i * 0.37
+        assert gcra_update(None, now, 60.0, 60.0)[0]
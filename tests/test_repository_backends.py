@@ -0,0 +1,352 @@
+"""
+storage backend 공통 동작 테스트 (memory / sqlite / mongodb)
+
+mongodb는 TEST_MONGODB_URI가 있을 때만 실행 (테스트마다 임시 DB 생성 후 삭제)
+"""
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+from app.core import database
+from app.core.security import hash_token
+from app.core.token_compaction import TokenCompactor
+from app.models.client import ClientCreate
+from app.models.token import RefreshTokenCreate
+from app.models.user import UserCreate
+from app.repositories import backends
+from app.repositories.client import ClientRepository
+from app.repositories.token import RefreshTokenRepository
+from app.repositories.user import UserRepository
+
+
+async def _mongodb_backend(refresh_token_storage: str):
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.core.indexes import ensure_indexes
+
+    uri = os.environ.get("TEST_MONGODB_URI")
+    if not uri:
+        pytest.skip("TEST_MONGODB_URI not set")
+    client = AsyncIOMotorClient(uri, serverSelectionTimeoutMS=2000)
+    db = client[f"authentic_test_{ObjectId()}"]
+    await ensure_indexes(db)
+    return backends.MongoStorageBackend(refresh_token_storage), client, db
+
+
+@pytest.fixture(params=["memory", "sqlite", "mongodb", "mongodb-bucketed"])
+async def storage(request, monkeypatch, tmp_path):
+    client = None
+    if request.param == "memory":
+        backend = backends.MemoryStorageBackend()
+    elif request.param == "sqlite":
+        backend = backends.SQLiteStorageBackend(str(tmp_path / "authentic.db"))
+    else:
+        storage_mode = "bucketed" if request.param == "mongodb-bucketed" else "single"
+        backend, client, db = await _mongodb_backend(storage_mode)
+        monkeypatch.setattr(database, "db", db)
+
+    await backend.connect()
+    monkeypatch.setattr(backends, "storage", backend)
+    yield backend
+    await backend.close()
+    if client is not None:
+        await client.drop_database(db.name)
+        client.close()
+
+
+def _user(n: int = 1) -> UserCreate:
+    return UserCreate(email=f"user{n}@jbnu.ac.kr", name=f"User {n}", google_id=f"google_{n}")
+
+
+def _token(user_id: str, name: str, expires_in: timedelta = timedelta(days=1)) -> RefreshTokenCreate:
+    return RefreshTokenCreate(
+        user_id=user_id,
+        token_hash=hash_token(name),
+        expires_at=datetime.utcnow() + expires_in,
+    )
+
+
+async def test_user_create_and_lookup(storage):
+    """생성한 유저를 id / email / google_id로 조회"""
+    user = await UserRepository.create(_user())
+
+    assert (await UserRepository.get_by_id(user.id)).email == "user1@jbnu.ac.kr"
+    assert (await UserRepository.get_by_email("user1@jbnu.ac.kr")).id == user.id
+    assert (await UserRepository.get_by_google_id("google_1")).id == user.id
+    assert await UserRepository.get_by_id(str(ObjectId())) is None
+    assert await UserRepository.get_by_id("not-an-id") is None
+
+
+async def test_user_email_is_unique(storage):
+    await UserRepository.create(_user())
+    with pytest.raises(DuplicateKeyError):
+        await UserRepository.create(_user())
+
+
+async def test_user_update_and_delete(storage):
+    user = await UserRepository.create(_user())
+
+    updated = await UserRepository.update(user.id, name="Renamed", picture="https://example.com/p.png")
+    assert updated.name == "Renamed"
+    assert updated.picture == "https://example.com/p.png"
+    assert updated.updated_at >= user.updated_at
+    assert await UserRepository.update(str(ObjectId()), name="Nobody") is None
+
+    assert await UserRepository.delete_by_id(user.id)
+    assert await UserRepository.get_by_id(user.id) is None
+    assert not await UserRepository.delete_by_id(user.id)
+
+
+async def test_client_create_and_update(storage):
+    """클라이언트 scope 목록 / disabled 왕복, 없는 client_id 변경은 False"""
+    client = await ClientRepository.create(ClientCreate(name="agent", scopes=["introspect", "events:read"]), "hash")
+
+    stored = await ClientRepository.get_by_client_id(client.id)
+    assert stored.scopes == ["introspect", "events:read"]
+    assert not stored.disabled
+
+    assert await ClientRepository.update(client.id, disabled=True, scopes=["introspect"])
+    stored = await ClientRepository.get_by_client_id(client.id)
+    assert stored.disabled
+    assert stored.scopes == ["introspect"]
+    assert not await ClientRepository.update("missing", disabled=True)
+    assert await ClientRepository.get_by_client_id("missing") is None
+
+
+async def test_refresh_token_consume_once(storage):
+    """동시에 consume해도 한 번만 문서를 받음"""
+    created = await RefreshTokenRepository.create(_token("user_1", "hash_1"))
+    assert (await RefreshTokenRepository.get_by_token_hash(hash_token("hash_1"))).id == created.id
+
+    results = await asyncio.gather(*(RefreshTokenRepository.consume(hash_token("hash_1")) for _ in range(5)))
+
+    consumed = [result for result in results if result is not None]
+    assert len(consumed) == 1
+    assert consumed[0].id == created.id
+    assert not consumed[0].revoked
+    assert await RefreshTokenRepository.get_by_token_hash(hash_token("hash_1")) is None
+
+
+async def test_refresh_token_hash_is_unique(storage):
+    await RefreshTokenRepository.create(_token("user_1", "hash_1"))
+    with pytest.raises(DuplicateKeyError):
+        await RefreshTokenRepository.create(_token("user_2", "hash_1"))
+
+
+async def test_refresh_token_revoke(storage):
+    """revoke는 상태가 바뀐 경우만 True, revoke_all은 새로 폐기한 수"""
+    await RefreshTokenRepository.create(_token("user_1", "hash_1"))
+    await RefreshTokenRepository.create(_token("user_1", "hash_2"))
+    await RefreshTokenRepository.create(_token("user_1", "hash_3"))
+    await RefreshTokenRepository.create(_token("user_2", "hash_4"))
+
+    assert await RefreshTokenRepository.revoke(hash_token("hash_1"))
+    assert not await RefreshTokenRepository.revoke(hash_token("hash_1"))
+    assert not await RefreshTokenRepository.revoke(hash_token("missing"))
+
+    assert await RefreshTokenRepository.revoke_all_for_user("user_1") == 2
+    assert await RefreshTokenRepository.revoke_all_for_user("user_1") == 0
+    assert await RefreshTokenRepository.get_by_token_hash(hash_token("hash_4")) is not None
+
+
+async def test_refresh_token_get_by_id(storage):
+    """id 조회는 폐기된 토큰도 반환"""
+    created = await RefreshTokenRepository.create(_token("user_1", "hash_1"))
+    await RefreshTokenRepository.revoke(hash_token("hash_1"))
+
+    token = await RefreshTokenRepository.get_by_id(created.id)
+    assert token.user_id == "user_1"
+    assert token.revoked
+    assert await RefreshTokenRepository.get_by_id(hash_token("missing")) is None
+
+
+async def test_refresh_token_ttl(storage):
+    """expires_at이 지난 토큰만 삭제 (mongodb는 TTL 모니터와 같은 조건)"""
+    await RefreshTokenRepository.create(_token("user_1", "valid"))
+    expired = await RefreshTokenRepository.create(_token("user_1", "expired", timedelta(seconds=-1)))
+
+    assert await RefreshTokenRepository.purge_expired() == 1
+    assert await RefreshTokenRepository.get_by_token_hash(hash_token("expired")) is None
+    assert await RefreshTokenRepository.get_by_token_hash(hash_token("valid")) is not None
+    assert not await RefreshTokenRepository.delete_by_id(expired.id)
+
+
+async def test_compact_removes_only_revoked(storage):
+    """compact는 폐기된 토큰만 batch 단위로 삭제"""
+    for n in range(5):
+        await RefreshTokenRepository.create(_token("user_1", f"hash_{n}"))
+    await RefreshTokenRepository.create(_token("user_2", "live"))
+    await RefreshTokenRepository.revoke_all_for_user("user_1")
+
+    assert await RefreshTokenRepository.compact(batch_size=2) == 5
+    assert await RefreshTokenRepository.compact(batch_size=2) == 0
+    assert not await RefreshTokenRepository.revoke(hash_token("hash_0"))
+    assert await RefreshTokenRepository.get_by_token_hash(hash_token("live")) is not None
+
+
+async def test_compactor_counts_removed_tokens(monkeypatch):
+    backend = backends.MemoryStorageBackend()
+    monkeypatch.setattr(backends, "storage", backend)
+    await RefreshTokenRepository.create(_token("user_1", "revoked"))
+    await RefreshTokenRepository.create(_token("user_1", "valid"))
+    await RefreshTokenRepository.create(_token("user_1", "expired", timedelta(seconds=-1)))
+    await RefreshTokenRepository.revoke(hash_token("revoked"))
+
+    assert await TokenCompactor(batch_size=10).run_once() == {"expired": 1, "revoked": 1}
+    assert await RefreshTokenRepository.get_by_token_hash(hash_token("valid")) is not None
+
+
+def test_bucket_names_cover_token_lifetime(monkeypatch):
+    """만료 시각 구간 이름 / 끝 시각, 살아 있는 구간 = 최대 수명 / 구간 길이 + 1"""
+    monkeypatch.setattr(backends.settings, "refresh_token_expire_days", 7)
+    store = backends.BucketedMongoRefreshTokenStore(bucket_hours=24)
+
+    name = store.bucket_name(datetime(2026, 3, 5, 17, 30))
+    assert name == "refresh_tokens_2026030500"
+    assert store.bucket_end(name) == datetime(2026, 3, 6)
+
+    live = store.live_buckets(datetime(2026, 3, 5, 17, 30))
+    assert live[0] == name
+    assert live[-1] == "refresh_tokens_2026031200"
+    assert len(live) == 8
+
+
+async def test_bucket_lookup_covers_existing_buckets(monkeypatch):
+    """수명을 줄여도 존재하는 구간은 조회 대상, 끝난 구간은 제외"""
+    monkeypatch.setattr(backends.settings, "refresh_token_expire_days", 1)
+    store = backends.BucketedMongoRefreshTokenStore(bucket_hours=24)
+    existing = ["refresh_tokens_2026030400", "refresh_tokens_2026031100"]
+
+    async def list_buckets():
+        store._existing, store._existing_at = list(existing), time.monotonic()
+        return store._existing
+
+    monkeypatch.setattr(store, "_existing_buckets", list_buckets)
+
+    lookup = await store.lookup_buckets(datetime(2026, 3, 5, 17, 30))
+
+    assert "refresh_tokens_2026030400" not in lookup
+    assert "refresh_tokens_2026031100" in lookup
+    assert set(store.live_buckets(datetime(2026, 3, 5, 17, 30))) <= set(lookup)
+
+
+async def test_bucketed_store_purges_on_insert(monkeypatch):
+    """지난 구간 drop은 compactor 없이 insert 시 purge_interval마다 실행"""
+    store = backends.BucketedMongoRefreshTokenStore(bucket_hours=24, purge_interval=0)
+    purges = []
+
+    class Collection:
+        async def create_indexes(self, models):
+            pass
+
+        async def insert_one(self, doc):
+            pass
+
+    async def purge_expired(now=None):
+        purges.append(now)
+        return 0
+
+    monkeypatch.setattr(store, "purge_expired", purge_expired)
+    monkeypatch.setattr(store, "_collection", lambda name: Collection())
+
+    await store.insert({"user_id": "u", "token_hash": hash_token("t"), "expires_at": datetime.utcnow(), "revoked": False})
+
+    assert len(purges) == 1
+    assert store._existing == [store.bucket_name(datetime.utcnow())]
+
+
+async def test_memory_backend_purges_on_insert():
+    """memory backend는 insert 시 만료된 토큰을 정리 (별도 작업 없이 크기 유지)"""
+    store = backends.MemoryRefreshTokenStore()
+    now = datetime.utcnow()
+    await store.insert({"user_id": "u", "token_hash": "old", "expires_at": now - timedelta(seconds=1), "revoked": False})
+    await store.insert({"user_id": "u", "token_hash": "new", "expires_at": now + timedelta(days=1), "revoked": False})
+
+    assert await store.find_active("old") is None
+    assert await store.find_active("new") is not None
+
+
+async def test_sqlite_backend_persists(tmp_path):
+    """sqlite backend는 다시 연결해도 데이터 유지"""
+    path = str(tmp_path / "authentic.db")
+
+    backend = backends.SQLiteStorageBackend(path)
+    await backend.connect()
+    user_id = await backend.users.insert({
+        **_user().model_dump(),
+        "role": "user",
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow(),
+    })
+    await backend.close()
+
+    backend = backends.SQLiteStorageBackend(path)
+    await backend.connect()
+    assert (await backend.users.find_by_id(user_id))["email"] == "user1@jbnu.ac.kr"
+    await backend.close()
+
+
+def test_mongo_token_documents_use_digest_id():
+    """MongoDB 문서는 token_hash 대신 32바이트 digest를 _id로 저장"""
+    token_hash = hash_token("token")
+    doc = {"user_id": "u", "token_hash": token_hash, "revoked": False}
+
+    stored = backends._token_to_mongo(doc)
+    assert stored["_id"] == bytes.fromhex(token_hash)
+    assert "token_hash" not in stored
+
+    restored = backends._token_from_mongo(stored)
+    assert restored["_id"] == restored["token_hash"] == token_hash
+
+    assert backends.token_key("not-hex") is None
+    with pytest.raises(ValueError):
+        backends._token_to_mongo({**doc, "token_hash": "abcd"})
+
+
+async def test_sqlite_backend_requires_returning_support(tmp_path, monkeypatch):
+    """UPDATE ... RETURNING이 없는 SQLite(< 3.35)는 연결 시 거부"""
+    monkeypatch.setattr(backends.sqlite3, "sqlite_version_info", (3, 31, 1))
+    backend = backends.SQLiteStorageBackend(str(tmp_path / "authentic.db"))
+    with pytest.raises(RuntimeError, match="3.35"):
+        await backend.connect()
+
+
+def test_mongo_legacy_token_documents_keep_token_hash_id():
+    """이전 형식 문서({_id: ObjectId, token_hash})는 token_hash를 id로 반환"""
+    token_hash = hash_token("token")
+    restored = backends._token_from_mongo({"_id": ObjectId(), "user_id": "u", "token_hash": token_hash})
+    assert restored["_id"] == restored["token_hash"] == token_hash
+
+
+@pytest.mark.parametrize("refresh_token_storage", ["single", "bucketed"])
+async def test_mongo_legacy_tokens_usable_before_migration(refresh_token_storage, monkeypatch):
+    """마이그레이션 전 이전 형식 문서도 조회 / consume / 폐기 가능"""
+    backend, client, db = await _mongodb_backend(refresh_token_storage)
+    monkeypatch.setattr(database, "db", db)
+    monkeypatch.setattr(backends, "storage", backend)
+    token_hash = hash_token("legacy")
+    expires_at = datetime.utcnow() + timedelta(days=1)
+    name = "refresh_tokens"
+    if refresh_token_storage == "bucketed":
+        name = backend.refresh_tokens.bucket_name(expires_at)
+    await db[name].insert_one({
+        "_id": ObjectId(),
+        "user_id": "u",
+        "token_hash": token_hash,
+        "expires_at": expires_at,
+        "created_at": datetime.utcnow(),
+        "revoked": False,
+    })
+    try:
+        assert (await RefreshTokenRepository.get_by_token_hash(token_hash)).id == token_hash
+        assert (await RefreshTokenRepository.consume(token_hash)).user_id == "u"
+        assert await RefreshTokenRepository.consume(token_hash) is None
+        assert await backend.refresh_tokens.delete(token_hash)
+    finally:
+        await client.drop_database(db.name)
+        client.close()
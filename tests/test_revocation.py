@@ -0,0 +1,136 @@
+import time
+from datetime import datetime
+
+import pytest
+
+from app.core.events import REVOCATION, event_feed
+from app.core.exceptions import InvalidCredentialsException
+from app.core.jwt import create_access_token, decode_access_token
+from app.core.revocation import BloomFilter, RevocationList, revocation_list
+from app.core.token_cache import token_cache, verify_access_token
+from app.models.revocation import RevokedTokenInDB
+from app.repositories.revocation import RevokedTokenRepository
+
+
+@pytest.fixture
+def revoked_store(monkeypatch):
+    """DB 대신 dict에 폐기 항목 저장. is_revoked 호출 수 기록"""
+    store = {}
+    calls = {"is_revoked": 0}
+
+    async def revoke(jti, user_id, expires_at):
+        store.setdefault(jti, RevokedTokenInDB(
+            _id=jti, user_id=user_id, expires_at=expires_at, revoked_at=datetime.utcnow()
+        ))
+        return store[jti]
+
+    async def is_revoked(jti):
+        calls["is_revoked"] += 1
+        return jti in store
+
+    async def list_since(since=None):
+        entries = sorted(store.values(), key=lambda e: e.revoked_at)
+        return [e for e in entries if since is None or e.revoked_at >= since]
+
+    monkeypatch.setattr(RevokedTokenRepository, "revoke", revoke)
+    monkeypatch.setattr(RevokedTokenRepository, "is_revoked", is_revoked)
+    monkeypatch.setattr(RevokedTokenRepository, "list_since", list_since)
+    return store, calls
+
+
+def test_bloom_filter_error_rate():
+    """추가한 키는 항상 양성, 추가하지 않은 키의 오탐률은 설정값 수준"""
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"revoked-{i}")
+
+    assert all(f"revoked-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 10000 * 0.03
+
+
+async def test_negative_path_skips_store(revoked_store):
+    """filter 음성이면 저장소를 조회하지 않음"""
+    _, calls = revoked_store
+    revocations = RevocationList()
+    await revocations.revoke({"jti": "revoked", "sub": "u", "exp": time.time() + 60})
+
+    assert await revocations.is_revoked({"jti": "revoked", "exp": time.time() + 60})
+    assert not await revocations.is_revoked({"jti": "other", "exp": time.time() + 60})
+    assert not await revocations.is_revoked({"sub": "legacy token without jti", "exp": time.time() + 60})
+    assert calls["is_revoked"] == 1
+
+
+async def test_sync_picks_up_other_nodes(revoked_store):
+    """다른 노드에서 저장소에 기록한 폐기도 sync 후 반영"""
+    exp = time.time() + 60
+    node_a, node_b = RevocationList(), RevocationList()
+    await node_b.sync()
+
+    await node_a.revoke({"jti": "from-a", "sub": "u", "exp": exp})
+    assert not node_b.might_be_revoked("from-a", exp)
+
+    assert await node_b.sync() == 1
+    assert node_b.might_be_revoked("from-a", exp)
+
+
+def test_expired_buckets_are_dropped():
+    """exp 구간이 모두 지난 filter는 제거"""
+    revocations = RevocationList(bucket_seconds=60)
+    revocations.add("old", time.time() - 120)
+    revocations.add("live", time.time() + 120)
+
+    revocations.expire()
+
+    assert revocations.stats()["filters"] == 1
+    assert revocations.might_be_revoked("live", time.time() + 120)
+
+
+async def test_revoked_token_rejected_even_when_cached(revoked_store):
+    """캐시된 토큰도 폐기 후에는 거부"""
+    token = create_access_token(user_id="u", email="u@jbnu.ac.kr", role="user")
+    payload = await verify_access_token(token)
+    assert payload["jti"]
+
+    await revocation_list.revoke(payload)
+
+    with pytest.raises(InvalidCredentialsException):
+        await verify_access_token(token)
+    assert token_cache.get(token) is None
+    # 서명 검증 자체는 그대로
+    assert decode_access_token(token)["jti"] == payload["jti"]
+
+
+async def test_revocations_published_once(revoked_store):
+    """로컬 폐기와 다른 노드 폐기 모두 revocation 이벤트 1회씩 (겹치는 sync 구간 중복 없음)"""
+    exp = time.time() + 60
+    node_a, node_b = RevocationList(), RevocationList()
+    await node_b.sync()
+    cursor = event_feed.last_id
+
+    await node_a.revoke({"jti": "from-a", "sub": "u", "exp": exp})
+    await node_b.sync()
+    await node_b.sync()
+
+    # 두 노드가 같은 피드를 공유하므로 A의 발행 1회 + B의 sync 발행 1회
+    events, _ = event_feed.since(cursor)
+    assert [(e.type, e.data["jti"]) for e in events] == [(REVOCATION, "from-a"), (REVOCATION, "from-a")]
+
+
+async def test_local_revocation_list_without_store(monkeypatch):
+    """persistent=False(memory / sqlite backend)면 저장소 없이 프로세스 내 목록으로 판정"""
+    async def fail(*args, **kwargs):
+        raise AssertionError("store must not be used")
+
+    monkeypatch.setattr(RevokedTokenRepository, "revoke", fail)
+    monkeypatch.setattr(RevokedTokenRepository, "is_revoked", fail)
+    revocations = RevocationList(persistent=False)
+    payload = {"jti": "j1", "sub": "u", "exp": time.time() + 60}
+
+    assert not await revocations.is_revoked(payload)
+    await revocations.revoke(payload)
+    assert await revocations.is_revoked(payload)
+    assert not await revocations.is_revoked({**payload, "jti": "j2"})
+
+    revocations.start()
+    assert revocations._task is None
@@ -0,0 +1,60 @@
+import asyncio
+
+from app.core import signing
+from app.core.jwt import build_access_payload, decode_access_token
+from app.core.signing import TokenSigner
+
+
+async def test_token_signer_signs_off_loop():
+    """스레드 풀에서 서명한 토큰도 정상 검증"""
+    signer = TokenSigner(max_workers=1)
+    token = await signer.sign(build_access_payload("u1", "u1@jbnu.ac.kr", "user"))
+
+    assert decode_access_token(token)["sub"] == "u1"
+    signer.shutdown()
+
+
+async def test_token_signer_micro_batches(monkeypatch):
+    """동시 요청은 max_batch 단위로 묶여 executor 작업 수가 줄어듦"""
+    batch_sizes = []
+    original = signing._sign_batch
+
+    def counting_sign_batch(payloads):
+        batch_sizes.append(len(payloads))
+        return original(payloads)
+
+    monkeypatch.setattr(signing, "_sign_batch", counting_sign_batch)
+    signer = TokenSigner(max_workers=2, max_batch=8)
+
+    tokens = await asyncio.gather(*[
+        signer.sign(build_access_payload(f"u{i}", "u@jbnu.ac.kr", "user"))
+        for i in range(20)
+    ])
+
+    assert [decode_access_token(t)["sub"] for t in tokens] == [f"u{i}" for i in range(20)]
+    assert sum(batch_sizes) == 20
+    assert max(batch_sizes) <= 8
+    assert len(batch_sizes) < 20
+    signer.shutdown()
+
+
+async def test_token_signer_splits_batch_across_workers(monkeypatch):
+    """한 번에 모인 요청은 worker 수만큼 나눠 병렬로 서명"""
+    batch_sizes = []
+    original = signing._sign_batch
+
+    def counting_sign_batch(payloads):
+        batch_sizes.append(len(payloads))
+        return original(payloads)
+
+    monkeypatch.setattr(signing, "_sign_batch", counting_sign_batch)
+    signer = TokenSigner(max_workers=3, max_batch=32)
+
+    tokens = await asyncio.gather(*[
+        signer.sign(build_access_payload(f"u{i}", "u@jbnu.ac.kr", "user"))
+        for i in range(8)
+    ])
+
+    assert [decode_access_token(t)["sub"] for t in tokens] == [f"u{i}" for i in range(8)]
+    assert sorted(batch_sizes) == [2, 3, 3]
+    signer.shutdown()
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+from app.core.startup import StartupProfile, parse_importtime, summarize_imports
+
+
+def test_profile_records_steps_in_order():
+    """단계별 소요 시간을 기록 순서대로 보관"""
+    profile = StartupProfile()
+    with profile.step("keys"):
+        pass
+    with profile.step("connect_db"):
+        pass
+
+    assert list(profile.steps) == ["keys", "connect_db"]
+    assert profile.total_ms >= 0
+    assert "connect_db" in profile.report()
+
+
+def test_parse_importtime_groups_by_package():
+    """-X importtime 출력을 패키지 / app 모듈별 self 시간으로 집계"""
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:      1000 |       1000 |   pydantic.fields",
+        "import time:      2000 |       3000 | pydantic",
+        "import time:       500 |        500 |   app.config",
+        "import time:       300 |        800 | app",
+    ])
+
+    rows = parse_importtime(output)
+    assert rows[0] == ("pydantic.fields", 1000, 1000)
+
+    summary = summarize_imports(rows)
+    assert summary["packages"] == {"pydantic": 3.0, "app": 0.8}
+    assert summary["app"] == {"app.config": 0.5, "app": 0.3}
+
+
+def test_app_import_does_not_load_authlib():
+    """authlib은 첫 OAuth 요청(또는 메타데이터 prefetch) 전까지 import하지 않음"""
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, app.main; print('authlib' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        env=os.environ,
+    )
+    assert result.stdout.strip() == "False", result.stderr
@@ -0,0 +1,58 @@
+import time
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.dependencies import get_current_user
+from app.core.jwt import create_access_token
+from app.core.token_cache import TokenCache, token_cache
+
+
+def test_token_cache_hit_and_miss():
+    """저장 전 miss, 저장 후 hit"""
+    cache = TokenCache(max_size=10)
+    payload = {"sub": "user", "exp": time.time() + 60}
+
+    assert cache.get("token") is None
+    cache.put("token", payload)
+    assert cache.get("token") == payload
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_token_cache_expires_at_token_exp():
+    """토큰 exp가 지나면 캐시에서도 만료"""
+    cache = TokenCache(max_size=10, ttl_seconds=300)
+    cache.put("token", {"sub": "user", "exp": time.time() - 1})
+
+    assert cache.get("token") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_token_cache_evicts_least_recently_used():
+    """최대 크기 초과 시 LRU 엔트리 제거"""
+    cache = TokenCache(max_size=2)
+    exp = time.time() + 60
+    cache.put("a", {"exp": exp})
+    cache.put("b", {"exp": exp})
+    cache.get("a")
+    cache.put("c", {"exp": exp})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+async def test_get_current_user_uses_cache():
+    """get_current_user는 두 번째 요청부터 캐시 사용"""
+    token = create_access_token(user_id="cached_user", email="c@jbnu.ac.kr", role="user")
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    token_cache.clear()
+    hits = token_cache.hits
+
+    first = await get_current_user(credentials)
+    second = await get_current_user(credentials)
+
+    assert first["sub"] == second["sub"] == "cached_user"
+    assert token_cache.hits == hits + 1
@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from pymongo.errors import OperationFailure
+
+from app.core import user_cache as user_cache_module
+from app.core.cache import TTLCache
+from app.core.metrics import REPOSITORY_LATENCY
+from app.core.user_cache import user_cache, watch_user_changes
+from app.repositories.backends import MongoUserStore
+from app.repositories.user import UserRepository
+
+USER_ID = str(ObjectId())
+
+
+class FakeUsersCollection:
+    """find_one / update_one 호출 수를 세는 users 컬렉션 대역"""
+
+    def __init__(self):
+        now = datetime.utcnow()
+        self.doc = {
+            "_id": ObjectId(USER_ID),
+            "email": "test@jbnu.ac.kr",
+            "name": "Before",
+            "google_id": "google_1",
+            "role": "user",
+            "created_at": now,
+            "updated_at": now,
+        }
+        self.find_calls = 0
+
+    async def find_one(self, query):
+        self.find_calls += 1
+        return dict(self.doc) if query.get("_id") == self.doc["_id"] else None
+
+    async def update_one(self, query, update):
+        self.doc.update(update["$set"])
+
+
+@pytest.fixture
+def users(monkeypatch):
+    collection = FakeUsersCollection()
+    monkeypatch.setattr(MongoUserStore, "_collection", staticmethod(lambda: collection))
+    user_cache.clear()
+    yield collection
+    user_cache.clear()
+
+
+def test_ttl_cache_hit_rate():
+    """hit rate = hits / (hits + misses)"""
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    cache.get("a")
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("a")
+
+    assert cache.stats()["hit_rate"] == pytest.approx(2 / 3)
+
+
+async def test_get_by_id_cached_reads_through(users):
+    """두 번째 조회부터 DB를 거치지 않음"""
+    first = await UserRepository.get_by_id_cached(USER_ID)
+    second = await UserRepository.get_by_id_cached(USER_ID)
+
+    assert first.name == second.name == "Before"
+    assert users.find_calls == 1
+
+
+async def test_cache_miss_recorded_once(users):
+    """miss는 get_by_id 지연 시간으로 1회만 기록, hit는 기록하지 않음"""
+    child = REPOSITORY_LATENCY.labels("UserRepository", "get_by_id")
+    before = child.count
+
+    await UserRepository.get_by_id_cached(USER_ID)
+    await UserRepository.get_by_id_cached(USER_ID)
+
+    assert child.count == before + 1
+    assert ("UserRepository", "get_by_id_cached") not in REPOSITORY_LATENCY._children
+
+
+async def test_watch_stops_when_change_streams_unsupported(monkeypatch):
+    """standalone mongod(40573)면 재시도 / 캐시 비우기 없이 종료"""
+    class Users:
+        def watch(self):
+            raise OperationFailure("The $changeStream stage is only supported on replica sets", code=40573)
+
+    class Database:
+        users = Users()
+
+    monkeypatch.setattr(user_cache_module, "get_db", lambda: Database())
+    user_cache.put("u", "cached")
+
+    await asyncio.wait_for(watch_user_changes(retry_seconds=0), timeout=1)
+
+    assert user_cache.get("u") == "cached"
+    user_cache.clear()
+
+
+async def test_update_invalidates_cache(users):
+    """update 후 캐시에 새 값 반영"""
+    await UserRepository.get_by_id_cached(USER_ID)
+    await UserRepository.update(USER_ID, name="After")
+
+    user = await UserRepository.get_by_id_cached(USER_ID)
+
+    assert user.name == "After"